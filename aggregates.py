@@ -0,0 +1,264 @@
+from bisect import bisect_left, insort
+from datetime import timedelta
+import numpy as np
+import pandas as pd
+
+GRANULARITY_LABELS = {"D": "Day", "W": "Week", "M": "Month"}
+
+# Outcomes by the furthest funnel stage an application reached (index in status_history.FUNNEL_STAGES),
+# so an application that was interviewed and then rejected still counts as interviewed
+OUTCOME_STAGES = {"interview": 1, "offer": 2}
+
+
+def to_date(value):
+    """Convert a stored date value (Timestamp, 'YYYY-MM-DD' string or '') to a date, or None."""
+    if value is None or value == "":
+        return None
+    value = pd.to_datetime(value, errors='coerce')
+    if pd.isna(value):
+        return None
+    return value.date()
+
+
+def bucket_start(day, granularity):
+    if granularity == "W":
+        return day - timedelta(days=day.weekday())
+    if granularity == "M":
+        return day.replace(day=1)
+    return day
+
+
+def bucket_dates(dates, granularity):
+    """Vectorized bucket_start for a Series of normalized Timestamps."""
+    if granularity == "W":
+        return dates - pd.to_timedelta(dates.dt.weekday, unit='D')
+    if granularity == "M":
+        return dates - pd.to_timedelta(dates.dt.day - 1, unit='D')
+    return dates
+
+
+class StatusRollup:
+    """Application counts per (date bucket, Status) at day, week and month granularity.
+
+    Counts are built once from the data and then kept current with add()/remove(),
+    so the time-series charts cost O(buckets) instead of O(rows).
+    """
+
+    def __init__(self):
+        self.counts = {granularity: {} for granularity in GRANULARITY_LABELS}
+
+    def build(self, data):
+        self.counts = {granularity: {} for granularity in GRANULARITY_LABELS}
+        if data.empty or 'Application Date' not in data.columns:
+            return
+        dates = pd.to_datetime(data['Application Date'], errors='coerce').dt.normalize()
+        statuses = data['Status'].fillna("").astype(str) if 'Status' in data.columns else pd.Series("", index=data.index)
+        valid = dates.notna()
+        dates, statuses = dates[valid], statuses[valid]
+
+        for granularity in GRANULARITY_LABELS:
+            buckets = bucket_dates(dates, granularity).dt.date
+            grouped = pd.DataFrame({'bucket': buckets, 'status': statuses}).groupby(['bucket', 'status']).size()
+            table = self.counts[granularity]
+            for (bucket, status), count in grouped.items():
+                table.setdefault(bucket, {})[status] = int(count)
+
+    def add(self, date_value, status, count=1):
+        day = to_date(date_value)
+        if day is None:
+            return
+        status = "" if status is None or pd.isna(status) else str(status)
+        for granularity, table in self.counts.items():
+            bucket = table.setdefault(bucket_start(day, granularity), {})
+            bucket[status] = bucket.get(status, 0) + count
+            if bucket[status] <= 0:
+                del bucket[status]
+                if not bucket:
+                    del table[bucket_start(day, granularity)]
+
+    def remove(self, date_value, status):
+        self.add(date_value, status, count=-1)
+
+    def span(self):
+        days = self.counts["D"]
+        if not days:
+            return None, None
+        return min(days), max(days)
+
+    def choose_granularity(self, start=None, end=None, max_buckets=120):
+        """Pick the finest granularity that keeps the visible span under max_buckets points."""
+        if start is None or end is None:
+            start, end = self.span()
+        if start is None:
+            return "D"
+        span_days = (end - start).days + 1
+        if span_days <= max_buckets:
+            return "D"
+        if span_days / 7 <= max_buckets:
+            return "W"
+        return "M"
+
+    def frame(self, granularity, start=None, end=None):
+        """Counts as a DataFrame indexed by bucket start date with one column per Status."""
+        table = self.counts[granularity]
+        buckets = sorted(bucket for bucket in table
+                         if (start is None or bucket >= bucket_start(start, granularity)) and (end is None or bucket <= end))
+        frame = pd.DataFrame([table[bucket] for bucket in buckets], index=pd.to_datetime(buckets))
+        return frame.fillna(0).astype(int).sort_index(axis=1)
+
+
+class TopKCounter:
+    """Exact value counts that can answer "top K" without sorting every distinct value.
+
+    Values are grouped into buckets by count and the distinct counts are kept in a
+    sorted list. add/remove find a count's place with bisect in O(log C) (C = number
+    of distinct counts); creating or emptying a count inserts into or deletes from
+    the list, O(C) in the worst case. C is at most sqrt(2n) for n rows, since the
+    distinct counts sum to at most n, so that shift is small. top(k) walks the
+    highest buckets in O(k).
+    """
+
+    def __init__(self):
+        self.counts = {}
+        self.buckets = {}
+        self.levels = []
+
+    def build(self, values):
+        self.build_counts(values.value_counts())
+
+    def build_counts(self, counts):
+        """Build from precomputed counts (a Series of count per value)."""
+        self.counts = {}
+        self.buckets = {}
+        self.levels = []
+        for key, count in counts.items():
+            if count > 0 and not (not isinstance(key, str) and pd.isna(key)):
+                self.move(key, 0, int(count))
+
+    def move(self, key, old_count, new_count):
+        if old_count:
+            bucket = self.buckets[old_count]
+            del bucket[key]
+            if not bucket:
+                del self.buckets[old_count]
+                del self.levels[bisect_left(self.levels, old_count)]
+        if new_count > 0:
+            if new_count not in self.buckets:
+                self.buckets[new_count] = {}
+                insort(self.levels, new_count)
+            self.buckets[new_count][key] = None
+            self.counts[key] = new_count
+        else:
+            self.counts.pop(key, None)
+
+    def add(self, key, delta=1):
+        if key is None or (not isinstance(key, str) and pd.isna(key)):
+            return
+        old_count = self.counts.get(key, 0)
+        self.move(key, old_count, max(old_count + delta, 0))
+
+    def remove(self, key):
+        self.add(key, -1)
+
+    def top(self, k=None):
+        """The k most frequent values (all with k=None) as a Series, like value_counts().head(k)."""
+        keys, counts = [], []
+        for count in reversed(self.levels):
+            for key in self.buckets[count]:
+                if len(keys) == k:
+                    return pd.Series(counts, index=keys, dtype='int64')
+                keys.append(key)
+                counts.append(count)
+        return pd.Series(counts, index=keys, dtype='int64')
+
+
+def wilson_interval(successes, trials, z=1.96):
+    """Wilson score interval for success rates (95% by default), vectorized.
+
+    Unlike the plain rate +/- z * standard error it stays within [0, 1] and gives a
+    sensible range for small counts, e.g. 0 of 3 is 0% to 56% rather than exactly 0%.
+    """
+    successes = np.asarray(successes, dtype=float)
+    trials = np.asarray(trials, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rate = successes / trials
+        denominator = 1 + z ** 2 / trials
+        center = (rate + z ** 2 / (2 * trials)) / denominator
+        margin = z * np.sqrt(rate * (1 - rate) / trials + z ** 2 / (4 * trials ** 2)) / denominator
+    # Rounding can put a bound a hair past the rate itself (e.g. at 0 of n)
+    return np.clip(np.minimum(center - margin, rate), 0, 1), np.clip(np.maximum(center + margin, rate), 0, 1)
+
+
+class ContingencyTable:
+    """Application counts per (value of column, furthest stage reached), e.g. Resume Version x stage.
+
+    Built once with a groupby and then kept current with set()/discard() per Application ID
+    as rows or their status history change, so outcome rates per value never rescan the data.
+    """
+
+    def __init__(self, column):
+        self.column = column
+        self.counts = {}
+        self.entries = {}
+
+    @staticmethod
+    def clean(value):
+        return "" if value is None or (not isinstance(value, str) and pd.isna(value)) else str(value)
+
+    def build(self, data, stages):
+        """stages holds the furthest stage of each row's application, in row order."""
+        self.counts, self.entries = {}, {}
+        if self.column not in data.columns or 'Application ID' not in data.columns:
+            return
+        frame = pd.DataFrame({'app_id': pd.to_numeric(data['Application ID'], errors='coerce').to_numpy(),
+                              'value': data[self.column].fillna('').astype(str).to_numpy(),
+                              'stage': np.asarray(stages, dtype=int)})
+        frame = frame.dropna(subset=['app_id']).drop_duplicates('app_id', keep='last')
+        for (value, stage), count in frame.groupby(['value', 'stage']).size().items():
+            self.counts.setdefault(value, {})[int(stage)] = int(count)
+        self.entries = dict(zip(frame['app_id'].astype(int).tolist(),
+                                zip(frame['value'].tolist(), frame['stage'].tolist())))
+
+    def add(self, value, stage, count=1):
+        stages = self.counts.setdefault(value, {})
+        stages[stage] = stages.get(stage, 0) + count
+        if stages[stage] <= 0:
+            del stages[stage]
+            if not stages:
+                del self.counts[value]
+
+    def set(self, app_id, value, stage):
+        """Count an application under value at stage, moving it from wherever it was counted before."""
+        self.discard(app_id)
+        app_id, value = int(app_id), self.clean(value)
+        self.entries[app_id] = (value, stage)
+        self.add(value, stage)
+
+    def discard(self, app_id):
+        entry = self.entries.pop(int(app_id), None)
+        if entry is not None:
+            self.add(*entry, count=-1)
+
+    def frame(self):
+        """Counts as a DataFrame with one row per value and one column per stage."""
+        frame = pd.DataFrame.from_dict(self.counts, orient='index')
+        return frame.fillna(0).astype(int).sort_index(axis=1)
+
+    def totals(self):
+        """Applications per value, most used first, like value_counts()."""
+        totals = pd.Series({value: sum(stages.values()) for value, stages in self.counts.items()}, dtype='int64')
+        return totals.sort_values(ascending=False, kind='stable')
+
+    def rates(self, z=1.96):
+        """Per value: applications and, for each outcome in OUTCOME_STAGES, its count, rate and
+        Wilson interval (low, high), most used values first."""
+        table = self.frame()
+        result = pd.DataFrame({'applications': table.sum(axis=1)}, index=table.index)
+        for outcome, stage in OUTCOME_STAGES.items():
+            reached = table.loc[:, table.columns >= stage].sum(axis=1)
+            low, high = wilson_interval(reached, result['applications'], z)
+            result[f'{outcome}s'] = reached
+            result[f'{outcome}_rate'] = reached / result['applications']
+            result[f'{outcome}_low'] = low
+            result[f'{outcome}_high'] = high
+        return result.sort_values('applications', ascending=False, kind='stable')
@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+from aggregates import OUTCOME_STAGES, to_date
+
+# Columns conversion rates are broken down by
+DIMENSIONS = ["Application Method", "Resume Version", "Term"]
+
+
+def furthest_stages(data, stages_reached):
+    """Furthest funnel stage (index in FUNNEL_STAGES) of each row's application, in row order.
+
+    That is the stage from the status history (stages_reached, by app_id), raised to the
+    interview stage when the row has an interview date, even if the status moved on since.
+    Interview dates before the application (e.g. a 2000-01-01 placeholder) are ignored.
+    """
+    app_ids = pd.to_numeric(data['Application ID'], errors='coerce') if 'Application ID' in data.columns \
+        else pd.Series(np.nan, index=data.index)
+    stage = app_ids.map(stages_reached).fillna(0).to_numpy(dtype=int)
+    days = interview_days(data)
+    return np.where((days >= 0).to_numpy(), np.maximum(stage, OUTCOME_STAGES["interview"]), stage)
+
+
+def furthest_stage(row, stage_reached):
+    """furthest_stages for a single row (a dict), given its application's stage in the history."""
+    applied, interview = to_date(row.get('Application Date')), to_date(row.get('Interview Date'))
+    if applied is not None and interview is not None and interview >= applied:
+        return max(stage_reached, OUTCOME_STAGES["interview"])
+    return stage_reached
+
+
+def interview_days(data):
+    """Days from application to interview per row, NaN where either date is missing."""
+    applied = pd.to_datetime(data['Application Date'], errors='coerce') if 'Application Date' in data.columns \
+        else pd.Series(pd.NaT, index=data.index)
+    interview = pd.to_datetime(data['Interview Date'], errors='coerce') if 'Interview Date' in data.columns \
+        else pd.Series(pd.NaT, index=data.index)
+    return (interview - applied).dt.days
+
+
+class ConversionAnalytics:
+    """Funnel conversion by DIMENSIONS and days from application to interview.
+
+    The rows are reduced once to typed columns (categorical dimensions, datetime dates,
+    the furthest stage reached as an int), stacked into one long frame and aggregated
+    with a single groupby over (dimension, value). Results are cached until the data
+    version or the status history changes.
+    """
+
+    def __init__(self, dimensions=DIMENSIONS):
+        self.dimensions = dimensions
+        self.key = None
+        self.cached = None
+
+    def typed_frame(self, data, stages_reached):
+        """One row per application: dimensions as categories, stage flags and days to interview."""
+        stage = furthest_stages(data, stages_reached)
+        days = interview_days(data)
+        frame = pd.DataFrame({
+            "interviewed": stage >= OUTCOME_STAGES["interview"],
+            "offered": stage >= OUTCOME_STAGES["offer"],
+            "days_to_interview": days.where(days >= 0),
+        }, index=data.index)
+        for col in self.dimensions:
+            values = data[col] if col in data.columns else pd.Series("", index=data.index)
+            frame[col] = values.fillna("").astype(str).replace("", "None").astype("category")
+        return frame
+
+    def compute(self, data, stages_reached):
+        frame = self.typed_frame(data, stages_reached)
+        long = frame.melt(id_vars=["interviewed", "offered", "days_to_interview"], value_vars=self.dimensions,
+                          var_name="dimension", value_name="value")
+        summary = long.groupby(["dimension", "value"], observed=True, sort=False).agg(
+            applications=("interviewed", "size"),
+            interviews=("interviewed", "sum"),
+            offers=("offered", "sum"),
+            median_days_to_interview=("days_to_interview", "median"),
+        )
+        summary["interview_rate"] = summary["interviews"] / summary["applications"]
+        summary["offer_rate"] = summary["offers"] / summary["applications"]
+        summary = summary.sort_values(["dimension", "applications"], ascending=[True, False], kind="stable")
+        return {"conversion": summary,
+                "days_to_interview": frame[["days_to_interview", *self.dimensions]].dropna(subset=["days_to_interview"])}
+
+    def results(self, data, version, status_history):
+        key = (version, status_history.fingerprint())
+        if self.cached is None or key != self.key:
+            app_ids = data['Application ID'] if 'Application ID' in data.columns else None
+            self.cached = self.compute(data, status_history.stages_reached(app_ids))
+            self.key = key
+        return self.cached
+
+    def conversion(self, data, version, status_history, dimension=None):
+        """Applications, interviews, offers and their rates per value, for one dimension or all."""
+        summary = self.results(data, version, status_history)["conversion"]
+        return summary.loc[dimension] if dimension is not None else summary
+
+    def days_to_interview(self, data, version, status_history):
+        """Days from application to interview, per application that has both dates, with its dimensions."""
+        return self.results(data, version, status_history)["days_to_interview"]
@@ -0,0 +1,653 @@
+import os
+import sys
+import hashlib
+import inspect
+import importlib
+import textwrap
+from datetime import datetime
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+import matplotlib
+import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+from matplotlib.figure import Figure
+from aggregates import StatusRollup, TopKCounter, ContingencyTable, GRANULARITY_LABELS
+from undo import same_value
+from dedup import normalize_column, normalize_company
+from locations import region_key, city_key, region_label
+from analytics import DIMENSIONS, furthest_stages, furthest_stage
+
+# Top-K counters: name -> (column, key). Keys normalize the values, so e.g. "Google",
+# "Google LLC" and "google" are one company, and "Boston MA" and "Boston, MA" one city.
+COUNTERS = {
+    "Status": ("Status", None),
+    "Term": ("Term", None),
+    "Application Method": ("Application Method", None),
+    "Industry": ("Industry", None),
+    "Company Name": ("Company Name", normalize_company),
+    "Position": ("Position", None),
+    "Location Region": ("Location", region_key),
+    "Location City": ("Location", city_key),
+}
+
+# Columns kept as column x furthest stage contingency tables, for outcome rates per document version
+CONTINGENCY_COLUMNS = ["Resume Version", "Cover Letter Version"]
+
+# Columns each dashboard chart reads, so an edit only redraws the charts it affects.
+# "Status History" stands for the status transition log rather than a column.
+CHART_COLUMNS = {
+    "status_pie": ["Status"],
+    "company_bar": ["Company Name"],
+    "timeline_line": ["Application Date"],
+    "job_title_bar": ["Position"],
+    "term_bar": ["Term"],
+    "application_method_bar": ["Application Method"],
+    "resume_cover_letter_bar": ["Resume Version", "Cover Letter Version"],
+    "version_effectiveness": ["Resume Version", "Cover Letter Version", "Application ID", "Status History",
+                              "Application Date", "Interview Date"],
+    "status_stacked_area": ["Application Date", "Application ID", "Status History"],
+    "status_funnel": ["Application ID", "Status History"],
+    "response_time_hist": ["Application ID", "Status History"],
+    "salary_hist": ["Salary Range"],
+    "location_bar": ["Location"],
+    "conversion_bar": ["Application ID", "Status History", "Application Date", "Interview Date"] + DIMENSIONS,
+    "time_to_interview_hist": ["Application Date", "Interview Date", "Application Method"],
+    "industry_pie": ["Industry"],
+}
+
+# Modules besides this one whose code decides what the charts look like
+CHART_MODULES = ["aggregates", "analytics", "salary", "locations", "status_history", "dedup"]
+
+
+@lru_cache(maxsize=None)
+def chart_code_version():
+    """Hash of the source the charts are drawn from (this module, CHART_MODULES) and the
+    matplotlib version. It is part of every chart's cache key, so an edit to a builder, to a
+    helper it calls or to a constant it reads never paints a stale image from the disk cache.
+    """
+    digest = hashlib.sha1(matplotlib.__version__.encode())
+    for module in [sys.modules[__name__]] + [importlib.import_module(name) for name in CHART_MODULES]:
+        try:
+            digest.update(inspect.getsource(module).encode())
+        except (OSError, TypeError):
+            # No sources, e.g. a PyInstaller build: a new build is a new executable
+            digest.update(f"{module.__name__}:{os.path.getmtime(sys.executable)}".encode())
+    return digest.hexdigest()[:12]
+
+
+def subplots(*args, figsize=None, **kwargs):
+    """plt.subplots for a bare Figure: no pyplot state and no GUI canvas, so the caller
+    attaches its own (Agg for images and reports)."""
+    fig = Figure(figsize=figsize)
+    return fig, fig.subplots(*args, **kwargs)
+
+
+class DashboardCharts:
+    """The data side of the dashboard: the aggregates the charts read, kept in step with the
+    store, and the chart builders themselves, which return a bare Figure. None of it touches
+    a widget, so the window and the headless report (report.py) both mix it in and draw
+    exactly the same charts.
+
+    Expects store, status_history, date_index, duplicate_index, analytics and
+    column_fingerprints to be set by the class that mixes it in.
+    """
+
+    @property
+    def data(self):
+        return self.store.data
+
+    @property
+    def data_version(self):
+        return self.store.version
+
+    def rebuild_aggregates(self):
+        # Full rebuild, used after loading or replacing the data
+        self.column_fingerprints = {}
+        self.status_rollup = StatusRollup()
+        self.status_rollup.build(self.data)
+        self.status_history.seed(self.data)
+        self.date_index.build(self.data)
+        self.duplicate_index.build(self.data)
+        # One value_counts per counted column, shared by the counters that read it (a process
+        # pool lost to sending the rows to the workers). Keyed counters sum the counts of the
+        # values that share a key.
+        raw_counts = {col: self.data[col].value_counts(dropna=False)
+                      for col in {col for col, _ in COUNTERS.values()} if col in self.data.columns}
+        self.top_counters = {}
+        for name, (col, key) in COUNTERS.items():
+            self.top_counters[name] = TopKCounter()
+            if col in raw_counts:
+                counts = raw_counts[col]
+                if key is not None:
+                    counts = counts.groupby(normalize_column(counts.index.to_series(), key).to_numpy()).sum()
+                self.top_counters[name].build_counts(counts)
+        # Furthest stage reached per row, by the same rule as the conversion charts
+        app_ids = self.data['Application ID'] if 'Application ID' in self.data.columns else None
+        stages = furthest_stages(self.data, self.status_history.stages_reached(app_ids))
+        self.contingency_tables = {}
+        for col in CONTINGENCY_COLUMNS:
+            self.contingency_tables[col] = ContingencyTable(col)
+            self.contingency_tables[col].build(self.data, stages)
+
+    def update_aggregates(self, old_row, new_row, changed):
+        # Incremental update for a single added (old_row=None), edited or deleted (new_row=None) entry.
+        # Aggregates over columns that did not change are left alone.
+        for col in changed:
+            self.column_fingerprints.pop(col, None)
+        self.date_index.update(old_row, new_row, changed)
+        self.duplicate_index.update(old_row, new_row, changed)
+        if "Status" in changed:
+            self.column_fingerprints.pop("Status History", None)
+
+        if changed & {'Application Date', 'Status'}:
+            if old_row is not None:
+                self.status_rollup.remove(old_row.get('Application Date'), old_row.get('Status'))
+            if new_row is not None:
+                self.status_rollup.add(new_row.get('Application Date'), new_row.get('Status'))
+        for name, counter in self.top_counters.items():
+            col, key = COUNTERS[name]
+            if col in changed:
+                key = key or (lambda value: value)
+                if old_row is not None:
+                    counter.remove(key(old_row.get(col)))
+                if new_row is not None:
+                    counter.add(key(new_row.get(col)))
+        self.record_status(old_row, new_row, changed)
+        # After the status history, so a new status counts towards the stage reached
+        self.update_contingency_tables(old_row, new_row, changed)
+
+    def update_contingency_tables(self, old_row, new_row, changed):
+        stage = None
+        for col, table in self.contingency_tables.items():
+            if not changed & {col, 'Status', 'Application Date', 'Interview Date', 'Application ID'}:
+                continue
+            if old_row is not None and pd.notna(old_row.get('Application ID')):
+                table.discard(old_row['Application ID'])
+            app_id = new_row.get('Application ID') if new_row is not None else None
+            if app_id is not None and pd.notna(app_id):
+                if stage is None:
+                    stage = furthest_stage(new_row, self.status_history.stage_reached(app_id))
+                table.set(app_id, new_row.get(col), stage)
+
+    def record_status(self, old_row, new_row, changed):
+        # Status history: a new application starts its log, an edited one logs the transition
+        app_id = new_row.get('Application ID') if new_row is not None else None
+        if app_id is None or pd.isna(app_id):
+            return
+        if old_row is None:
+            if int(app_id) not in self.status_history.by_app:
+                self.status_history.record_new(app_id, new_row.get('Application Date'), new_row.get('Status'), datetime.now())
+        elif "Status" in changed:
+            self.status_history.record(app_id, datetime.now(), old_row.get('Status'), new_row.get('Status'))
+
+    def record_bulk_statuses(self, rows):
+        # A bulk change (e.g. Set Status on thousands of rows, or its undo) rebuilds the aggregates
+        # instead of updating them row by row, but its transitions still belong in the history
+        for old_row, new_row in rows:
+            if old_row is not None and new_row is not None:
+                if not same_value(old_row.get('Application ID'), new_row.get('Application ID')):
+                    continue  # Another application at this position, e.g. undoing an import
+                changed = set() if same_value(old_row.get('Status'), new_row.get('Status')) else {"Status"}
+            else:
+                changed = {"Status"}
+            self.record_status(old_row, new_row, changed)
+
+    def dashboard_charts(self):
+        # (name, builder, title, fixed height, legend) for every chart on the dashboard, in display order
+        return [
+            ("status_pie", self.create_status_pie, 'Applications by Status', 500, True),
+            ("company_bar", self.create_company_bar, 'Top Companies by Applications', 1000, False),
+            ("timeline_line", self.create_timeline_line, 'Applications Over Time', 800, False),
+            ("job_title_bar", self.create_job_title_bar, 'Top 10 Job Positions', 1000, False),
+            ("term_bar", self.create_term_bar, 'Applications by Term', 800, False),
+            ("application_method_bar", self.create_application_method_bar, 'Applications by Method', 1000, False),
+            ("resume_cover_letter_bar", self.create_resume_cover_letter_bar, 'Applications by Resume and Cover Letter Version', 1200, False),
+            ("version_effectiveness", self.create_version_effectiveness, 'Interview and Offer Rates by Resume and Cover Letter', 1200, True),
+            ("status_stacked_area", self.create_status_stacked_area, 'Application Statuses Over Time', 600, False),
+            ("status_funnel", self.create_status_funnel, 'Application Funnel', 600, False),
+            ("response_time_hist", self.create_response_time_hist, 'Time to Response', 600, False),
+            ("salary_hist", self.create_salary_hist, 'Salary Distribution', 600, True),
+            ("location_bar", self.create_location_bar, 'Applications by Location', 1000, False),
+            ("conversion_bar", self.create_conversion_bar, 'Interview and Offer Rates', 1200, True),
+            ("time_to_interview_hist", self.create_time_to_interview_hist, 'Time to Interview', 600, False),
+            ("industry_pie", self.create_industry_pie, 'Applications by Industry', 500, True),
+        ]
+
+    def series_sources(self):
+        # Values plotted by the bar and line charts, one Series per axes. The builders draw these,
+        # and ScalableGraphWidget compares them against what is on screen to update in place.
+        return {
+            "company_bar": lambda: [self.top_counters['Company Name'].top(10).rename(self.duplicate_index.display_name)],
+            "job_title_bar": lambda: [self.top_counters['Position'].top(10)],
+            "location_bar": lambda: [self.top_known('Location Region', 12).rename(region_label),
+                                     self.top_known('Location City', 12)],
+            "term_bar": lambda: [self.top_counters['Term'].top()],
+            "application_method_bar": lambda: [self.top_counters['Application Method'].top()],
+            "resume_cover_letter_bar": lambda: [self.contingency_tables['Resume Version'].totals(),
+                                                self.contingency_tables['Cover Letter Version'].totals()],
+            "timeline_line": lambda: [self.status_rollup.frame(self.status_rollup.choose_granularity()).sum(axis=1)],
+        }
+
+    def top_known(self, name, k):
+        # Top k of a normalized counter, leaving out values its key could not place ("")
+        counts = self.top_counters[name].top(k + 1)
+        return counts[counts.index != ""].head(k)
+
+    def series_source(self, name):
+        return self.series_sources().get(name)
+
+    def chart_series(self, name):
+        return self.series_sources()[name]()
+
+    def column_fingerprint(self, col):
+        # Content hash of one column, kept until an edit changes that column.
+        # Being content based, it stays valid across restarts, unlike data_version.
+        if col not in self.column_fingerprints:
+            if col == "Status History":
+                self.column_fingerprints[col] = self.status_history.fingerprint()
+            elif col in self.data.columns:
+                hashes = pd.util.hash_pandas_object(self.data[col], index=False).to_numpy()
+                self.column_fingerprints[col] = hashlib.sha1(hashes.tobytes()).hexdigest()
+            else:
+                self.column_fingerprints[col] = ""
+        return self.column_fingerprints[col]
+
+    def chart_version(self, name):
+        return (chart_code_version(), tuple(self.column_fingerprint(col) for col in CHART_COLUMNS[name]))
+
+    def create_status_pie(self):
+        status_counts = self.top_counters['Status'].top()
+        status_counts = self.group_small_values(status_counts, threshold=5)
+
+        fig, ax = subplots(figsize=(10, 7))
+        colors = plt.cm.Set3(np.linspace(0, 1, len(status_counts)))
+        wedges, texts, autotexts = ax.pie(status_counts.values, colors=colors, autopct=lambda pct: f"{pct:.1f}%\n({int(pct/100.*sum(status_counts))})", pctdistance=0.75)
+
+        ax.set_title('Applications by Status')
+
+        # Add legend
+        ax.legend(wedges, status_counts.index,
+                title="Statuses",
+                loc="center left",
+                bbox_to_anchor=(1, 0, 0.5, 1))
+
+        plt.setp(autotexts, size=8, weight="bold")
+        ax.set_aspect("equal")
+
+        return fig
+
+    def create_timeline_line(self):
+        # Read the precomputed rollup at a granularity that fits the span of the data
+        granularity = self.status_rollup.choose_granularity()
+        date_counts = self.chart_series("timeline_line")[0]
+
+        fig, ax = subplots(figsize=(12, 9))  # 4:3 aspect ratio
+        ax.plot(date_counts.index, date_counts.values)
+        ax.set_title('Applications Over Time')
+        ax.set_xlabel(f'Date (per {GRANULARITY_LABELS[granularity].lower()})')
+        ax.set_ylabel('Number of Applications')
+
+        self.set_date_ticks(ax)
+
+        fig.tight_layout()
+
+        return fig
+
+    def set_date_ticks(self, ax):
+        # Let matplotlib pick a bounded number of date ticks, whatever the span of the data
+        ax.xaxis.set_major_locator(mdates.AutoDateLocator(maxticks=20))
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+
+    def create_job_title_bar(self):
+        job_title_counts = self.chart_series("job_title_bar")[0]
+
+        fig, ax = subplots(figsize=(12, 9))
+        bars = ax.bar(range(len(job_title_counts)), job_title_counts.values)
+        ax.set_title('Top 10 Job Positions')
+        ax.set_ylabel('Number of Applications')
+
+        # Wrap x-axis labels
+        wrapped_labels = [textwrap.fill(label, width=20) for label in job_title_counts.index]
+        ax.set_xticks(range(len(job_title_counts)))
+        ax.set_xticklabels(wrapped_labels, rotation=45, ha='right')
+
+        # Add value labels on the bars
+        for i, v in enumerate(job_title_counts.values):
+            ax.text(i, v, str(v), ha='center', va='bottom')
+
+        # Adjust layout to prevent cutoff
+        fig.tight_layout()
+
+        return fig
+
+    def create_company_bar(self):
+        company_counts = self.chart_series("company_bar")[0]
+
+        fig, ax = subplots(figsize=(12, 9))
+        bars = ax.bar(range(len(company_counts)), company_counts.values)
+        ax.set_title('Top 10 Companies by Applications')
+        ax.set_ylabel('Number of Applications')
+
+        # Wrap x-axis labels
+        wrapped_labels = [textwrap.fill(label, width=20) for label in company_counts.index]
+        ax.set_xticks(range(len(company_counts)))
+        ax.set_xticklabels(wrapped_labels, rotation=45, ha='right')
+
+        # Add value labels on the bars
+        for i, v in enumerate(company_counts.values):
+            ax.text(i, v, str(v), ha='center', va='bottom')
+
+        # Adjust layout to prevent cutoff
+        fig.tight_layout()
+
+        return fig
+
+    def create_term_bar(self):
+        term_counts = self.chart_series("term_bar")[0]
+
+        fig, ax = subplots(figsize=(10, 7))
+        bars = ax.bar(range(len(term_counts)), term_counts.values)
+        ax.set_title('Applications by Term')
+        ax.set_ylabel('Number of Applications')
+
+        # Wrap x-axis labels
+        wrapped_labels = [textwrap.fill(label, width=15) for label in term_counts.index]
+        ax.set_xticks(range(len(term_counts)))
+        ax.set_xticklabels(wrapped_labels, rotation=45, ha='right')
+
+        # Add value labels on the bars
+        for i, v in enumerate(term_counts.values):
+            ax.text(i, v, str(v), ha='center', va='bottom')
+
+        # Adjust layout to prevent cutoff
+        fig.tight_layout()
+
+        return fig
+
+    def create_application_method_bar(self):
+        method_counts = self.chart_series("application_method_bar")[0]
+
+        fig, ax = subplots(figsize=(12, 9))
+        bars = ax.bar(range(len(method_counts)), method_counts.values)
+        ax.set_title('Applications by Method')
+        ax.set_ylabel('Number of Applications')
+
+        # Wrap x-axis labels
+        wrapped_labels = [textwrap.fill(label, width=15) for label in method_counts.index]
+        ax.set_xticks(range(len(method_counts)))
+        ax.set_xticklabels(wrapped_labels, rotation=45, ha='right')
+
+        # Add value labels on the bars
+        for i, v in enumerate(method_counts.values):
+            ax.text(i, v, str(v), ha='center', va='bottom')
+
+        # Adjust layout to prevent cutoff
+        fig.tight_layout()
+
+        return fig
+
+    def create_resume_cover_letter_bar(self):
+        resume_counts, cover_letter_counts = self.chart_series("resume_cover_letter_bar")
+
+        resume_labels = [self.version_label(label) for label in resume_counts.index]
+        cover_letter_labels = [self.version_label(label) for label in cover_letter_counts.index]
+
+        # Calculate the number of bars
+        n_resume = len(resume_counts)
+        n_cover = len(cover_letter_counts)
+
+        # Adjust figure size based on number of bars
+        fig_height = max(8, (n_resume + n_cover) * 0.5)  # 0.5 inch per bar, minimum 8 inches
+        fig, (ax1, ax2) = subplots(2, 1, figsize=(12, fig_height))
+
+        # Resume Version chart
+        bars1 = ax1.bar(range(len(resume_labels)), resume_counts.values)
+        ax1.set_title('Applications by Resume Version')
+        ax1.set_ylabel('Number of Applications')
+        ax1.set_xlabel('Resume Version')
+
+        # Cover Letter Version chart
+        bars2 = ax2.bar(range(len(cover_letter_labels)), cover_letter_counts.values)
+        ax2.set_title('Applications by Cover Letter Version')
+        ax2.set_ylabel('Number of Applications')
+        ax2.set_xlabel('Cover Letter Version')
+
+        # Add value labels on the bars and set x-axis labels
+        for ax, labels in zip([ax1, ax2], [resume_labels, cover_letter_labels]):
+            for i, v in enumerate(ax.containers[0]):
+                ax.text(i, v.get_height(), str(v.get_height()), ha='center', va='bottom')
+            ax.set_xticks(range(len(labels)))
+            ax.set_xticklabels(labels, rotation=45, ha='right')
+
+        # Adjust layout to prevent cutoff
+        fig.tight_layout()
+
+        return fig
+
+    def create_version_effectiveness(self):
+        # Interview and offer rates per resume and cover letter version, from the version x stage
+        # tables, with 95% Wilson intervals so versions used only a few times are not over-read
+        fig, axes = subplots(len(CONTINGENCY_COLUMNS), 1, figsize=(12, 10))
+        for ax, col in zip(axes, CONTINGENCY_COLUMNS):
+            rates = self.contingency_tables[col].rates().head(10)
+            positions = np.arange(len(rates))
+            for offset, outcome, label in [(-0.2, 'interview', 'Interview rate'), (0.2, 'offer', 'Offer rate')]:
+                values = rates[f'{outcome}_rate'].to_numpy(dtype=float) * 100
+                errors = np.vstack([values - rates[f'{outcome}_low'].to_numpy() * 100,
+                                    rates[f'{outcome}_high'].to_numpy() * 100 - values])
+                ax.bar(positions + offset, values, width=0.4, yerr=errors, capsize=3, label=label)
+            ax.set_title(f'Outcomes by {col}')
+            ax.set_ylabel('% of Applications')
+            ax.set_xticks(positions)
+            ax.set_xticklabels([f"{self.version_label(value)}\n(n={n})" for value, n in zip(rates.index, rates['applications'])],
+                               rotation=45, ha='right')
+            ax.legend(loc='upper right')
+
+        fig.tight_layout()
+
+        return fig
+
+    def create_status_stacked_area(self):
+        # Replay the status history, so an application moves between statuses when it actually changed
+        granularity = self.status_rollup.choose_granularity()
+        status_over_time = self.status_history.status_counts_over_time(granularity, self.data['Application ID'])
+
+        fig, ax = subplots(figsize=(12, 9))
+        ax.stackplot(status_over_time.index, status_over_time.T, labels=status_over_time.columns)
+        ax.set_title('Application Statuses Over Time')
+        ax.set_xlabel(f'Date (per {GRANULARITY_LABELS[granularity].lower()})')
+        ax.set_ylabel('Number of Applications')
+
+        self.set_date_ticks(ax)
+
+        # Wrap legend labels
+        handles, labels = ax.get_legend_handles_labels()
+        wrapped_labels = [textwrap.fill(label, width=15) for label in labels]
+        ax.legend(handles, wrapped_labels, loc='upper left')
+
+        fig.tight_layout()
+
+        return fig
+
+    def create_status_funnel(self):
+        funnel = self.status_history.funnel(self.data['Application ID'])
+
+        fig, ax = subplots(figsize=(12, 6))
+        ax.barh(range(len(funnel)), funnel.values, color=plt.cm.Set3(np.linspace(0, 1, len(funnel))))
+        ax.set_yticks(range(len(funnel)))
+        ax.set_yticklabels(funnel.index)
+        ax.invert_yaxis()
+        ax.set_title('Application Funnel')
+        ax.set_xlabel('Number of Applications')
+        ax.set_xlim(0, max(funnel.max(), 1) * 1.2)  # Leave room for the labels
+
+        # Label each stage with its count and conversion from the first stage
+        total = funnel.iloc[0] if len(funnel) else 0
+        for i, v in enumerate(funnel.values):
+            rate = f" ({v / total:.1%})" if total else ""
+            ax.text(v, i, f" {v}{rate}", va='center')
+
+        fig.tight_layout()
+
+        return fig
+
+    def create_response_time_hist(self):
+        days = self.status_history.time_to_response(self.data['Application ID'])
+
+        fig, ax = subplots(figsize=(12, 6))
+        if len(days):
+            ax.hist(days.values, bins=min(30, max(days.max(), 1)))
+            ax.axvline(days.median(), color='red', linestyle='--', label=f"Median: {days.median():.0f} days")
+            ax.legend(loc='upper right')
+        else:
+            ax.text(0.5, 0.5, 'No status changes recorded yet', ha='center', va='center', transform=ax.transAxes)
+        ax.set_title('Time to Response')
+        ax.set_xlabel('Days from application to first status change')
+        ax.set_ylabel('Number of Applications')
+
+        fig.tight_layout()
+
+        return fig
+
+    def create_salary_hist(self):
+        # Annualized midpoints from the parsed Salary Range, stacked by the period the salary was given in.
+        # Amounts are not converted, so only the most common currency is charted; salaries without a
+        # stated currency are taken to be in it.
+        salaries = self.store.salaries.frame(self.data, self.data_version)
+        salaries = salaries[salaries['annual_mid'].notna()]
+        stated = salaries['currency'].dropna()
+        currency = stated.value_counts().index[0] if len(stated) else ""
+        other = salaries['currency'].notna() & (salaries['currency'] != currency)
+        hidden = int(other.sum())
+        salaries = salaries[~other]
+
+        fig, ax = subplots(figsize=(12, 6))
+        if len(salaries):
+            annual = salaries['annual_mid'].to_numpy(dtype=float) / 1000
+            bins = np.histogram_bin_edges(annual, bins=min(20, max(len(annual) // 3, 5)))
+            periods = [period for period in ["hour", "week", "month", "year"] if (salaries['period'] == period).any()]
+            ax.hist([annual[(salaries['period'] == period).to_numpy()] for period in periods], bins=bins,
+                    stacked=True, label=[f"Given per {period}" for period in periods])
+            ax.axvline(np.median(annual), color='red', linestyle='--', label=f"Median: {np.median(annual):.0f}k")
+            ax.legend(loc='upper right')
+        else:
+            ax.text(0.5, 0.5, 'No salaries entered yet', ha='center', va='center', transform=ax.transAxes)
+        ax.set_title(f"Salary Distribution (annualized{', ' + currency if currency else ''})")
+        ax.set_xlabel(f"Annual salary, thousands{' of ' + currency if currency else ''}")
+        if hidden:
+            ax.text(0.01, 0.98, f"{hidden} {'salary' if hidden == 1 else 'salaries'} in other currencies not shown", ha='left', va='top',
+                    transform=ax.transAxes, fontsize=9, color='gray')
+        ax.set_ylabel('Number of Applications')
+
+        fig.tight_layout()
+
+        return fig
+
+    def create_location_bar(self):
+        # Normalized locations: states/provinces (with Remote and Multiple locations) and cities
+        region_counts, city_counts = self.chart_series("location_bar")
+
+        fig, (ax1, ax2) = subplots(2, 1, figsize=(12, 10))
+        ax1.bar(range(len(region_counts)), region_counts.values)
+        ax1.set_title('Applications by Region')
+        ax2.bar(range(len(city_counts)), city_counts.values)
+        ax2.set_title('Applications by City')
+
+        for ax, counts in zip([ax1, ax2], [region_counts, city_counts]):
+            ax.set_ylabel('Number of Applications')
+            for i, v in enumerate(counts.values):
+                ax.text(i, v, str(v), ha='center', va='bottom')
+            ax.set_xticks(range(len(counts)))
+            ax.set_xticklabels([textwrap.fill(label, width=20) for label in counts.index], rotation=45, ha='right')
+
+        fig.tight_layout()
+
+        return fig
+
+    def create_conversion_bar(self):
+        # Interview and offer rates for each Application Method, Resume Version and Term
+        conversion = self.analytics.conversion(self.data, self.data_version, self.status_history)
+
+        fig, axes = subplots(len(DIMENSIONS), 1, figsize=(12, 4 * len(DIMENSIONS)))
+        for ax, dimension in zip(axes, DIMENSIONS):
+            rates = conversion.loc[dimension].head(10) if dimension in conversion.index.get_level_values(0) else conversion.iloc[:0]
+            positions = np.arange(len(rates))
+            ax.bar(positions - 0.2, rates['interview_rate'] * 100, width=0.4, label='Interview rate')
+            ax.bar(positions + 0.2, rates['offer_rate'] * 100, width=0.4, label='Offer rate')
+            for i, (interviews, applications) in enumerate(zip(rates['interviews'], rates['applications'])):
+                ax.text(i - 0.2, rates['interview_rate'].iloc[i] * 100, f"{interviews}/{applications}", ha='center', va='bottom', fontsize=8)
+            ax.set_title(f'Conversion by {dimension}')
+            ax.set_ylabel('% of Applications')
+            ax.set_ylim(0, max(rates['interview_rate'].max() * 120 if len(rates) else 0, 5))
+            ax.set_xticks(positions)
+            ax.set_xticklabels([textwrap.fill(str(label), width=20) for label in rates.index], rotation=45, ha='right')
+            ax.legend(loc='upper right')
+
+        fig.tight_layout()
+
+        return fig
+
+    def create_time_to_interview_hist(self):
+        # Days from Application Date to Interview Date, overall and per Application Method
+        days = self.analytics.days_to_interview(self.data, self.data_version, self.status_history)
+
+        fig, (ax1, ax2) = subplots(1, 2, figsize=(12, 6))
+        if len(days):
+            values = days['days_to_interview']
+            ax1.hist(values.values, bins=min(30, max(int(values.max()), 1)))
+            ax1.axvline(values.median(), color='red', linestyle='--', label=f"Median: {values.median():.0f} days")
+            ax1.legend(loc='upper right')
+            by_method = {method: group.values for method, group in values.groupby(days['Application Method'], observed=True)}
+            ax2.boxplot(list(by_method.values()), vert=False)
+            ax2.set_yticks(range(1, len(by_method) + 1))
+            ax2.set_yticklabels(list(by_method))
+        else:
+            for ax in (ax1, ax2):
+                ax.text(0.5, 0.5, 'No interview dates entered yet', ha='center', va='center', transform=ax.transAxes)
+        ax1.set_title('Time to Interview')
+        ax1.set_xlabel('Days from application to interview')
+        ax1.set_ylabel('Number of Applications')
+        ax2.set_title('By Application Method')
+        ax2.set_xlabel('Days from application to interview')
+
+        fig.tight_layout()
+
+        return fig
+
+    def create_industry_pie(self):
+        industry_counts = self.top_counters['Industry'].top()
+        industry_counts = self.group_small_values(industry_counts, threshold=3)
+
+        fig, ax = subplots(figsize=(10, 7))
+        colors = plt.cm.Set3(np.linspace(0, 1, len(industry_counts)))
+        wedges, texts, autotexts = ax.pie(industry_counts.values, colors=colors, autopct=lambda pct: f"{pct:.1f}%\n({int(pct/100.*sum(industry_counts))})", pctdistance=0.75)
+
+        ax.set_title('Applications by Industry')
+
+        # Add legend
+        ax.legend(wedges, industry_counts.index,
+                title="Industries",
+                loc="center left",
+                bbox_to_anchor=(1, 0, 0.5, 1))
+
+        plt.setp(autotexts, size=8, weight="bold")
+        ax.set_aspect("equal")
+
+        return fig
+
+    def version_label(self, filename):
+        # The file name without its extension, wrapped to fit under a bar
+        name = os.path.splitext(filename)[0]
+        return textwrap.fill(name, width=20) if name else "None"
+
+    def group_small_values(self, data, threshold=3):
+        mask = data >= threshold
+        main_data = data[mask]
+        other_data = data[~mask]
+
+        if other_data.sum() > 0:
+            return pd.concat([main_data, pd.Series({'Other': other_data.sum()})])
+        else:
+            return main_data
@@ -0,0 +1,394 @@
+import os
+import logging
+import threading
+import functools
+import numpy as np
+import pandas as pd
+from query_engine import QueryEngine
+from undo import UndoStack, apply_change, diff_frames, row_insert, row_update, rows_update, row_delete, same_value
+from schema import SCHEMA_VERSION, migrate, add_missing_columns, parse_date_column
+from storage_format import FORMATS, read_file, write_file
+from salary import SalaryIndex, parse_amount
+
+DATE_COLUMNS = ["Application Date", "Interview Date", "Follow-up Date"]
+
+# Columns of the Tk and PyQt front-ends
+TK_COLUMNS = [
+    "Index", "Company Name", "Job Title", "Application Date", "Status",
+    "Job URL", "Company Website", "Location", "Salary Range",
+    "Contact Person", "Contact Email/Phone", "Application Method",
+    "Resume Version", "Cover Letter Version", "Interview Date",
+    "Follow-up Date", "Notes", "Next Steps", "Priority", "Tags"
+]
+PYQT_COLUMNS = [
+    "Index", "Company Name", "Job Title", "Position", "Industry", "Term",
+    "Application Date", "Status", "Job URL", "Company Website", "Location",
+    "Salary Range", "Contact Person", "Contact Email/Phone", "Application Method",
+    "Resume Version", "Cover Letter Version", "Interview Date", "Follow-up Date",
+    "Notes", "Next Steps", "Priority", "Tags", "Application ID"
+]
+
+# Format new saves are written in (see storage_format.FORMATS); files in any format can be loaded.
+# A compressed format makes the data file several times smaller, e.g. to sync it over a slow link.
+STORAGE_FORMAT = os.environ.get("JOB_TRACKER_STORAGE_FORMAT", "pickle")
+
+# Undo/redo of changes touching more rows than this rebuilds listeners instead of replaying each row
+INCREMENTAL_LIMIT = 1000
+
+
+def parse_date_value(value):
+    return pd.to_datetime(value, format='%Y-%m-%d') if value and pd.notna(value) else ''
+
+
+def coerce_date_value(value):
+    # Imported dates may come as Timestamps or as strings in any format pandas understands
+    value = pd.to_datetime(value, errors='coerce') if value != '' else pd.NaT
+    return value if pd.notna(value) else ''
+
+
+def synchronized(method):
+    # Mutations hold the store lock, so a background save never snapshots a half-applied change
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def read_table(file_path):
+    """Read an Excel or CSV file for import."""
+    if file_path.endswith('.xlsx'):
+        return pd.read_excel(file_path)
+    return pd.read_csv(file_path)
+
+
+class DataStore:
+    """The application data and everything kept in step with it, independent of any GUI toolkit.
+
+    All changes go through add/update/delete/replace/undo/redo, which bump version
+    (so the query engine's per-version caches stay valid), record undo history and
+    tell listeners which rows changed, so the front-ends can keep their own
+    aggregates incremental. Both the Tk and the PyQt front-end use this class.
+
+    With a PersistenceService, save() only marks the data dirty and the file is
+    written in the background from a snapshot; flush() or close() write it at once.
+    """
+
+    def __init__(self, data_file, columns, parse_dates=True, persistence=None, storage_format=STORAGE_FORMAT):
+        self.data_file = data_file
+        if storage_format not in FORMATS:
+            logging.error(f"Storage format {storage_format} is not available, saving as pickle")
+            storage_format = "pickle"
+        self.storage_format = storage_format
+        self.columns = list(columns)
+        # The PyQt front-end stores dates as Timestamps, the Tk one as 'YYYY-MM-DD' strings
+        self.parse_dates = parse_dates
+        self.data = pd.DataFrame(columns=self.columns)
+        self.version = 0
+        self.query_engine = QueryEngine()
+        # Salary Range parsed into numbers: pay:>=100k filters, and the column sorts, by annual pay
+        self.salaries = SalaryIndex()
+        self.query_engine.register_numeric_field("pay", self.salaries.annual, parse_amount, sort_column="Salary Range")
+        self.undo_stack = UndoStack()
+        self.row_listeners = []
+        self.reset_listeners = []
+        self.bulk_listeners = []
+        self.lock = threading.RLock()
+        self.persistence = persistence
+        if persistence is not None:
+            persistence.register(self.data_file, self.snapshot, self.write)
+
+    def add_listener(self, on_row_change=None, on_reset=None, on_bulk_change=None):
+        """on_row_change(old_row, new_row, changed_columns) is called for every added (old_row=None),
+        edited or deleted (new_row=None) row; on_reset() after the data was replaced as a whole.
+
+        Changes to more than INCREMENTAL_LIMIT rows reset instead of calling on_row_change row by
+        row. on_bulk_change(rows) still gets their [(old_row, new_row)] pairs, just before on_reset(),
+        for listeners that cannot rebuild what they keep from the data alone (e.g. a change log).
+        """
+        if on_row_change is not None:
+            self.row_listeners.append(on_row_change)
+        if on_reset is not None:
+            self.reset_listeners.append(on_reset)
+        if on_bulk_change is not None:
+            self.bulk_listeners.append(on_bulk_change)
+
+    def changed_columns(self, old_row, new_row):
+        # Every column changes when a row is added or deleted
+        if old_row is None or new_row is None:
+            return set(self.data.columns)
+        return {col for col in new_row if col != "Index" and not same_value(old_row.get(col), new_row[col])}
+
+    def row_changed(self, old_row, new_row):
+        changed = self.changed_columns(old_row, new_row)
+        self.version += 1
+        for listener in self.row_listeners:
+            listener(old_row, new_row, changed)
+        return changed
+
+    def reset(self, rows=None):
+        self.version += 1
+        if rows:
+            for listener in self.bulk_listeners:
+                listener(rows)
+        for listener in self.reset_listeners:
+            listener()
+
+    def change_rows(self, change, reverse):
+        """[(old_row, new_row)] of a change that has just been applied; None for an added or deleted side."""
+        removed, added = (change.inserted, change.deleted) if reverse else (change.deleted, change.inserted)
+        rows = [(row, None) for _, row in removed] + [(None, row) for _, row in added]
+        current = self.data.iloc[[position for position, _, _ in change.updated]].to_dict('records')
+        for new_row, (_, before, after) in zip(current, change.updated):
+            rows.append(({**new_row, **(after if reverse else before)}, new_row))
+        return rows
+
+    @synchronized
+    def load(self, write_upgrade=True):
+        """Load the data file, or start empty if there is none. Raises if the file cannot be read.
+
+        write_upgrade=False leaves an older file as it is, for read-only uses such as reports.
+        """
+        if not os.path.exists(self.data_file):
+            self.data = pd.DataFrame(columns=self.columns)
+            logging.info("New data file created")
+            self.reset()
+            return
+        data = read_file(self.data_file)
+        # Upgrade older files once and write the upgraded format back
+        data, applied = migrate(data)
+        data = add_missing_columns(data, self.columns)
+        if self.parse_dates:
+            for col in DATE_COLUMNS:
+                if col in data.columns:
+                    data[col] = parse_date_column(data[col])
+        self.data = data
+        logging.info(f"Data loaded successfully from {self.data_file}")
+        if applied and write_upgrade:
+            self.save()
+        self.reset()
+
+    @synchronized
+    def clear(self):
+        """Start over with an empty table, e.g. after the data file failed to load."""
+        self.data = pd.DataFrame(columns=self.columns)
+        self.reset()
+
+    def save(self):
+        """Save the data, or with a PersistenceService schedule a background save."""
+        if self.persistence is not None:
+            self.persistence.mark_dirty(self.data_file)
+        else:
+            self.write(self.snapshot())
+
+    def snapshot(self):
+        # A copy taken under the lock; later edits in place cannot change it while it is written
+        with self.lock:
+            data = self.data.copy()
+        data.attrs['schema_version'] = SCHEMA_VERSION
+        return data
+
+    def write(self, data):
+        # Write to a temporary file and rename it, so a crash mid-write leaves the old file intact
+        temp_file = self.data_file + ".tmp"
+        write_file(temp_file, data, self.storage_format)
+        os.replace(temp_file, self.data_file)
+        logging.info(f"Data saved successfully to {self.data_file}")
+
+    def flush(self):
+        """Write pending changes now. Raises if the write fails."""
+        if self.persistence is not None:
+            self.persistence.flush()
+
+    def close(self):
+        if self.persistence is not None:
+            self.persistence.close()
+
+    def export(self, file_path):
+        if file_path.endswith('.xlsx'):
+            self.data.to_excel(file_path, index=False)
+        else:
+            self.data.to_csv(file_path, index=False)
+
+    def normalize_row(self, row):
+        row = dict(row)
+        if self.parse_dates:
+            for col in DATE_COLUMNS:
+                if col in row:
+                    row[col] = parse_date_value(row[col])
+        return row
+
+    def next_application_ids(self, count):
+        ids = pd.to_numeric(self.data['Application ID'], errors='coerce') if len(self.data) else pd.Series(dtype=float)
+        start = int(ids.max()) + 1 if ids.notna().any() else 1
+        return range(start, start + count)
+
+    def assign_application_ids(self, new_data):
+        # Imported rows that match an existing application keep its id (and so anything keyed by it)
+        key_columns = ['Company Name', 'Job Title', 'Application Date']
+        def keys(frame):
+            return frame[key_columns].astype(str).agg('|'.join, axis=1)
+        existing = dict(zip(keys(self.data), self.data['Application ID'])) if len(self.data) else {}
+        ids = keys(new_data).map(existing) if len(new_data) else pd.Series(dtype=float)
+        ids = ids.mask(ids.duplicated())
+        missing = ids.isna()
+        if missing.any():
+            ids[missing] = list(self.next_application_ids(int(missing.sum())))
+        new_data['Application ID'] = ids.astype(int)
+
+    @synchronized
+    def add(self, entry, label="Add entry"):
+        """Append a row and return its position."""
+        entry = self.normalize_row(entry)
+        entry["Index"] = len(self.data) + 1
+        if 'Application ID' in self.data.columns:
+            entry["Application ID"] = self.next_application_ids(1)[0]
+        self.data = self.data._append(entry, ignore_index=True)
+        position = len(self.data) - 1
+        self.undo_stack.record(row_insert(label, position, entry))
+        self.row_changed(None, entry)
+        return position
+
+    @synchronized
+    def update(self, position, values, label="Edit entry"):
+        """Set the given columns of one row and return the set of columns whose value changed."""
+        old_row = self.data.iloc[position].to_dict()
+        new_row = {**old_row, **self.normalize_row(values), "Index": position + 1}
+        self.data.iloc[position] = new_row
+        self.undo_stack.record(row_update(label, position, old_row, new_row))
+        return self.row_changed(old_row, new_row)
+
+    @synchronized
+    def update_many(self, positions, values, label="Edit entries"):
+        """Set the same values on many rows with one vectorized assignment per column.
+
+        Recorded as a single undo step; returns the set of columns whose value changed.
+        """
+        values = {col: value for col, value in self.normalize_row(values).items()
+                  if col in self.data.columns and col != "Index"}
+        return self.assign(sorted(set(positions)), values, label)
+
+    @synchronized
+    def tag_many(self, positions, tag, remove=False, label=None):
+        """Add a tag to (or remove it from) the Tags of many rows. Tags are stored comma-separated."""
+        tag = tag.strip().replace(",", " ")
+        positions = sorted(set(positions))
+        if not tag or not positions:
+            return set()
+        tags = self.data['Tags'].iloc[positions].astype(str)
+        # Split every row's tags once, vectorized over the selection
+        items = tags.str.split(",").explode().str.strip()
+        has_tag = (items == tag).groupby(level=0).any()
+        if remove:
+            kept = items[(items != tag) & (items != "")]
+            new_tags = kept.groupby(level=0).agg(", ".join).reindex(tags.index, fill_value="")
+        else:
+            new_tags = tags.where(has_tag | (tags.str.strip() == ""), tags + ", " + tag)
+            new_tags = new_tags.where(has_tag | (tags.str.strip() != ""), tag)
+        label = label or (f"Remove tag {tag}" if remove else f"Tag {tag}")
+        return self.assign(positions, {'Tags': new_tags.to_numpy()}, label)
+
+    def assign(self, positions, values, label):
+        """Set columns on the rows at (sorted) positions; a value is a scalar for all rows or an
+        array with one value per position. One undo step, listeners told row by row."""
+        if not positions or not values:
+            return set()
+        old_rows = self.data.iloc[positions].to_dict('records')
+        selected = np.zeros(len(self.data), dtype=bool)
+        selected[positions] = True
+        for col, value in values.items():
+            if np.ndim(value):
+                value = pd.Series(value, index=self.data.index[positions], dtype=object)
+            self.data[col] = self.data[col].where(~selected, value)
+        new_rows = self.data.iloc[positions].to_dict('records')
+        rows = list(zip(positions, old_rows, new_rows))
+        self.undo_stack.record(rows_update(label, rows))
+        if len(rows) > INCREMENTAL_LIMIT:
+            self.reset([(old_row, new_row) for _, old_row, new_row in rows])
+            return set(values)
+        changed = set()
+        for _, old_row, new_row in rows:
+            changed |= self.row_changed(old_row, new_row)
+        return changed
+
+    @synchronized
+    def delete(self, positions, label="Delete entry"):
+        """Delete the rows at positions and renumber Index."""
+        positions = sorted(positions)
+        rows = [(position, self.data.iloc[position].to_dict()) for position in positions]
+        self.undo_stack.record(row_delete(label, rows))
+        self.data = self.data.drop(self.data.index[positions]).reset_index(drop=True)
+        self.data['Index'] = range(1, len(self.data) + 1)
+        if len(rows) > INCREMENTAL_LIMIT:
+            self.reset([(old_row, None) for _, old_row in rows])
+            return rows
+        for _, old_row in rows:
+            self.row_changed(old_row, None)
+        return rows
+
+    def mapped_frame(self, imported, mapping):
+        """Build a replacement table from an imported frame; mapping is {app column: imported column or None}."""
+        new_data = pd.DataFrame(index=range(len(imported)))
+        for col in self.data.columns:
+            if col in ("Index", "Application ID"):
+                continue
+            source = mapping.get(col)
+            new_data[col] = imported[source].to_numpy() if source else ""
+        # Handle empty cells
+        new_data = new_data.fillna('').replace({'nan': '', 'NaN': ''})
+        if self.parse_dates:
+            for col in DATE_COLUMNS:
+                if col in new_data.columns:
+                    new_data[col] = new_data[col].apply(coerce_date_value)
+        new_data.insert(0, 'Index', range(1, len(new_data) + 1))
+        if 'Application ID' in self.data.columns:
+            self.assign_application_ids(new_data)
+        return new_data[list(self.data.columns)]
+
+    @synchronized
+    def replace(self, new_data, label="Import"):
+        """Replace the whole table (import), recorded as a row-level diff so it can be undone."""
+        self.undo_stack.record(diff_frames(label, self.data, new_data))
+        self.data = new_data
+        self.reset()
+
+    def undo(self):
+        """Revert the last change. Returns the changed columns, or None if there was nothing to undo."""
+        return self.apply(self.undo_stack.undo(), reverse=True)
+
+    def redo(self):
+        return self.apply(self.undo_stack.redo(), reverse=False)
+
+    @synchronized
+    def apply(self, change, reverse):
+        if change is None:
+            return None
+        removed, added = (change.inserted, change.deleted) if reverse else (change.deleted, change.inserted)
+        if len(removed) + len(added) + len(change.updated) > INCREMENTAL_LIMIT:
+            self.data = apply_change(self.data, change, reverse)
+            self.reset(self.change_rows(change, reverse) if self.bulk_listeners else None)
+            changed = set(self.data.columns)
+        else:
+            # Only the rows the change touches are passed to the listeners
+            updated_rows = []
+            for position, before, after in change.updated:
+                old_row = self.data.iloc[position].to_dict()
+                updated_rows.append((old_row, {**old_row, **(before if reverse else after)}))
+            removed_rows = [self.data.iloc[position].to_dict() for position, _ in removed]
+            self.data = apply_change(self.data, change, reverse)
+            changed = set()
+            for old_row in removed_rows:
+                changed |= self.row_changed(old_row, None)
+            for _, row in added:
+                changed |= self.row_changed(None, row)
+            for old_row, new_row in updated_rows:
+                changed |= self.row_changed(old_row, new_row)
+        logging.info(f"{'Undid' if reverse else 'Redid'} change: {change.label}")
+        return changed
+
+    def filter(self, query):
+        """Boolean mask of the rows matching a search query (see query_engine.parse_query)."""
+        return self.query_engine.filter(self.data, query, self.version)
+
+    def sort_permutation(self, column, ascending=True):
+        return self.query_engine.sort_permutation(self.data, column, ascending, self.version)
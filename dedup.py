@@ -0,0 +1,207 @@
+import re
+import zlib
+from collections import Counter
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import numpy as np
+import pandas as pd
+
+# Words that do not tell companies apart: "Google", "Google LLC" and "google, inc." are one company
+LEGAL_SUFFIXES = {
+    "inc", "incorporated", "llc", "ltd", "limited", "corp", "corporation", "co", "company",
+    "plc", "gmbh", "ag", "sa", "bv", "nv", "lp", "llp", "pty", "the",
+}
+PUNCTUATION = re.compile(r"[^\w\s]")
+# Query parameters that only track where a link was clicked
+TRACKING_PARAMETERS = re.compile(r"^(utm_\w+|ref|refid|trk|trackingid|src|source|gclid|fbclid)$", re.IGNORECASE)
+
+NUM_PERMUTATIONS = 60
+BANDS = 20  # 3 rows per band: names with trigram Jaccard 0.5 share a band with probability ~0.93
+PRIME = 4294967311
+_rng = np.random.default_rng(20240701)
+_A = _rng.integers(1, 2**31, NUM_PERMUTATIONS, dtype=np.uint64)
+_B = _rng.integers(0, 2**31, NUM_PERMUTATIONS, dtype=np.uint64)
+
+
+def normalize_company(name):
+    if not isinstance(name, str):
+        return ""
+    words = PUNCTUATION.sub(" ", name.lower()).split()
+    kept = [word for word in words if word not in LEGAL_SUFFIXES]
+    return " ".join(kept or words)
+
+
+def normalize_url(url):
+    """Compare job URLs without scheme, www., trailing slash, fragment or tracking parameters."""
+    if not isinstance(url, str) or not url.strip():
+        return ""
+    url = url.strip()
+    parts = urlsplit(url if "//" in url else "//" + url)
+    host = parts.netloc.lower().removeprefix("www.")
+    query = urlencode(sorted((key, value) for key, value in parse_qsl(parts.query) if not TRACKING_PARAMETERS.match(key)))
+    return urlunsplit(("", host, parts.path.rstrip("/"), query, "")).lstrip("/")
+
+
+def normalize_column(values, normalize):
+    """Normalize each distinct value once and map the results back."""
+    codes, uniques = pd.factorize(values)
+    normalized = np.array([normalize(value) for value in uniques] + [""], dtype=object)
+    return pd.Series(normalized[codes], index=values.index)  # Code -1 (missing) picks the trailing ""
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def minhash_many(gram_sets, chunk=4000):
+    """MinHash signatures (one row per set) computed in vectorized chunks of sets."""
+    signatures = []
+    for start in range(0, len(gram_sets), chunk):
+        sets = gram_sets[start:start + chunk]
+        hashes = np.array([zlib.crc32(gram.encode()) for grams in sets for gram in grams], dtype=np.uint64)
+        offsets = np.cumsum([0] + [len(grams) for grams in sets[:-1]])
+        permuted = (_A[:, None] * hashes[None, :] + _B[:, None]) % PRIME
+        signatures.append(np.minimum.reduceat(permuted, offsets, axis=1).T)
+    return np.concatenate(signatures) if signatures else np.empty((0, NUM_PERMUTATIONS), dtype=np.uint64)
+
+
+def band_hashes(signatures):
+    """One hash per LSH band: names are compared only if they agree on all rows of some band."""
+    rows = signatures.reshape(len(signatures), BANDS, -1)
+    hashes = np.zeros(rows.shape[:2], dtype=np.uint64)
+    for i in range(rows.shape[2]):
+        hashes = hashes * np.uint64(PRIME) + rows[:, :, i]  # Wraps around modulo 2**64
+    return hashes
+
+
+class DuplicateIndex:
+    """Company names and job URLs, normalized, for duplicate warnings and canonical names.
+
+    Companies are grouped by normalize_company, and each group is shown under its most
+    common spelling (display_name). Near-miss spellings ("Gogle") are found with MinHash
+    over character trigrams and LSH banding: only names sharing a band are compared, so
+    lookups stay far from quadratic however many names there are. Kept in step with the
+    store row by row (update).
+    """
+
+    def __init__(self, threshold=0.6):
+        self.threshold = threshold
+        self.spellings = {}
+        self.urls = Counter()
+        self.grams = {}
+        self.buckets = [{} for _ in range(BANDS)]
+
+    def build(self, data):
+        self.spellings, self.urls = {}, Counter()
+        if 'Company Name' in data.columns:
+            keys = normalize_column(data['Company Name'], normalize_company)
+            new_keys = [key for key in keys.unique() if key and key not in self.grams]
+            self.index_names(new_keys)
+            for (key, spelling), count in pd.DataFrame({'key': keys, 'name': data['Company Name']}).value_counts().items():
+                self.add_spelling(key, spelling, count)
+        if 'Job URL' in data.columns:
+            urls = normalize_column(data['Job URL'], normalize_url)
+            self.urls = Counter(urls[urls != ""].value_counts().to_dict())
+
+    def add_spelling(self, key, spelling, count=1):
+        if not key:
+            return
+        self.spellings.setdefault(key, Counter())[spelling] += count
+        if key not in self.grams:
+            self.index_names([key])
+
+    def index_names(self, keys):
+        if not keys:
+            return
+        gram_sets = [trigrams(key) for key in keys]
+        self.grams.update(zip(keys, gram_sets))
+        hashes = band_hashes(minhash_many(gram_sets))
+        for band, buckets in enumerate(self.buckets):
+            for key, value in zip(keys, hashes[:, band].tolist()):
+                buckets.setdefault(value, []).append(key)
+
+    def remove_spelling(self, key, spelling):
+        spellings = self.spellings.get(key)
+        if not spellings:
+            return
+        spellings[spelling] -= 1
+        if spellings[spelling] <= 0:
+            del spellings[spelling]
+        if not spellings:
+            del self.spellings[key]  # Its LSH buckets keep the key; lookups skip unused keys
+
+    def update(self, old_row, new_row, changed):
+        """Store listener."""
+        if 'Company Name' in changed:
+            if old_row is not None:
+                self.remove_spelling(normalize_company(old_row.get('Company Name')), old_row.get('Company Name'))
+            if new_row is not None:
+                self.add_spelling(normalize_company(new_row.get('Company Name')), new_row.get('Company Name'))
+        if 'Job URL' in changed:
+            if old_row is not None and normalize_url(old_row.get('Job URL')):
+                self.urls[normalize_url(old_row.get('Job URL'))] -= 1
+            if new_row is not None and normalize_url(new_row.get('Job URL')):
+                self.urls[normalize_url(new_row.get('Job URL'))] += 1
+
+    def display_name(self, key):
+        spellings = self.spellings.get(key)
+        return spellings.most_common(1)[0][0] if spellings else key
+
+    def similar_companies(self, name):
+        """[(display name, similarity)] of other companies whose names are close to name."""
+        key = normalize_company(name)
+        if not key:
+            return []
+        grams = self.grams.get(key) or trigrams(key)
+        candidates = set()
+        for buckets, value in zip(self.buckets, band_hashes(minhash_many([grams]))[0].tolist()):
+            candidates.update(buckets.get(value, ()))
+        matches = []
+        for candidate in candidates - {key}:
+            if candidate in self.spellings:
+                similarity = jaccard(grams, self.grams[candidate])
+                if similarity >= self.threshold:
+                    matches.append((self.display_name(candidate), similarity))
+        return sorted(matches, key=lambda match: -match[1])
+
+    def similar_company_pairs(self):
+        """All pairs of company groups with close names, from the LSH buckets."""
+        pairs = set()
+        for keys in (keys for buckets in self.buckets for keys in buckets.values() if len(keys) > 1):
+            keys = sorted(key for key in keys if key in self.spellings)
+            for i, a in enumerate(keys):
+                for b in keys[i + 1:]:
+                    if (a, b) not in pairs and jaccard(self.grams[a], self.grams[b]) >= self.threshold:
+                        pairs.add((a, b))
+        return sorted((self.display_name(a), self.display_name(b)) for a, b in pairs)
+
+    def check(self, entry):
+        """Warnings for a new entry that looks like one already entered."""
+        warnings = []
+        url = normalize_url(entry.get('Job URL'))
+        if url and self.urls.get(url, 0) > 0:
+            warnings.append(f"The job URL {entry.get('Job URL')} was already entered.")
+        name = entry.get('Company Name')
+        key = normalize_company(name)
+        if key in self.spellings and name not in self.spellings[key]:
+            warnings.append(f"{name} is already entered as {self.display_name(key)}.")
+        elif key not in self.spellings:
+            for similar, _ in self.similar_companies(name)[:3]:
+                warnings.append(f"{name} looks like {similar}.")
+        return warnings
+
+    def duplicate_rows(self, data):
+        """Mask of rows that share a job URL, or a company and job title, with another row."""
+        mask = np.zeros(len(data), dtype=bool)
+        if 'Job URL' in data.columns:
+            urls = normalize_column(data['Job URL'], normalize_url)
+            mask |= ((urls != "") & urls.duplicated(keep=False)).to_numpy()
+        if {'Company Name', 'Job Title'} <= set(data.columns):
+            keys = normalize_column(data['Company Name'], normalize_company) + "|" \
+                + data['Job Title'].astype(str).str.lower().str.strip()
+            mask |= keys.duplicated(keep=False).to_numpy()
+        return mask
@@ -0,0 +1,195 @@
+import os
+import re
+import pickle
+import hashlib
+import logging
+import threading
+
+try:
+    from pypdf import PdfReader
+except ImportError:
+    PdfReader = None
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+INDEX_FORMAT_VERSION = 1
+
+
+def tokenize(text):
+    return set(TOKEN_PATTERN.findall(text.lower()))
+
+
+class DocumentIndex:
+    """Inverted index over the text of the stored resumes and cover letters.
+
+    folders maps a data column ("Resume Version", "Cover Letter Version") to the
+    folder holding the files that column refers to. Documents are keyed by
+    (column, filename) so query results can be joined straight onto the data.
+    """
+
+    def __init__(self, index_file, folders):
+        self.index_file = index_file
+        self.folders = folders
+        self.files = {}
+        self.postings = {}
+        self.lock = threading.Lock()
+        self.thread = None
+        self.refresh_pending = False
+        self.load()
+
+    def load(self):
+        try:
+            if os.path.exists(self.index_file):
+                with open(self.index_file, 'rb') as f:
+                    stored = pickle.load(f)
+                if stored.get("version") == INDEX_FORMAT_VERSION:
+                    self.files = stored["files"]
+                    self.rebuild_postings()
+                    logging.info(f"Document index loaded from {self.index_file} ({len(self.files)} files)")
+        except Exception as e:
+            logging.error(f"Error loading document index: {str(e)}")
+            self.files = {}
+            self.postings = {}
+
+    def save(self):
+        try:
+            with self.lock:
+                stored = {"version": INDEX_FORMAT_VERSION, "files": dict(self.files)}
+            with open(self.index_file, 'wb') as f:
+                pickle.dump(stored, f)
+        except Exception as e:
+            logging.error(f"Error saving document index: {str(e)}")
+
+    def rebuild_postings(self):
+        postings = {}
+        for key, entry in self.files.items():
+            for token in entry["tokens"]:
+                postings.setdefault(token, set()).add(key)
+        self.postings = postings
+
+    def extract_text(self, path):
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".pdf":
+            if PdfReader is None:
+                return None
+            reader = PdfReader(path)
+            return "\n".join(page.extract_text() or "" for page in reader.pages)
+        if extension in (".txt", ".md"):
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                return f.read()
+        return ""
+
+    def file_hash(self, path):
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def refresh(self):
+        """Re-index files that were added or changed since the last run and drop deleted ones."""
+        seen = set()
+        changed = False
+        for column, folder in self.folders.items():
+            if not os.path.isdir(folder):
+                continue
+            for file_name in os.listdir(folder):
+                path = os.path.join(folder, file_name)
+                if not os.path.isfile(path):
+                    continue
+                key = (column, file_name)
+                seen.add(key)
+                stat = os.stat(path)
+                entry = self.files.get(key)
+                if entry and entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size and entry["extracted"]:
+                    continue
+
+                try:
+                    file_hash = self.file_hash(path)
+                    if entry and entry["hash"] == file_hash and entry["extracted"]:
+                        # Touched but not modified, keep the existing tokens
+                        tokens = entry["tokens"]
+                        extracted = True
+                    else:
+                        text = self.extract_text(path)
+                        extracted = text is not None
+                        tokens = frozenset(tokenize(text)) if text else frozenset()
+                except Exception as e:
+                    logging.error(f"Error indexing {path}: {str(e)}")
+                    continue
+
+                with self.lock:
+                    self.remove_postings(key)
+                    self.files[key] = {"mtime": stat.st_mtime, "size": stat.st_size, "hash": file_hash,
+                                       "extracted": extracted, "tokens": tokens}
+                    for token in tokens:
+                        self.postings.setdefault(token, set()).add(key)
+                changed = True
+
+        with self.lock:
+            for key in [key for key in self.files if key not in seen]:
+                self.remove_postings(key)
+                del self.files[key]
+                changed = True
+
+        if changed:
+            self.save()
+            logging.info(f"Document index refreshed ({len(self.files)} files)")
+        return changed
+
+    def remove_postings(self, key):
+        entry = self.files.get(key)
+        if not entry:
+            return
+        for token in entry["tokens"]:
+            keys = self.postings.get(token)
+            if keys:
+                keys.discard(key)
+                if not keys:
+                    del self.postings[token]
+
+    def refresh_in_background(self):
+        """Run refresh() on a worker thread, coalescing requests made while one is running."""
+        with self.lock:
+            if self.thread and self.thread.is_alive():
+                self.refresh_pending = True
+                return
+            self.thread = threading.Thread(target=self.background_worker, daemon=True)
+            self.thread.start()
+
+    def background_worker(self):
+        while True:
+            self.refresh()
+            with self.lock:
+                if not self.refresh_pending:
+                    self.thread = None
+                    return
+                self.refresh_pending = False
+
+    def search(self, query, column=None):
+        """Return the {(column, filename)} documents containing every word of query."""
+        tokens = tokenize(query)
+        if not tokens:
+            return set()
+        with self.lock:
+            postings = sorted((self.postings.get(token, set()) for token in tokens), key=len)
+            matches = set(postings[0])
+            for keys in postings[1:]:
+                matches &= keys
+        if column is not None:
+            matches = {key for key in matches if key[0] == column}
+        return matches
+
+    def matching_rows(self, data, query, columns=None):
+        """Boolean mask over data rows whose linked documents mention query."""
+        columns = columns or list(self.folders)
+        matches = self.search(query)
+        mask = None
+        for column in columns:
+            if column not in data.columns:
+                continue
+            file_names = {file_name for key_column, file_name in matches if key_column == column}
+            column_mask = data[column].isin(file_names).to_numpy()
+            mask = column_mask if mask is None else mask | column_mask
+        if mask is None:
+            return data.index.isin([])
+        return mask
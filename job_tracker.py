@@ -1,15 +1,17 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog, filedialog, messagebox, Toplevel, StringVar, Canvas
-import pandas as pd
+from tkinter import ttk, messagebox, filedialog, filedialog, messagebox, Toplevel, StringVar, Canvas, simpledialog
 from datetime import datetime
 from tkcalendar import DateEntry
 import os
 import shutil
-import pickle
 import sys
 import babel
 import babel.numbers
 import babel.dates
+from query_engine import QueryError
+from data_store import DataStore, TK_COLUMNS, read_table, coerce_date_value
+from persistence import PersistenceService
+from dedup import DuplicateIndex
 
 class JobApplicationTracker:
     def __init__(self, master):
@@ -28,10 +30,23 @@ class JobApplicationTracker:
         os.makedirs(self.resume_folder, exist_ok=True)
         os.makedirs(self.cover_letter_folder, exist_ok=True)
 
+        # Saves are written in the background and flushed on close or when the process is terminated
+        self.persistence = PersistenceService()
+        self.persistence.install_crash_handlers()
+        # The data, search, undo/redo and storage, shared with the PyQt front-end (dates stay strings here)
+        self.store = DataStore(self.data_file, TK_COLUMNS, parse_dates=False, persistence=self.persistence)
+        self.edit_window = None
+        # Open View Entries tables, refreshed after undo/redo since their item ids are row positions
+        self.view_trees = []
+        # Normalized company names and job URLs, kept in step with the data, for duplicate warnings
+        self.duplicate_index = DuplicateIndex()
+        self.store.add_listener(self.duplicate_index.update, lambda: self.duplicate_index.build(self.data))
+
         self.load_data()
         self.create_widgets()
 
         self.master.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.check_save_errors()
     
     def resource_path(self, relative_path):
         """ Get absolute path to resource, works for dev and for PyInstaller """
@@ -40,31 +55,28 @@ class JobApplicationTracker:
             return os.path.join(sys._MEIPASS, relative_path)
         return os.path.join(os.getcwd(), relative_path)
 
+    @property
+    def data(self):
+        return self.store.data
+
     def load_data(self):
-        if os.path.exists(self.data_file):
-            with open(self.data_file, 'rb') as f:
-                self.data = pickle.load(f)
-            # Ensure the Index column exists and is correctly populated
-            if 'Index' not in self.data.columns:
-                self.data.insert(0, 'Index', range(1, len(self.data) + 1))
-            else:
-                self.data = self.data.sort_values('Index').reset_index(drop=True)
-                self.data['Index'] = range(1, len(self.data) + 1)
-        else:
-            self.data = pd.DataFrame(columns=[
-                "Index", "Company Name", "Job Title", "Application Date", "Status",
-                "Job URL", "Company Website", "Location", "Salary Range",
-                "Contact Person", "Contact Email/Phone", "Application Method",
-                "Resume Version", "Cover Letter Version", "Interview Date",
-                "Follow-up Date", "Notes", "Next Steps", "Priority"
-            ])
+        self.store.load()
 
     def save_data(self):
-        with open(self.data_file, 'wb') as f:
-            pickle.dump(self.data, f)
+        self.store.save()
+
+    def check_save_errors(self):
+        # Saves run in the background, so poll for failures to report them
+        error = self.persistence.take_error()
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to save data: {str(error)}\nIt will be saved again shortly.")
+        self.master.after(1000, self.check_save_errors)
 
     def on_closing(self):
-        self.save_data()
+        try:
+            self.store.close()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save data: {str(e)}")
         self.master.destroy()
 
     def create_widgets(self):
@@ -139,6 +151,12 @@ class JobApplicationTracker:
         ttk.Button(button_frame, text="Save to Excel", command=self.save_to_excel).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Save to CSV", command=self.save_to_csv).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Import File", command=self.import_file).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Undo", command=self.undo).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Redo", command=self.redo).pack(side=tk.LEFT, padx=5)
+        self.master.bind_all("<Control-z>", lambda e: self.undo())
+        self.master.bind_all("<Control-y>", lambda e: self.redo())
+        self.master.bind_all("<Control-Shift-Key-Z>", lambda e: self.redo())
+        self.master.bind_all("<Control-Shift-Key-z>", lambda e: self.redo())
 
 
     def toggle_date(self, field):
@@ -180,8 +198,11 @@ class JobApplicationTracker:
             else:
                 new_entry[field] = widget.get()
 
-        new_entry["Index"] = len(self.data) + 1
-        self.data = self.data._append(new_entry, ignore_index=True)
+        warnings = self.duplicate_index.check(new_entry)
+        if warnings and not messagebox.askyesno("Possible Duplicate", "\n".join(warnings) + "\n\nAdd this entry anyway?"):
+            return
+
+        self.store.add(new_entry)
         self.save_data()
         messagebox.showinfo("Success", "Entry added successfully!")
         self.clear_fields()
@@ -256,9 +277,10 @@ class JobApplicationTracker:
 
         # Add data to the treeview
         for i, row in self.data.iterrows():
-            tree.insert('', 'end', values=[row['Index']] + [row[col] for col in columns if col != 'Index'])
+            tree.insert('', 'end', iid=str(i), values=[row['Index']] + [row[col] for col in columns if col != 'Index'])
 
         tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.view_trees.append(tree)
 
         # Add Edit and Delete buttons
         button_frame = ttk.Frame(view_window)
@@ -267,6 +289,9 @@ class JobApplicationTracker:
         ttk.Button(button_frame, text="Edit", command=lambda: self.edit_entry(tree)).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Delete", command=lambda: self.delete_entry(tree)).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Delete All", command=lambda: self.delete_all_entries(tree)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Add Tag", command=lambda: self.tag_selected(tree)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Remove Tag", command=lambda: self.tag_selected(tree, remove=True)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Find Duplicates", command=lambda: self.show_duplicates(tree)).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Refresh", command=lambda: self.refresh_view(tree)).pack(side=tk.LEFT, padx=5)
 
         # Function to adjust column widths based on content
@@ -284,18 +309,22 @@ class JobApplicationTracker:
         adjust_column_widths()
     
     def search_entries(self, tree, search_term):
+        # Accepts the same field:value syntax as the PyQt app, e.g. status:Rejected applied:>=2024-07-01
+        try:
+            mask = self.store.filter(search_term)
+        except QueryError as e:
+            messagebox.showerror("Error", f"Invalid search: {str(e)}")
+            return
         tree.delete(*tree.get_children())
-        for i, row in self.data.iterrows():
-            if search_term.lower() in str(row).lower():
-                tree.insert('', 'end', values=list(row))
+        for i, row in self.data[mask].iterrows():
+            tree.insert('', 'end', iid=str(i), values=list(row))
     
     def sort_treeview(self, tree, col, reverse):
-        l = [(tree.set(k, col), k) for k in tree.get_children('')]
-        l.sort(key=lambda t: self.sort_key(t[0]), reverse=reverse)
-
-        # Rearrange items in sorted positions
-        for index, (val, k) in enumerate(l):
-            tree.move(k, '', index)
+        # Sort on the typed column in self.data (the order is cached until the data changes),
+        # then reorder the existing items in one call; item ids are the rows' data positions
+        order = self.store.sort_permutation(col, not reverse)
+        visible = set(tree.get_children(''))
+        tree.set_children('', *[str(i) for i in order if str(i) in visible])
 
         # Update the heading with an arrow indicating sort direction
         for c in tree['columns']:
@@ -306,33 +335,30 @@ class JobApplicationTracker:
         # Reverse sort next time
         tree.heading(col, command=lambda: self.sort_treeview(tree, col, not reverse))
         
-    def sort_key(self, value):
-        # Try to convert to int or float for numeric sorting
-        try:
-            return int(value)
-        except ValueError:
-            try:
-                return float(value)
-            except ValueError:
-                return value.lower()  # Fall back to case-insensitive string comparison
-
     def edit_entry(self, tree):
-        selected_item = tree.selection()
-        if not selected_item:
+        selected_items = tree.selection()
+        if not selected_items:
             messagebox.showwarning("Warning", "Please select an entry to edit.")
             return
 
-        item = tree.item(selected_item)
-        index = int(item['values'][0]) - 1  # Get the actual index from the "Index" column
-        values = item['values']
-
-        edit_window = tk.Toplevel(self.master)
-        edit_window.title("Edit Entry")
-        edit_window.geometry("800x600")
+        # The edit window is built once, then hidden on close and rebound to the next selection
+        if self.edit_window is None or not self.edit_window.winfo_exists():
+            self.create_edit_window()
+        self.bind_edit_window(tree, selected_items)
+        self.edit_window.deiconify()
+        self.edit_window.lift()
+
+    def create_edit_window(self):
+        self.edit_window = tk.Toplevel(self.master)
+        self.edit_window.geometry("800x600")
+        self.edit_window.protocol("WM_DELETE_WINDOW", self.edit_window.withdraw)
+        self.edit_fields = {}
+        self.edit_touched = set()
+        self.edit_folder_versions = {}
 
         # Create a canvas with scrollbar
-        canvas = tk.Canvas(edit_window)
-        scrollbar = ttk.Scrollbar(edit_window, orient="vertical", command=canvas.yview)
+        canvas = tk.Canvas(self.edit_window)
+        scrollbar = ttk.Scrollbar(self.edit_window, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
 
         scrollable_frame.bind(
@@ -348,75 +374,123 @@ class JobApplicationTracker:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        # Create input fields
-        entry_fields = {}
+        # Create input fields; the events mark which fields the user changed
+        entry_fields = self.edit_fields
         for i, col in enumerate(self.data.columns):
             ttk.Label(scrollable_frame, text=f"{col}:").grid(row=i, column=0, sticky=tk.W, padx=5, pady=2)
-            
+
             if col == "Application Date":
                 entry_fields[col] = DateEntry(scrollable_frame, width=20, background='darkblue', foreground='white', borderwidth=2)
-                entry_fields[col].set_date(datetime.strptime(values[i], "%Y-%m-%d") if values[i] else datetime.now())
+                entry_fields[col].bind("<<DateEntrySelected>>", lambda e, c=col: self.edit_touched.add(c))
             elif col in ["Interview Date", "Follow-up Date"]:
                 date_frame = ttk.Frame(scrollable_frame)
                 date_frame.grid(row=i, column=1, sticky=tk.W)
-                entry_fields[f"{col}_check"] = tk.BooleanVar(value=not values[i])
-                check = ttk.Checkbutton(date_frame, text="No date", variable=entry_fields[f"{col}_check"], 
+                entry_fields[f"{col}_check"] = tk.BooleanVar(value=False)
+                check = ttk.Checkbutton(date_frame, text="No date", variable=entry_fields[f"{col}_check"],
                                         command=lambda f=col: self.toggle_date_edit(f, entry_fields))
                 check.pack(side=tk.LEFT)
                 entry_fields[col] = DateEntry(date_frame, width=20, background='darkblue', foreground='white', borderwidth=2)
+                entry_fields[col].bind("<<DateEntrySelected>>", lambda e, c=col: self.edit_touched.add(c))
                 entry_fields[col].pack(side=tk.LEFT)
-                if values[i]:
-                    entry_fields[col].set_date(datetime.strptime(values[i], "%Y-%m-%d"))
-                else:
-                    entry_fields[col].config(state='disabled')
             elif col == "Status":
                 entry_fields[col] = ttk.Combobox(scrollable_frame, values=["Applied", "Interview Scheduled", "Rejected", "Offer Received"])
-                entry_fields[col].set(values[i])
             elif col == "Priority":
                 entry_fields[col] = ttk.Combobox(scrollable_frame, values=["Low", "Medium", "High"])
-                entry_fields[col].set(values[i])
             elif col in ["Resume Version", "Cover Letter Version"]:
                 file_frame = ttk.Frame(scrollable_frame)
                 file_frame.grid(row=i, column=1, sticky=tk.W)
                 entry_fields[col] = ttk.Combobox(file_frame, width=30)
                 entry_fields[col].pack(side=tk.LEFT)
                 ttk.Button(file_frame, text="Upload", command=lambda f=col: self.upload_file_edit(f, entry_fields)).pack(side=tk.LEFT)
-                self.update_file_list_edit(col, entry_fields)
-                entry_fields[col].set(values[i])
             elif col in ["Notes", "Next Steps"]:
                 entry_fields[col] = tk.Text(scrollable_frame, width=40, height=3)
-                entry_fields[col].insert(tk.END, values[i])
             else:
                 entry_fields[col] = ttk.Entry(scrollable_frame, width=40)
-                entry_fields[col].insert(0, values[i])
-            
+
+            if isinstance(entry_fields[col], ttk.Combobox):
+                entry_fields[col].bind("<<ComboboxSelected>>", lambda e, c=col: self.edit_touched.add(c))
+            if not isinstance(entry_fields[col], DateEntry):
+                entry_fields[col].bind("<KeyRelease>", lambda e, c=col: self.edit_touched.add(c))
             if col not in ["Interview Date", "Follow-up Date", "Resume Version", "Cover Letter Version"]:
                 entry_fields[col].grid(row=i, column=1, pady=2, padx=5, sticky=tk.W)
 
-        def save_edit():
-            new_values = [values[0]]  # Keep the original index
-            for col in self.data.columns[1:]:  # Skip the "Index" column
-                if col in ["Interview Date", "Follow-up Date"]:
-                    if entry_fields[f"{col}_check"].get():
-                        new_values.append("")
-                    else:
-                        new_values.append(entry_fields[col].get_date().strftime("%Y-%m-%d"))
-                elif isinstance(entry_fields[col], DateEntry):
-                    new_values.append(entry_fields[col].get_date().strftime("%Y-%m-%d"))
-                elif isinstance(entry_fields[col], tk.Text):
-                    new_values.append(entry_fields[col].get("1.0", tk.END).strip())
+        self.edit_save_button = ttk.Button(scrollable_frame, text="Save")
+        self.edit_save_button.grid(row=len(self.data.columns), column=1, pady=10)
+
+    def bind_edit_window(self, tree, selected_items):
+        # Item ids are the rows' data positions
+        positions = [int(item) for item in selected_items]
+        bulk = len(positions) > 1
+        self.edit_window.title(f"Edit {len(positions)} Entries" if bulk else "Edit Entry")
+        # With several rows the fields start blank and only the changed ones are applied
+        row = {} if bulk else self.data.iloc[positions[0]].to_dict()
+        entry_fields = self.edit_fields
+        for col in self.data.columns:
+            value = str(row.get(col, ""))
+            if col in ["Application Date", "Interview Date", "Follow-up Date"]:
+                entry_fields[col].config(state='normal')
+                date = coerce_date_value(value)
+                if date != '':
+                    entry_fields[col].set_date(date.date())
+                elif value:
+                    # Not a date we can read, e.g. "early May": show the text as it is
+                    entry_fields[col].delete(0, tk.END)
+                    entry_fields[col].insert(0, value)
                 else:
-                    new_values.append(entry_fields[col].get())
-
-            self.data.iloc[index] = new_values
-            self.save_data()
-            tree.item(selected_item, values=new_values)
-            edit_window.destroy()
-            messagebox.showinfo("Success", "Entry updated successfully!")
+                    entry_fields[col].set_date(datetime.now())
+                if col != "Application Date":
+                    entry_fields[f"{col}_check"].set(not value and not bulk)
+                    self.toggle_date_edit(col, entry_fields)
+            elif col in ["Resume Version", "Cover Letter Version"]:
+                self.update_file_list_edit(col, entry_fields)
+                entry_fields[col].set(value)
+            elif isinstance(entry_fields[col], tk.Text):
+                entry_fields[col].delete("1.0", tk.END)
+                entry_fields[col].insert(tk.END, value)
+            elif isinstance(entry_fields[col], ttk.Combobox):
+                entry_fields[col].set(value)
+            else:
+                entry_fields[col].delete(0, tk.END)
+                entry_fields[col].insert(0, value)
+        self.edit_touched = set()
+        self.edit_save_button.config(command=lambda: self.save_edit(tree, selected_items, positions))
+
+    def save_edit(self, tree, selected_items, positions):
+        entry_fields = self.edit_fields
+        columns = list(self.data.columns[1:])  # Skip the "Index" column
+        if len(positions) > 1:
+            columns = [col for col in columns if col in self.edit_touched]
+        else:
+            # An untouched date is kept as stored, so a text date is not replaced by the calendar's
+            columns = [col for col in columns if not isinstance(entry_fields[col], DateEntry) or col in self.edit_touched]
+        new_values = {}
+        for col in columns:
+            if col in ["Interview Date", "Follow-up Date"]:
+                if entry_fields[f"{col}_check"].get():
+                    new_values[col] = ""
+                else:
+                    new_values[col] = entry_fields[col].get_date().strftime("%Y-%m-%d")
+            elif isinstance(entry_fields[col], DateEntry):
+                new_values[col] = entry_fields[col].get_date().strftime("%Y-%m-%d")
+            elif isinstance(entry_fields[col], tk.Text):
+                new_values[col] = entry_fields[col].get("1.0", tk.END).strip()
+            else:
+                new_values[col] = entry_fields[col].get()
 
-        ttk.Button(scrollable_frame, text="Save", command=save_edit).grid(row=len(self.data.columns), column=1, pady=10)
+        # Several rows are updated in one vectorized step, with a single undo entry and save
+        if len(positions) == 1:
+            self.store.update(positions[0], new_values)
+        elif new_values:
+            self.store.update_many(positions, new_values)
+        self.save_data()
+        for item, position in zip(selected_items, positions):
+            tree.item(item, values=self.data.iloc[position].tolist())
+        self.edit_window.withdraw()
+        messagebox.showinfo("Success", "Entry updated successfully!" if len(positions) == 1
+                            else f"{len(positions)} entries updated successfully!")
 
     def toggle_date_edit(self, field, entry_fields):
+        self.edit_touched.add(field)
         if entry_fields[f"{field}_check"].get():
             entry_fields[field].config(state='disabled')
         else:
@@ -437,28 +511,54 @@ class JobApplicationTracker:
             folder = self.resume_folder
         else:
             folder = self.cover_letter_folder
+        # Re-list the folder only when its contents changed
+        version = os.stat(folder).st_mtime_ns
+        if self.edit_folder_versions.get(field) == version:
+            return
+        self.edit_folder_versions[field] = version
         files = [""] + [f for f in os.listdir(folder) if os.path.isfile(os.path.join(folder, f))]
         entry_fields[field]['values'] = files
 
     def delete_entry(self, tree):
-        selected_item = tree.selection()
-        if not selected_item:
+        selected_items = tree.selection()
+        if not selected_items:
             messagebox.showwarning("Warning", "Please select an entry to delete.")
             return
 
-        if messagebox.askyesno("Confirm Deletion", "Are you sure you want to delete this entry?"):
-            item = tree.item(selected_item)
-            try:
-                index = next(i for i, v in enumerate(item['values']) if str(v).isdigit()) # Find the index column
-                index_value = int(item['values'][index]) - 1  # Get the actual index from the "Index" column
-                self.data = self.data[self.data['Index'] != index_value + 1].reset_index(drop=True)
-                self.data['Index'] = range(1, len(self.data) + 1)  # Reindex the remaining entries
-                self.save_data()
-                tree.delete(selected_item)
-                self.refresh_view(tree)  # Refresh the view to update all indices
-                messagebox.showinfo("Success", "Entry deleted successfully!")
-            except ValueError:
-                messagebox.showerror("Error", "Unable to delete entry. Invalid index found.")
+        question = "Are you sure you want to delete this entry?" if len(selected_items) == 1 \
+            else f"Are you sure you want to delete these {len(selected_items)} entries?"
+        if messagebox.askyesno("Confirm Deletion", question):
+            # Item ids are the rows' data positions; all of them go in one change and one save
+            positions = [int(item) for item in selected_items]
+            self.store.delete(positions, label="Delete entry" if len(positions) == 1 else "Delete entries")
+            self.save_data()
+            self.refresh_view(tree)  # Refresh the view to update all indices
+            messagebox.showinfo("Success", "Entry deleted successfully!" if len(positions) == 1
+                                else f"{len(positions)} entries deleted successfully!")
+
+    def show_duplicates(self, tree):
+        # Show only the rows sharing a job URL, or a company and job title, with another row
+        mask = self.duplicate_index.duplicate_rows(self.data)
+        tree.delete(*tree.get_children())
+        for i, row in self.data[mask].iterrows():
+            tree.insert('', 'end', iid=str(i), values=list(row))
+        pairs = self.duplicate_index.similar_company_pairs()
+        if pairs:
+            listed = "\n".join(f"{a} / {b}" for a, b in pairs[:20])
+            messagebox.showinfo("Similar Company Names", f"These company names look alike:\n{listed}")
+
+    def tag_selected(self, tree, remove=False):
+        selected_items = tree.selection()
+        if not selected_items:
+            messagebox.showwarning("Warning", "Please select the entries to tag.")
+            return
+        tag = simpledialog.askstring("Remove Tag" if remove else "Add Tag", "Tag:", parent=tree)
+        if tag and tag.strip():
+            positions = [int(item) for item in selected_items]
+            self.store.tag_many(positions, tag, remove=remove)
+            self.save_data()
+            for item, position in zip(selected_items, positions):
+                tree.item(item, values=self.data.iloc[position].tolist())
 
     def save_to_excel(self):
         default_filename = "job_application_tracker.xlsx"
@@ -468,7 +568,7 @@ class JobApplicationTracker:
             initialfile=default_filename
         )
         if file_path:
-            self.data.to_excel(file_path, index=False)
+            self.store.export(file_path)
             messagebox.showinfo("Success", f"Data saved to {file_path}")
 
     def save_to_csv(self):
@@ -479,7 +579,7 @@ class JobApplicationTracker:
             initialfile=default_filename
         )
         if file_path:
-            self.data.to_csv(file_path, index=False)
+            self.store.export(file_path)
             messagebox.showinfo("Success", f"Data saved to {file_path}")
     
     def import_file(self):
@@ -491,10 +591,7 @@ class JobApplicationTracker:
             return
 
         try:
-            if file_path.endswith('.xlsx'):
-                imported_df = pd.read_excel(file_path)
-            else:
-                imported_df = pd.read_csv(file_path)
+            imported_df = read_table(file_path)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to read file: {str(e)}")
             return
@@ -540,20 +637,11 @@ class JobApplicationTracker:
             combo.set(default_value)
 
         def apply_mapping():
-            new_data = pd.DataFrame(columns=self.data.columns)
-            for app_col, import_col in mapping.items():
-                if import_col.get() and app_col != "Index":
-                    # Handle empty cells
-                    new_data[app_col] = imported_df[import_col.get()].fillna('').astype(str).replace('nan', '')
-            
-            # Add Index column
-            new_data['Index'] = range(1, len(new_data) + 1)
-            
-            # Reorder columns to ensure Index is first
-            new_data = new_data[['Index'] + [col for col in new_data.columns if col != 'Index']]
-            
+            new_data = self.store.mapped_frame(imported_df, {
+                app_col: import_col.get() for app_col, import_col in mapping.items() if import_col.get()})
+
             # Replace the current data with the new data
-            self.data = new_data
+            self.store.replace(new_data)
             self.save_data()
             mapping_window.destroy()
             messagebox.showinfo("Success", "Data imported successfully! All previous entries have been replaced.")
@@ -561,17 +649,32 @@ class JobApplicationTracker:
         ttk.Button(scrollable_frame, text="Import", command=apply_mapping).pack(pady=10)
     
     def delete_all_entries(self, tree):
-        if messagebox.askyesno("Confirm Deletion", "Are you sure you want to delete all entries? This action cannot be undone."):
-            self.data = pd.DataFrame(columns=self.data.columns)
+        if messagebox.askyesno("Confirm Deletion", "Are you sure you want to delete all entries?"):
+            self.store.delete(range(len(self.data)), label="Delete all")
             self.save_data()
             self.refresh_view(tree)
             messagebox.showinfo("Success", "All entries have been deleted.")
     
+    def undo(self):
+        if self.store.undo() is not None:
+            self.save_data()
+            self.refresh_open_views()
+
+    def redo(self):
+        if self.store.redo() is not None:
+            self.save_data()
+            self.refresh_open_views()
+
+    def refresh_open_views(self):
+        self.view_trees = [tree for tree in self.view_trees if tree.winfo_exists()]
+        for tree in self.view_trees:
+            self.refresh_view(tree)
+
     def refresh_view(self, tree):
         for item in tree.get_children():
             tree.delete(item)
         for i, row in self.data.iterrows():
-            tree.insert('', 'end', values=list(row))
+            tree.insert('', 'end', iid=str(i), values=list(row))
 
 if __name__ == "__main__":
     root = tk.Tk()
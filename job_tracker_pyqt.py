@@ -2,28 +2,47 @@ import sys
 import os
 import pandas as pd
 from datetime import datetime
-import pickle
 import logging
 import shutil
 import numpy as np
 import matplotlib
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                             QLabel, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem, 
+                             QLabel, QLineEdit, QPushButton, QTableView, QAbstractItemView,
                              QComboBox, QDateEdit, QTextEdit, QFileDialog, QMessageBox, 
                              QScrollArea, QCheckBox, QHeaderView, QGridLayout, QDialog, 
-                             QTabWidget, QSizePolicy)
-from PyQt6.QtCore import Qt, QDate, QSortFilterProxyModel, QSize
-from PyQt6.QtGui import QStandardItemModel, QStandardItem
-import textwrap
+                             QTabWidget, QSizePolicy, QInputDialog, QSystemTrayIcon, QStyle,
+                             QSpinBox, QListWidget)
+from PyQt6.QtCore import Qt, QDate, QSortFilterProxyModel, QSize, QAbstractTableModel, QModelIndex, QTimer
+from PyQt6.QtGui import QStandardItemModel, QStandardItem, QShortcut, QKeySequence, QImage, QPixmap
+from document_index import DocumentIndex
+from query_engine import QueryError
+from data_store import DataStore, PYQT_COLUMNS, read_table
+from render_cache import RenderCache
+import timeseries_plot
+from timeseries_plot import TimeSeriesPlotWidget
+from status_history import StatusHistory
+from persistence import PersistenceService
+from reminders import DateIndex
+from dedup import DuplicateIndex
+from analytics import ConversionAnalytics
+from dashboard import DashboardCharts, CHART_COLUMNS
+
+# Columns kept in the data but never shown as form fields or table columns
+HIDDEN_COLUMNS = ["Index", "Application ID"]
+
+# "pyqtgraph" draws the time-series charts as interactive, decimated plots when pyqtgraph is
+# installed; "matplotlib" keeps the static charts
+PLOT_BACKEND = os.environ.get("JOB_TRACKER_PLOT_BACKEND", "pyqtgraph")
 
 # Set up logging
 logging.basicConfig(filename='app.log', level=logging.DEBUG, 
                     format='%(asctime)s - %(levelname)s - %(message)s')
 
-class JobApplicationTracker(QMainWindow):
+
+class JobApplicationTracker(QMainWindow, DashboardCharts):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Job Application Tracker")
@@ -37,6 +56,49 @@ class JobApplicationTracker(QMainWindow):
         os.makedirs(self.resume_folder, exist_ok=True)
         os.makedirs(self.cover_letter_folder, exist_ok=True)
 
+        # Full-text index over the resumes and cover letters, kept up to date in the background
+        self.document_index = DocumentIndex(os.path.join(self.app_data_dir, "document_index.pkl"),
+                                            {"Resume Version": self.resume_folder,
+                                             "Cover Letter Version": self.cover_letter_folder})
+        self.document_index.refresh_in_background()
+
+        # Log of status transitions, so the dashboard can show real funnels and response times
+        self.status_history = StatusHistory(os.path.join(self.app_data_dir, "status_history.pkl"))
+
+        # Interview and follow-up dates in date order, for reminders
+        self.date_index = DateIndex()
+        self.shown_reminders = set()
+
+        # Normalized company names and job URLs, for duplicate warnings and canonical company names
+        self.duplicate_index = DuplicateIndex()
+
+        # Conversion rates and time to interview, recomputed once per data version
+        self.analytics = ConversionAnalytics()
+
+        # Saves are coalesced and written on a background thread; pending ones are flushed on close
+        # and when the process is terminated
+        self.persistence = PersistenceService()
+        self.persistence.register("status history", self.status_history.snapshot, self.status_history.write)
+        self.persistence.install_crash_handlers()
+        # Python signal handlers only run when the interpreter gets control, so wake it up regularly;
+        # the same tick reports saves that failed in the background
+        self.signal_timer = QTimer(self)
+        self.signal_timer.timeout.connect(self.check_save_errors)
+        self.signal_timer.start(500)
+
+        # The data, search, undo/redo and storage, shared with the Tk front-end. The dashboard
+        # aggregates listen to it so they are updated row by row.
+        self.store = DataStore(self.data_file, PYQT_COLUMNS, persistence=self.persistence)
+        self.store.add_listener(self.update_aggregates, self.rebuild_aggregates, self.record_bulk_statuses)
+        # Structured search for View Entries, e.g. status:Rejected applied:>=2024-07-01 mentions:kubernetes
+        self.store.query_engine.register_field("mentions", lambda data, value: self.document_index.matching_rows(data, value))
+
+        # Rendered dashboard images, also kept on disk so a restart paints the dashboard without re-rendering
+        self.render_cache = RenderCache(cache_dir=os.path.join(self.app_data_dir, "render_cache"))
+        self.chart_widgets = {}
+        self.column_fingerprints = {}
+        self.edit_panel = None
+
         self.required_fields = ["Company Name", "Job Title", "Status", "Company Website", "Location", "Application Method", "Resume Version", "Term"]
 
         self.total_apps_label = None
@@ -50,45 +112,41 @@ class JobApplicationTracker(QMainWindow):
 
         self.init_ui()
 
+        # Notify about interviews and follow-ups due today or overdue, checking again every minute
+        self.tray_icon = None
+        if QSystemTrayIcon.isSystemTrayAvailable():
+            self.tray_icon = QSystemTrayIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxInformation), self)
+            self.tray_icon.show()
+        self.reminder_timer = QTimer(self)
+        self.reminder_timer.timeout.connect(self.check_reminders)
+        self.reminder_timer.start(60 * 1000)
+        self.check_reminders()
+
     def load_data(self):
         try:
-            if os.path.exists(self.data_file):
-                with open(self.data_file, 'rb') as f:
-                    self.data = pickle.load(f)
-                logging.info(f"Data loaded successfully from {self.data_file}")
-                # Convert date columns to datetime
-                date_columns = ['Application Date', 'Interview Date', 'Follow-up Date']
-                for col in date_columns:
-                    self.data[col] = self.data[col].apply(lambda x: pd.to_datetime(x, format='%Y-%m-%d') if x and pd.notna(x) else '')
-                logging.info(f"Data loaded successfully from {self.data_file}")
-            else:
-                self.data = pd.DataFrame(columns=[
-                    "Index", "Company Name", "Job Title", "Position", "Industry", "Term",
-                    "Application Date", "Status", "Job URL", "Company Website", "Location", 
-                    "Salary Range", "Contact Person", "Contact Email/Phone", "Application Method",
-                    "Resume Version", "Cover Letter Version", "Interview Date", "Follow-up Date", 
-                    "Notes", "Next Steps", "Priority"
-                ])
-                logging.info("New data file created")
+            self.store.load()
         except Exception as e:
             logging.error(f"Error loading data: {str(e)}")
             QMessageBox.critical(self, "Error", f"Failed to load data: {str(e)}\nCreating new data file.")
-            self.data = pd.DataFrame(columns=[
-                "Index", "Company Name", "Job Title", "Position", "Industry", "Term",
-                "Application Date", "Status", "Job URL", "Company Website", "Location", 
-                "Salary Range", "Contact Person", "Contact Email/Phone", "Application Method",
-                "Resume Version", "Cover Letter Version", "Interview Date", "Follow-up Date", 
-                "Notes", "Next Steps", "Priority"
-            ])
+            self.store.clear()
 
     def save_data(self):
+        # Only schedules the write; see PersistenceService
+        self.store.save()
+        self.persistence.mark_dirty("status history")
+
+    def check_save_errors(self):
+        error = self.persistence.take_error()
+        if error is not None:
+            QMessageBox.critical(self, "Error", f"Failed to save data: {str(error)}\nIt will be saved again shortly.")
+
+    def closeEvent(self, event):
         try:
-            with open(self.data_file, 'wb') as f:
-                pickle.dump(self.data, f)
-            logging.info(f"Data saved successfully to {self.data_file}")
+            self.store.close()
         except Exception as e:
             logging.error(f"Error saving data: {str(e)}")
             QMessageBox.critical(self, "Error", f"Failed to save data: {str(e)}")
+        super().closeEvent(event)
     
     def populate_file_list(self, folder):
         return [""] + [f for f in os.listdir(folder) if os.path.isfile(os.path.join(folder, f))]
@@ -103,7 +161,7 @@ class JobApplicationTracker(QMainWindow):
         self.fields = {}
         row = 0
         for field in self.data.columns:
-            if field != "Index" and not field.endswith("_check"):
+            if field not in HIDDEN_COLUMNS and not field.endswith("_check"):
                 if field in self.required_fields:
                     label = QLabel(f"{field}")
                     asterisk = QLabel("*")
@@ -189,6 +247,20 @@ class JobApplicationTracker(QMainWindow):
         import_button.clicked.connect(self.import_file)
         button_layout.addWidget(import_button)
 
+        undo_button = QPushButton("Undo")
+        undo_button.clicked.connect(self.undo)
+        button_layout.addWidget(undo_button)
+        QShortcut(QKeySequence.StandardKey.Undo, self, activated=self.undo)
+
+        redo_button = QPushButton("Redo")
+        redo_button.clicked.connect(self.redo)
+        button_layout.addWidget(redo_button)
+
+        reminders_button = QPushButton("Reminders")
+        reminders_button.clicked.connect(self.show_reminders)
+        button_layout.addWidget(reminders_button)
+        QShortcut(QKeySequence.StandardKey.Redo, self, activated=self.redo)
+
         self.main_layout.addLayout(button_layout)
 
         self.init_dashboard()
@@ -197,6 +269,41 @@ class JobApplicationTracker(QMainWindow):
         self.total_apps_label = QLabel(f"Total Applications: {len(self.data)}")
         self.main_layout.addWidget(self.total_apps_label)
 
+    def check_reminders(self):
+        # Overdue reminders count too, so one missed while the app was closed is still shown
+        due = [entry for entry in self.date_index.due_by() if entry not in self.shown_reminders]
+        if not due:
+            return
+        self.shown_reminders.update(due)
+        lines = [self.date_index.describe(entry) for entry in due]
+        logging.info(f"{len(due)} reminder(s) due or overdue")
+        if self.tray_icon is not None:
+            self.tray_icon.showMessage("Due", "\n".join(lines))
+        else:
+            self.statusBar().showMessage("Due: " + "; ".join(lines))
+
+    def show_reminders(self):
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Upcoming Interviews and Follow-ups")
+        layout = QVBoxLayout(dialog)
+        days_layout = QHBoxLayout()
+        days_layout.addWidget(QLabel("Next days:"))
+        days_input = QSpinBox()
+        days_input.setRange(0, 365)
+        days_input.setValue(7)
+        days_layout.addWidget(days_input)
+        layout.addLayout(days_layout)
+        reminder_list = QListWidget()
+        layout.addWidget(reminder_list)
+
+        def fill(days):
+            reminder_list.clear()
+            reminder_list.addItems([self.date_index.describe(entry) for entry in self.date_index.due_within(days)])
+        days_input.valueChanged.connect(fill)
+        fill(days_input.value())
+        dialog.resize(500, 400)
+        dialog.show()
+
     def upload_file(self, file_type, combo_box=None):
         file_path, _ = QFileDialog.getOpenFileName(self, f"Upload {file_type.replace('_', ' ').title()}", "", "All Files (*)")
         if file_path:
@@ -222,6 +329,7 @@ class JobApplicationTracker(QMainWindow):
             
             dest_path = os.path.join(dest_folder, file_name)
             shutil.copy2(file_path, dest_path)
+            self.document_index.refresh_in_background()
             
             combo_box.addItem(file_name)
             combo_box.setCurrentText(file_name)
@@ -242,7 +350,7 @@ class JobApplicationTracker(QMainWindow):
         missing_fields = []
 
         for field in self.data.columns:
-            if field != "Index":
+            if field not in HIDDEN_COLUMNS:
                 if field in self.required_fields:
                     if isinstance(self.fields[field], QComboBox):
                         if not self.fields[field].currentText():
@@ -268,8 +376,12 @@ class JobApplicationTracker(QMainWindow):
             QMessageBox.warning(self, "Missing Fields", f"Please fill in the following required fields: {', '.join(missing_fields)}")
             return
 
-        new_entry["Index"] = len(self.data) + 1
-        self.data = self.data._append(new_entry, ignore_index=True)
+        warnings = self.duplicate_index.check(new_entry)
+        if warnings and QMessageBox.question(self, "Possible Duplicate", "\n".join(warnings) + "\n\nAdd this entry anyway?") \
+                != QMessageBox.StandardButton.Yes:
+            return
+
+        self.store.add(new_entry)
         self.save_data()
         self.update_dashboard()
         self.update_total_apps_count()
@@ -299,31 +411,38 @@ class JobApplicationTracker(QMainWindow):
         search_layout = QHBoxLayout()
         search_label = QLabel("Search:")
         self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText('e.g. status:Rejected company:"Acme" applied:>=2024-07-01 priority:High')
         self.search_input.textChanged.connect(self.filter_table)
         search_layout.addWidget(search_label)
         search_layout.addWidget(self.search_input)
+        document_label = QLabel("Resume/Cover Letter mentions:")
+        self.document_search_input = QLineEdit()
+        self.document_search_input.textChanged.connect(self.filter_table)
+        search_layout.addWidget(document_label)
+        search_layout.addWidget(self.document_search_input)
         layout.addLayout(search_layout)
 
-        # Table
-        self.table = QTableWidget()
+        # Table, rendered from self.data through the model's sort/filter permutation
+        self.table = QTableView()
         
         # Filter out the columns we don't want to display
-        display_columns = [col for col in self.data.columns if not col.endswith('_check') and col != "Index"]
+        display_columns = [col for col in self.data.columns if not col.endswith('_check') and col not in HIDDEN_COLUMNS]
         
-        self.table.setColumnCount(len(display_columns))
-        self.table.setHorizontalHeaderLabels(display_columns)
-        self.table.setRowCount(len(self.data))
+        self.table_model = DataFrameTableModel(self, display_columns)
+        self.table.setModel(self.table_model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
 
-        # Set column widths
+        # Set column widths, sizing from a sample of rows rather than every row
         header = self.table.horizontalHeader()
+        header.setResizeContentsPrecision(200)
         for i in range(len(display_columns)):
             header.setSectionResizeMode(i, QHeaderView.ResizeMode.ResizeToContents)
 
-        # Enable sorting
+        # Enable sorting, starting out in entry order
+        header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         self.table.setSortingEnabled(True)
 
-        self.refresh_table(self.table, display_columns)
-
         layout.addWidget(self.table)
 
         button_layout = QHBoxLayout()
@@ -336,199 +455,140 @@ class JobApplicationTracker(QMainWindow):
         delete_button.clicked.connect(self.delete_entry)
         button_layout.addWidget(delete_button)
 
-        layout.addLayout(button_layout)
-
-        self.view_window.show()
-
-
-    def filter_table(self):
-        search_text = self.search_input.text().lower()
-        for row in range(self.table.rowCount()):
-            match = False
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row, col)
-                if item and search_text in item.text().lower():
-                    match = True
-                    break
-            self.table.setRowHidden(row, not match)
-
-    def edit_entry(self):
-        selected_items = self.table.selectedItems()
-        if not selected_items:
-            QMessageBox.warning(self, "Warning", "Please select an entry to edit.")
-            return
+        # Batch operations on all selected entries
+        self.bulk_status_combo = QComboBox()
+        self.bulk_status_combo.addItems(["Applied", "Interview Scheduled", "Rejected", "Offer Received"])
+        button_layout.addWidget(self.bulk_status_combo)
+        status_button = QPushButton("Set Status")
+        status_button.clicked.connect(lambda: self.set_status_selected(self.bulk_status_combo.currentText()))
+        button_layout.addWidget(status_button)
 
-        row = selected_items[0].row()
-        edit_window = QWidget()
-        edit_window.setWindowTitle("Edit Entry")
-        edit_window.setGeometry(300, 300, 600, 800)
-        layout = QVBoxLayout(edit_window)
+        tag_button = QPushButton("Add Tag")
+        tag_button.clicked.connect(lambda: self.tag_selected(remove=False))
+        button_layout.addWidget(tag_button)
 
-        scroll_area = QScrollArea()
-        scroll_widget = QWidget()
-        scroll_layout = QGridLayout(scroll_widget)
-        scroll_layout.setColumnStretch(1, 1)
+        untag_button = QPushButton("Remove Tag")
+        untag_button.clicked.connect(lambda: self.tag_selected(remove=True))
+        button_layout.addWidget(untag_button)
 
-        edit_fields = {}
-        grid_row = 0
-        for col in self.data.columns:
-            if col != "Index" and not col.endswith("_check"):
-                field_layout = QHBoxLayout()
-                
-                if col in self.required_fields:
-                    label = QLabel(f"{col}")
-                    asterisk = QLabel("*")
-                    asterisk.setStyleSheet("color: red")
-                    label_layout = QHBoxLayout()
-                    label_layout.addWidget(label)
-                    label_layout.addWidget(asterisk)
-                    label_layout.addStretch()
-                    scroll_layout.addLayout(label_layout, grid_row, 0)
-                else:
-                    label = QLabel(f"{col}:")
-                    scroll_layout.addWidget(label, grid_row, 0)
+        duplicates_button = QPushButton("Find Duplicates")
+        duplicates_button.clicked.connect(self.show_duplicates)
+        button_layout.addWidget(duplicates_button)
 
-                if col in ["Application Date", "Interview Date", "Follow-up Date"]:
-                    date_layout = QHBoxLayout()
-                    edit_fields[col] = QDateEdit()
-                    edit_fields[col].setCalendarPopup(True)
-                    date_value = self.data.iloc[row][col]
-                    if pd.notna(date_value):
-                        edit_fields[col].setDate(QDate.fromString(str(date_value)[:10], "yyyy-MM-dd"))
-                    date_layout.addWidget(edit_fields[col])
-                    
-                    if col in ["Interview Date", "Follow-up Date"]:
-                        check_box = QCheckBox("No date")
-                        check_box.stateChanged.connect(lambda state, f=col: self.toggle_date_edit(f, state, edit_fields))
-                        check_box.setChecked(pd.isna(date_value))
-                        date_layout.addWidget(check_box)
-                        edit_fields[f"{col}_check"] = check_box  # Store the checkbox in edit_fields
-                    
-                    scroll_layout.addLayout(date_layout, grid_row, 1)
-                elif col == "Status":
-                    edit_fields[col] = QComboBox()
-                    edit_fields[col].addItems(["Applied", "Interview Scheduled", "Rejected", "Offer Received"])
-                    edit_fields[col].setCurrentText(str(self.data.iloc[row][col]))
-                    scroll_layout.addWidget(edit_fields[col], grid_row, 1)
-                elif col == "Priority":
-                    edit_fields[col] = QComboBox()
-                    edit_fields[col].addItems(["", "Low", "Medium", "High"])
-                    edit_fields[col].setCurrentText(str(self.data.iloc[row][col]))
-                    scroll_layout.addWidget(edit_fields[col], grid_row, 1)
-                elif col == "Application Method":
-                    edit_fields[col] = QComboBox()
-                    edit_fields[col].addItems(["Company's Website", "LinkedIn", "Indeed", "Glassdoor", "Referral", "Email", "Other"])
-                    edit_fields[col].setCurrentText(str(self.data.iloc[row][col]))
-                    scroll_layout.addWidget(edit_fields[col], grid_row, 1)
-                elif col in ["Resume Version", "Cover Letter Version"]:
-                    edit_fields[col] = QComboBox()
-                    if col == "Resume Version":
-                        edit_fields[col].addItems(self.populate_file_list(self.resume_folder))
-                        upload_button = QPushButton("Upload Resume")
-                        upload_button.clicked.connect(lambda: self.upload_file("resume", edit_fields[col]))
-                    else:
-                        edit_fields[col].addItems(self.populate_file_list(self.cover_letter_folder))
-                        upload_button = QPushButton("Upload Cover Letter")
-                        upload_button.clicked.connect(lambda: self.upload_file("cover_letter", edit_fields[col]))
-                    edit_fields[col].setCurrentText(str(self.data.iloc[row][col]))
-                    field_layout.addWidget(edit_fields[col])
-                    field_layout.addWidget(upload_button)
-                    scroll_layout.addLayout(field_layout, grid_row, 1)
-                elif col in ["Notes", "Next Steps"]:
-                    edit_fields[col] = QTextEdit()
-                    edit_fields[col].setText(str(self.data.iloc[row][col]))
-                    scroll_layout.addWidget(edit_fields[col], grid_row, 1)
-                else:
-                    edit_fields[col] = QLineEdit()
-                    edit_fields[col].setText(str(self.data.iloc[row][col]))
-                    scroll_layout.addWidget(edit_fields[col], grid_row, 1)
-
-                grid_row += 1
+        layout.addLayout(button_layout)
 
-        scroll_area.setWidget(scroll_widget)
-        scroll_area.setWidgetResizable(True)
-        layout.addWidget(scroll_area)
+        self.view_window.show()
 
-        save_button = QPushButton("Save")
-        save_button.clicked.connect(lambda: self.save_edit(row, edit_fields, edit_window))
-        layout.addWidget(save_button)
 
-        edit_window.show()
+    def filter_table(self):
+        # Evaluate the query once over the data, then show table rows by their data position
+        try:
+            mask = self.store.filter(self.search_input.text())
+        except QueryError as e:
+            self.search_input.setStyleSheet("border: 1px solid red")
+            self.search_input.setToolTip(str(e))
+            return
+        self.search_input.setStyleSheet("")
+        self.search_input.setToolTip("")
 
-    def toggle_date_edit(self, field, state, edit_fields):
-        if state == Qt.CheckState.Checked.value:
-            edit_fields[field].setEnabled(False)
-        else:
-            edit_fields[field].setEnabled(True)
+        document_text = self.document_search_input.text().strip()
+        if document_text:
+            mask &= self.document_index.matching_rows(self.data, document_text)
 
-    def save_edit(self, row, edit_fields, edit_window):
-        missing_fields = []
-        updated_data = {}
+        self.table_model.set_filter(mask)
 
-        for col, widget in edit_fields.items():
-            if col.endswith("_check"):
-                continue  # Skip the check boxes, we'll handle them with their corresponding date fields
-
-            if col in self.required_fields:
-                if isinstance(widget, QComboBox) and not widget.currentText():
-                    missing_fields.append(col)
-                elif isinstance(widget, QLineEdit) and not widget.text():
-                    missing_fields.append(col)
-                elif isinstance(widget, QTextEdit) and not widget.toPlainText():
-                    missing_fields.append(col)
-
-            if col in ["Interview Date", "Follow-up Date"]:
-                if f"{col}_check" in edit_fields and edit_fields[f"{col}_check"].isChecked():
-                    updated_data[col] = ""  # Use None for empty dates
-                else:
-                    updated_data[col] = widget.date().toString("yyyy-MM-dd")
-            elif isinstance(widget, QDateEdit):
-                updated_data[col] = widget.date().toString("yyyy-MM-dd")
-            elif isinstance(widget, QTextEdit):
-                updated_data[col] = widget.toPlainText()
-            elif isinstance(widget, QComboBox):
-                updated_data[col] = widget.currentText()
-            elif isinstance(widget, QLineEdit):
-                updated_data[col] = widget.text()
+    def selected_data_rows(self):
+        # Map the selected table rows back to positions in self.data
+        return [self.table_model.data_row(index.row()) for index in self.table.selectionModel().selectedRows()]
 
-        if missing_fields:
-            QMessageBox.warning(self, "Missing Fields", f"Please fill in the following required fields: {', '.join(missing_fields)}")
+    def edit_entry(self):
+        selected_rows = self.selected_data_rows()
+        if not selected_rows:
+            QMessageBox.warning(self, "Warning", "Please select an entry to edit.")
             return
 
-        updated_data["Index"] = row + 1
-        self.data.iloc[row] = updated_data
+        # The edit window is built once and rebound to the selection
+        if self.edit_panel is None:
+            self.edit_panel = EditPanel(self)
+        self.edit_panel.bind(selected_rows)
+        self.edit_panel.show()
+        self.edit_panel.raise_()
+
+    def save_edit(self, rows, updated_data):
+        # Several rows are updated in one vectorized step, with a single undo entry and save
+        if len(rows) == 1:
+            changed = self.store.update(rows[0], updated_data)
+        else:
+            changed = self.store.update_many(rows, updated_data)
 
         self.save_data()
-        self.refresh_table(self.table, display_columns=[col for col in self.data.columns if not col.endswith('_check') and col != "Index"])
-        self.update_dashboard()
-        edit_window.close()
-        QMessageBox.information(self, "Success", "Entry updated successfully!")
+        self.refresh_table()
+        self.update_dashboard(changed)
+        self.edit_panel.close()
+        QMessageBox.information(self, "Success", "Entry updated successfully!" if len(rows) == 1
+                                else f"{len(rows)} entries updated successfully!")
 
     def delete_entry(self):
-        selected_items = self.table.selectedItems()
-        if not selected_items:
+        selected_rows = self.selected_data_rows()
+        if not selected_rows:
             QMessageBox.warning(self, "Warning", "Please select an entry to delete.")
             return
 
-        row = selected_items[0].row()
-        if QMessageBox.question(self, "Confirm Deletion", "Are you sure you want to delete this entry?") == QMessageBox.StandardButton.Yes:
-            self.data = self.data.drop(self.data.index[row]).reset_index(drop=True)
-            self.data['Index'] = range(1, len(self.data) + 1)
-            self.save_data()
-            self.refresh_table(self.table)
-            self.update_dashboard()
-            self.update_total_apps_count()
-            QMessageBox.information(self, "Success", "Entry deleted successfully!")
-
-    def refresh_table(self, table, display_columns):
-        table.setRowCount(len(self.data))
-
-        for i, (_, row) in enumerate(self.data.iterrows()):
-            for j, col in enumerate(display_columns):
-                if col != "Index":
-                    item = QTableWidgetItem(str(row[col]))
-                    item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)  # Make item read-only
-                    table.setItem(i, j, item)
+        question = "Are you sure you want to delete this entry?" if len(selected_rows) == 1 \
+            else f"Are you sure you want to delete these {len(selected_rows)} entries?"
+        if QMessageBox.question(self, "Confirm Deletion", question) == QMessageBox.StandardButton.Yes:
+            # All selected rows go in one change: one undo step, one save, one table and dashboard update
+            self.store.delete(selected_rows, label="Delete entry" if len(selected_rows) == 1 else "Delete entries")
+            self.after_store_change(None)
+            QMessageBox.information(self, "Success", "Entry deleted successfully!" if len(selected_rows) == 1
+                                    else f"{len(selected_rows)} entries deleted successfully!")
+
+    def show_duplicates(self):
+        # Show only the rows sharing a job URL, or a company and job title, with another row
+        self.table_model.set_filter(self.duplicate_index.duplicate_rows(self.data))
+        pairs = self.duplicate_index.similar_company_pairs()
+        if pairs:
+            listed = "\n".join(f"{a} / {b}" for a, b in pairs[:20])
+            more = f"\n... and {len(pairs) - 20} more" if len(pairs) > 20 else ""
+            QMessageBox.information(self, "Similar Company Names", f"These company names look alike:\n{listed}{more}")
+
+    def set_status_selected(self, status):
+        selected_rows = self.selected_data_rows()
+        if not selected_rows:
+            QMessageBox.warning(self, "Warning", "Please select the entries to change.")
+            return
+        self.after_store_change(self.store.update_many(selected_rows, {"Status": status}, label=f"Set status {status}"))
+
+    def tag_selected(self, remove=False):
+        selected_rows = self.selected_data_rows()
+        if not selected_rows:
+            QMessageBox.warning(self, "Warning", "Please select the entries to tag.")
+            return
+        tag, ok = QInputDialog.getText(self, "Remove Tag" if remove else "Add Tag", "Tag:")
+        if ok and tag.strip():
+            self.after_store_change(self.store.tag_many(selected_rows, tag, remove=remove))
+
+    def refresh_table(self):
+        # Re-applying the filter also rebuilds the model's row order for the new data version
+        self.filter_table()
+
+    def undo(self):
+        changed = self.store.undo()
+        if changed is not None:
+            self.after_store_change(changed)
+
+    def redo(self):
+        changed = self.store.redo()
+        if changed is not None:
+            self.after_store_change(changed)
+
+    def after_store_change(self, changed):
+        # One save, table refresh and dashboard update per change, however many rows it touched
+        self.save_data()
+        if hasattr(self, 'table_model'):
+            self.refresh_table()
+        self.update_dashboard(changed)
+        self.update_total_apps_count()
 
     def save_as(self):
         options = QFileDialog.Option.DontUseNativeDialog
@@ -540,11 +600,11 @@ class JobApplicationTracker(QMainWindow):
             if selected_filter == "Excel Files (*.xlsx)":
                 if not file_name.endswith('.xlsx'):
                     file_name += '.xlsx'
-                self.data.to_excel(file_name, index=False)
+                self.store.export(file_name)
             elif selected_filter == "CSV Files (*.csv)":
                 if not file_name.endswith('.csv'):
                     file_name += '.csv'
-                self.data.to_csv(file_name, index=False)
+                self.store.export(file_name)
             
             QMessageBox.information(self, "Success", f"Data saved to {file_name}")
 
@@ -554,11 +614,8 @@ class JobApplicationTracker(QMainWindow):
             return
 
         try:
-            if file_path.endswith('.xlsx'):
-                imported_df = pd.read_excel(file_path)
-            else:
-                imported_df = pd.read_csv(file_path)
-            
+            imported_df = read_table(file_path)
+
             # Create a mapping dialog
             mapping_dialog = QDialog(self)
             mapping_dialog.setWindowTitle("Column Mapping")
@@ -566,7 +623,7 @@ class JobApplicationTracker(QMainWindow):
 
             mapping = {}
             for col in self.data.columns:
-                if col != "Index" and not col.endswith("_check"):
+                if col not in HIDDEN_COLUMNS and not col.endswith("_check"):
                     row_layout = QHBoxLayout()
                     row_layout.addWidget(QLabel(f"Map '{col}' to:"))
                     combo = QComboBox()
@@ -585,25 +642,11 @@ class JobApplicationTracker(QMainWindow):
             result = mapping_dialog.exec()
 
             if result == QDialog.DialogCode.Accepted:
-                new_data = pd.DataFrame()
-                for col, combo in mapping.items():
-                    mapped_col = combo.currentText()
-                    if mapped_col != "-- Skip --":
-                        new_data[col] = imported_df[mapped_col]
-                    else:
-                        new_data[col] = ""
-
-                # Handle null values
-                new_data = new_data.replace({np.nan: '', 'nan': '', 'NaN': ''})
-
-                # Ensure 'Index' column is present and correct
-                new_data['Index'] = range(1, len(new_data) + 1)
-
-                # Reorder columns to ensure Index is first
-                new_data = new_data[['Index'] + [col for col in new_data.columns if col != 'Index']]
+                new_data = self.store.mapped_frame(imported_df, {
+                    col: combo.currentText() for col, combo in mapping.items() if combo.currentText() != "-- Skip --"})
 
                 if QMessageBox.question(self, "Confirm Import", "This will replace your current data. Are you sure?") == QMessageBox.StandardButton.Yes:
-                    self.data = new_data
+                    self.store.replace(new_data)
                     self.save_data()
                     QMessageBox.information(self, "Success", "Data imported successfully!")
                 
@@ -623,38 +666,8 @@ class JobApplicationTracker(QMainWindow):
         scroll_content = QWidget()
         scroll_layout = QVBoxLayout(scroll_content)
 
-        # Create plots
-        self.status_pie_fig, status_pie_canvas = self.create_status_pie()
-        self.company_bar_fig, company_bar_canvas = self.create_company_bar()
-        self.timeline_line_fig, timeline_line_canvas = self.create_timeline_line()
-        self.job_title_bar_fig, job_title_bar_canvas = self.create_job_title_bar()
-        self.term_bar_fig, term_bar_canvas = self.create_term_bar()
-        self.application_method_bar_fig, application_method_bar_canvas = self.create_application_method_bar()
-        self.resume_cover_letter_bar_fig, resume_cover_letter_bar_canvas = self.create_resume_cover_letter_bar()
-        self.status_stacked_area_fig, status_stacked_area_canvas = self.create_status_stacked_area()
-        self.industry_pie_fig, industry_pie_canvas = self.create_industry_pie()
-
-        # Create scalable graph widgets
-        status_pie_widget = ScalableGraphWidget(self.status_pie_fig, status_pie_canvas, 'Applications by Status', fixed_height=500, legend=True)
-        company_bar_widget = ScalableGraphWidget(self.company_bar_fig, company_bar_canvas, 'Top Companies by Applications', fixed_height=1000)
-        timeline_line_widget = ScalableGraphWidget(self.timeline_line_fig, timeline_line_canvas, 'Applications Over Time', fixed_height=800)
-        job_title_bar_widget = ScalableGraphWidget(self.job_title_bar_fig, job_title_bar_canvas, 'Top 10 Job Positions', fixed_height=1000)
-        term_bar_widget = ScalableGraphWidget(self.term_bar_fig, term_bar_canvas, 'Applications by Term', fixed_height=800)
-        application_method_bar_widget = ScalableGraphWidget(self.application_method_bar_fig, application_method_bar_canvas, 'Applications by Method', fixed_height=1000)
-        resume_cover_letter_bar_widget = ScalableGraphWidget(self.resume_cover_letter_bar_fig, resume_cover_letter_bar_canvas, 'Applications by Resume and Cover Letter Version', fixed_height=1200)
-        status_stacked_area_widget = ScalableGraphWidget(self.status_stacked_area_fig, status_stacked_area_canvas, 'Application Statuses Over Time', fixed_height=600)
-        industry_pie_widget = ScalableGraphWidget(self.industry_pie_fig, industry_pie_canvas, 'Applications by Industry', fixed_height=500, legend=True)
-
-        # Add scalable graph widgets to the scroll layout
-        scroll_layout.addWidget(status_pie_widget)
-        scroll_layout.addWidget(company_bar_widget)
-        scroll_layout.addWidget(timeline_line_widget)
-        scroll_layout.addWidget(job_title_bar_widget)
-        scroll_layout.addWidget(term_bar_widget)
-        scroll_layout.addWidget(application_method_bar_widget)
-        scroll_layout.addWidget(resume_cover_letter_bar_widget)
-        scroll_layout.addWidget(status_stacked_area_widget)
-        scroll_layout.addWidget(industry_pie_widget)
+        # Create plots and their scalable graph widgets
+        self.add_dashboard_charts(scroll_layout)
 
         # Set the scroll content and add to main layout
         scroll_content.setLayout(scroll_layout)
@@ -677,348 +690,433 @@ class JobApplicationTracker(QMainWindow):
         if self.centralWidget() != self.tab_widget:
             self.setCentralWidget(self.tab_widget)
     
-    def create_status_pie(self):
-        status_counts = self.data['Status'].value_counts()
-        status_counts = self.group_small_values(status_counts, threshold=5)
-        
-        fig, ax = plt.subplots(figsize=(10, 7))
-        colors = plt.cm.Set3(np.linspace(0, 1, len(status_counts)))
-        wedges, texts, autotexts = ax.pie(status_counts.values, colors=colors, autopct=lambda pct: f"{pct:.1f}%\n({int(pct/100.*sum(status_counts))})", pctdistance=0.75)
-        
-        ax.set_title('Applications by Status')
-        
-        # Add legend
-        ax.legend(wedges, status_counts.index,
-                title="Statuses",
-                loc="center left",
-                bbox_to_anchor=(1, 0, 0.5, 1))
-        
-        plt.setp(autotexts, size=8, weight="bold")
-        ax.set_aspect("equal")
-        
-        canvas = FigureCanvas(fig)
-        return fig, canvas
-
-    def create_timeline_line(self):
-        self.data['Application Date'] = pd.to_datetime(self.data['Application Date'], format="%Y-%m-%d", errors='coerce')
-        date_counts = self.data['Application Date'].value_counts().sort_index()
-        
-        fig, ax = plt.subplots(figsize=(12, 9))  # 4:3 aspect ratio
-        ax.plot(date_counts.index, date_counts.values)
-        ax.set_title('Applications Over Time')
-        ax.set_xlabel('Date')
-        ax.set_ylabel('Number of Applications')
-        
-        # Set x-axis ticks to be 10 days apart
-        start_date = date_counts.index.min()
-        end_date = date_counts.index.max()
-        date_range = pd.date_range(start=start_date, end=end_date, freq='5D')
-        ax.set_xticks(date_range)
-        ax.set_xticklabels(date_range.strftime('%Y-%m-%d'), rotation=45, ha='right')
-        
-        plt.tight_layout()
-        
-        canvas = FigureCanvas(fig)
-        return fig, canvas
+    def add_dashboard_charts(self, scroll_layout):
+        # Widgets render lazily once they know their size, from the render cache when possible
+        self.chart_widgets = {}
+        timeseries_sources = self.timeseries_sources() if self.use_pyqtgraph() else {}
+        for name, builder, title, fixed_height, legend in self.dashboard_charts():
+            if name in timeseries_sources:
+                widget = TimeSeriesPlotWidget(title, timeseries_sources[name], fixed_height=fixed_height,
+                                              stacked=name == "status_stacked_area")
+                widget.set_chart(builder, self.chart_version(name))
+            else:
+                widget = ScalableGraphWidget(name, builder, self.chart_version(name), title,
+                                             fixed_height=fixed_height, legend=legend, render_cache=self.render_cache,
+                                             series_source=self.series_source(name))
+            self.chart_widgets[name] = widget
+            scroll_layout.addWidget(widget)
+
+    def use_pyqtgraph(self):
+        return PLOT_BACKEND == "pyqtgraph" and timeseries_plot.pg is not None
+
+    def timeseries_sources(self):
+        # Full-resolution daily series for the interactive time-series charts; the widget decimates them
+        return {
+            "timeline_line": lambda: self.status_rollup.frame("D").sum(axis=1).rename("Applications"),
+            "status_stacked_area": lambda: self.status_history.status_counts_over_time("D", self.data['Application ID']),
+        }
+
+    def update_dashboard(self, changed_columns=None):
+        # Keep the existing widgets; only charts whose version changed are rebuilt and redrawn.
+        # With changed_columns, charts that read none of them are skipped without even being checked.
+        if changed_columns is not None and "Status" in changed_columns:
+            changed_columns = changed_columns | {"Status History"}
+        for name, builder, title, fixed_height, legend in self.dashboard_charts():
+            if changed_columns is not None and not changed_columns & set(CHART_COLUMNS[name]):
+                continue
+            self.chart_widgets[name].set_chart(builder, self.chart_version(name), self.series_source(name))
     
-    def create_job_title_bar(self):
-        job_title_counts = self.data['Position'].value_counts().head(10)
-        
-        fig, ax = plt.subplots(figsize=(12, 9))
-        bars = ax.bar(range(len(job_title_counts)), job_title_counts.values)
-        ax.set_title('Top 10 Job Positions')
-        ax.set_ylabel('Number of Applications')
-        
-        # Wrap x-axis labels
-        wrapped_labels = [textwrap.fill(label, width=20) for label in job_title_counts.index]
-        ax.set_xticks(range(len(job_title_counts)))
-        ax.set_xticklabels(wrapped_labels, rotation=45, ha='right')
-
-        # Add value labels on the bars
-        for i, v in enumerate(job_title_counts.values):
-            ax.text(i, v, str(v), ha='center', va='bottom')
-        
-        # Adjust layout to prevent cutoff
-        plt.tight_layout()
-        
-        canvas = FigureCanvas(fig)
-        return fig, canvas
+class EditPanel(QWidget):
+    """The Edit Entry window, built once and rebound to the selected rows.
 
-    def create_company_bar(self):
-        company_counts = self.data['Company Name'].value_counts().head(10)
-        
-        fig, ax = plt.subplots(figsize=(12, 9))
-        bars = ax.bar(range(len(company_counts)), company_counts.values)
-        ax.set_title('Top 10 Companies by Applications')
-        ax.set_ylabel('Number of Applications')
-        
-        # Wrap x-axis labels
-        wrapped_labels = [textwrap.fill(label, width=20) for label in company_counts.index]
-        ax.set_xticks(range(len(company_counts)))
-        ax.set_xticklabels(wrapped_labels, rotation=45, ha='right')
-        
-        # Add value labels on the bars
-        for i, v in enumerate(company_counts.values):
-            ax.text(i, v, str(v), ha='center', va='bottom')
-        
-        # Adjust layout to prevent cutoff
-        plt.tight_layout()
-        
-        canvas = FigureCanvas(fig)
-        return fig, canvas
+    Binding only sets each field's value (O(columns)); the widgets and calendars are
+    reused and the resume/cover letter lists are re-read only when their folder changed.
+    Only the fields the user changes are saved, so a value a widget cannot show (such as
+    a date kept as text) is left as it is. With several rows selected the fields start
+    out blank and the changes are applied to all the rows in one update.
+    """
 
-    def create_term_bar(self):
-        term_counts = self.data['Term'].value_counts()
-        
-        fig, ax = plt.subplots(figsize=(10, 7))
-        bars = ax.bar(range(len(term_counts)), term_counts.values)
-        ax.set_title('Applications by Term')
-        ax.set_ylabel('Number of Applications')
-        
-        # Wrap x-axis labels
-        wrapped_labels = [textwrap.fill(label, width=15) for label in term_counts.index]
-        ax.set_xticks(range(len(term_counts)))
-        ax.set_xticklabels(wrapped_labels, rotation=45, ha='right')
-        
-        # Add value labels on the bars
-        for i, v in enumerate(term_counts.values):
-            ax.text(i, v, str(v), ha='center', va='bottom')
+    def __init__(self, tracker):
+        super().__init__()
+        self.tracker = tracker
+        self.rows = []
+        self.touched = set()
+        self.binding = False
+        self.folder_versions = {}
+        self.setGeometry(300, 300, 600, 800)
+        layout = QVBoxLayout(self)
 
-        # Adjust layout to prevent cutoff
-        plt.tight_layout()
-        
-        canvas = FigureCanvas(fig)
-        return fig, canvas
+        scroll_area = QScrollArea()
+        scroll_widget = QWidget()
+        scroll_layout = QGridLayout(scroll_widget)
+        scroll_layout.setColumnStretch(1, 1)
 
-    def create_application_method_bar(self):
-        method_counts = self.data['Application Method'].value_counts()
-        
-        fig, ax = plt.subplots(figsize=(12, 9))
-        bars = ax.bar(range(len(method_counts)), method_counts.values)
-        ax.set_title('Applications by Method')
-        ax.set_ylabel('Number of Applications')
-        
-        # Wrap x-axis labels
-        wrapped_labels = [textwrap.fill(label, width=15) for label in method_counts.index]
-        ax.set_xticks(range(len(method_counts)))
-        ax.set_xticklabels(wrapped_labels, rotation=45, ha='right')
-        
-        # Add value labels on the bars
-        for i, v in enumerate(method_counts.values):
-            ax.text(i, v, str(v), ha='center', va='bottom')
+        self.fields = {}
+        grid_row = 0
+        for col in tracker.data.columns:
+            if col in HIDDEN_COLUMNS or col.endswith("_check"):
+                continue
+            field_layout = QHBoxLayout()
+
+            if col in tracker.required_fields:
+                label = QLabel(f"{col}")
+                asterisk = QLabel("*")
+                asterisk.setStyleSheet("color: red")
+                label_layout = QHBoxLayout()
+                label_layout.addWidget(label)
+                label_layout.addWidget(asterisk)
+                label_layout.addStretch()
+                scroll_layout.addLayout(label_layout, grid_row, 0)
+            else:
+                label = QLabel(f"{col}:")
+                scroll_layout.addWidget(label, grid_row, 0)
+
+            if col in ["Application Date", "Interview Date", "Follow-up Date"]:
+                date_layout = QHBoxLayout()
+                self.fields[col] = QDateEdit()
+                self.fields[col].setCalendarPopup(True)
+                self.fields[col].dateChanged.connect(lambda _, c=col: self.touch(c))
+                date_layout.addWidget(self.fields[col])
+
+                if col in ["Interview Date", "Follow-up Date"]:
+                    check_box = QCheckBox("No date")
+                    check_box.stateChanged.connect(lambda state, c=col: self.toggle_date(c, state))
+                    date_layout.addWidget(check_box)
+                    self.fields[f"{col}_check"] = check_box
+
+                scroll_layout.addLayout(date_layout, grid_row, 1)
+            elif col in ["Status", "Priority", "Application Method"]:
+                self.fields[col] = QComboBox()
+                if col == "Status":
+                    self.fields[col].addItems(["Applied", "Interview Scheduled", "Rejected", "Offer Received"])
+                elif col == "Priority":
+                    self.fields[col].addItems(["", "Low", "Medium", "High"])
+                else:
+                    self.fields[col].addItems(["Company's Website", "LinkedIn", "Indeed", "Glassdoor", "Referral", "Email", "Other"])
+                self.fields[col].currentTextChanged.connect(lambda _, c=col: self.touch(c))
+                scroll_layout.addWidget(self.fields[col], grid_row, 1)
+            elif col in ["Resume Version", "Cover Letter Version"]:
+                self.fields[col] = QComboBox()
+                file_type = "resume" if col == "Resume Version" else "cover_letter"
+                upload_button = QPushButton("Upload Resume" if col == "Resume Version" else "Upload Cover Letter")
+                upload_button.clicked.connect(lambda _, c=col, t=file_type: tracker.upload_file(t, self.fields[c]))
+                self.fields[col].currentTextChanged.connect(lambda _, c=col: self.touch(c))
+                field_layout.addWidget(self.fields[col])
+                field_layout.addWidget(upload_button)
+                scroll_layout.addLayout(field_layout, grid_row, 1)
+            elif col in ["Notes", "Next Steps"]:
+                self.fields[col] = QTextEdit()
+                self.fields[col].textChanged.connect(lambda c=col: self.touch(c))
+                scroll_layout.addWidget(self.fields[col], grid_row, 1)
+            else:
+                self.fields[col] = QLineEdit()
+                self.fields[col].textChanged.connect(lambda _, c=col: self.touch(c))
+                scroll_layout.addWidget(self.fields[col], grid_row, 1)
 
-        # Adjust layout to prevent cutoff
-        plt.tight_layout()
-        
-        canvas = FigureCanvas(fig)
-        return fig, canvas
+            grid_row += 1
 
-    def create_resume_cover_letter_bar(self):
-        resume_counts = self.data['Resume Version'].value_counts()
-        cover_letter_counts = self.data['Cover Letter Version'].value_counts()
+        scroll_area.setWidget(scroll_widget)
+        scroll_area.setWidgetResizable(True)
+        layout.addWidget(scroll_area)
 
-        # Preprocess labels
-        resume_labels = [self.preprocess_label(label) if self.preprocess_label(label) != "" else "None" for label in resume_counts.index]
-        cover_letter_labels = [self.preprocess_label(label) if self.preprocess_label(label) != "" else "None" for label in cover_letter_counts.index]
-        
-        # Calculate the number of bars
-        n_resume = len(resume_counts)
-        n_cover = len(cover_letter_counts)
-        
-        # Adjust figure size based on number of bars
-        fig_height = max(8, (n_resume + n_cover) * 0.5)  # 0.5 inch per bar, minimum 8 inches
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, fig_height))
-        
-        # Resume Version chart
-        bars1 = ax1.bar(range(len(resume_labels)), resume_counts.values)
-        ax1.set_title('Applications by Resume Version')
-        ax1.set_ylabel('Number of Applications')
-        ax1.set_xlabel('Resume Version')
-        
-        # Cover Letter Version chart
-        bars2 = ax2.bar(range(len(cover_letter_labels)), cover_letter_counts.values)
-        ax2.set_title('Applications by Cover Letter Version')
-        ax2.set_ylabel('Number of Applications')
-        ax2.set_xlabel('Cover Letter Version')
-        
-        # Add value labels on the bars and set x-axis labels
-        for ax, labels in zip([ax1, ax2], [resume_labels, cover_letter_labels]):
-            for i, v in enumerate(ax.containers[0]):
-                ax.text(i, v.get_height(), str(v.get_height()), ha='center', va='bottom')
-            ax.set_xticks(range(len(labels)))
-            ax.set_xticklabels(labels, rotation=45, ha='right')
-        
-        # Adjust layout to prevent cutoff
-        plt.tight_layout()
-        
-        canvas = FigureCanvas(fig)
-        return fig, canvas
-
-    def create_status_stacked_area(self):
-        self.data['Application Date'] = pd.to_datetime(self.data['Application Date'])
-        status_over_time = self.data.pivot_table(
-            index='Application Date', 
-            columns='Status', 
-            values='Index', 
-            aggfunc='count'
-        ).fillna(0).cumsum()
-        
-        fig, ax = plt.subplots(figsize=(12, 9))
-        ax.stackplot(status_over_time.index, status_over_time.T, labels=status_over_time.columns)
-        ax.set_title('Application Statuses Over Time')
-        ax.set_xlabel('Date')
-        ax.set_ylabel('Number of Applications')
-        
-        # Set x-axis ticks to be 10 days apart
-        start_date = status_over_time.index.min()
-        end_date = status_over_time.index.max()
-        date_range = pd.date_range(start=start_date, end=end_date, freq='10D')
-        ax.set_xticks(date_range)
-        ax.set_xticklabels(date_range.strftime('%Y-%m-%d'), rotation=45, ha='right')
-        
-        # Wrap legend labels
-        handles, labels = ax.get_legend_handles_labels()
-        wrapped_labels = [textwrap.fill(label, width=15) for label in labels]
-        ax.legend(handles, wrapped_labels, loc='upper left')
-        
-        plt.tight_layout()
-        
-        canvas = FigureCanvas(fig)
-        return fig, canvas
-    
-    def create_industry_pie(self):
-        industry_counts = self.data['Industry'].value_counts()
-        industry_counts = self.group_small_values(industry_counts, threshold=3)
-        
-        fig, ax = plt.subplots(figsize=(10, 7))
-        colors = plt.cm.Set3(np.linspace(0, 1, len(industry_counts)))
-        wedges, texts, autotexts = ax.pie(industry_counts.values, colors=colors, autopct=lambda pct: f"{pct:.1f}%\n({int(pct/100.*sum(industry_counts))})", pctdistance=0.75)
-        
-        ax.set_title('Applications by Industry')
-        
-        # Add legend
-        ax.legend(wedges, industry_counts.index,
-                title="Industries",
-                loc="center left",
-                bbox_to_anchor=(1, 0, 0.5, 1))
-        
-        plt.setp(autotexts, size=8, weight="bold")
-        ax.set_aspect("equal")
-        
-        canvas = FigureCanvas(fig)
-        return fig, canvas
+        save_button = QPushButton("Save")
+        save_button.clicked.connect(self.save)
+        layout.addWidget(save_button)
 
-    def update_dashboard(self):
-        # Close all existing figures
-        plt.close('all')
+    def touch(self, col):
+        # Changes made while binding are not the user's
+        if not self.binding:
+            self.touched.add(col)
 
-        # Get the dashboard widget and its layout
-        dashboard_widget = self.tab_widget.widget(1)
-        dashboard_layout = dashboard_widget.layout()
-
-        # Get the scroll area and its content widget
-        scroll_area = dashboard_layout.itemAt(0).widget()
-        scroll_content = scroll_area.widget()
-        scroll_layout = scroll_content.layout()
-
-        # Remove old widgets from the scroll layout
-        for i in reversed(range(scroll_layout.count())): 
-            widget = scroll_layout.itemAt(i).widget()
-            if widget is not None:
-                widget.setParent(None)
-
-        # Recreate plots with updated data
-        self.status_pie_fig, status_pie_canvas = self.create_status_pie()
-        self.company_bar_fig, company_bar_canvas = self.create_company_bar()
-        self.timeline_line_fig, timeline_line_canvas = self.create_timeline_line()
-        self.job_title_bar_fig, job_title_bar_canvas = self.create_job_title_bar()
-        self.term_bar_fig, term_bar_canvas = self.create_term_bar()
-        self.application_method_bar_fig, application_method_bar_canvas = self.create_application_method_bar()
-        self.resume_cover_letter_bar_fig, resume_cover_letter_bar_canvas = self.create_resume_cover_letter_bar()
-        self.status_stacked_area_fig, status_stacked_area_canvas = self.create_status_stacked_area()
-        self.industry_pie_fig, industry_pie_canvas = self.create_industry_pie()
-
-        # Create new scalable graph widgets
-        status_pie_widget = ScalableGraphWidget(self.status_pie_fig, status_pie_canvas, 'Applications by Status', fixed_height=500, legend=True)
-        company_bar_widget = ScalableGraphWidget(self.company_bar_fig, company_bar_canvas, 'Top Companies by Applications', fixed_height=1000)
-        timeline_line_widget = ScalableGraphWidget(self.timeline_line_fig, timeline_line_canvas, 'Applications Over Time', fixed_height=800)
-        job_title_bar_widget = ScalableGraphWidget(self.job_title_bar_fig, job_title_bar_canvas, 'Top 10 Job Positions', fixed_height=1000)
-        term_bar_widget = ScalableGraphWidget(self.term_bar_fig, term_bar_canvas, 'Applications by Term', fixed_height=800)
-        application_method_bar_widget = ScalableGraphWidget(self.application_method_bar_fig, application_method_bar_canvas, 'Applications by Method', fixed_height=1000)
-        resume_cover_letter_bar_widget = ScalableGraphWidget(self.resume_cover_letter_bar_fig, resume_cover_letter_bar_canvas, 'Applications by Resume and Cover Letter Version', fixed_height=1200)
-        status_stacked_area_widget = ScalableGraphWidget(self.status_stacked_area_fig, status_stacked_area_canvas, 'Application Statuses Over Time', fixed_height=600)
-        industry_pie_widget = ScalableGraphWidget(self.industry_pie_fig, industry_pie_canvas, 'Applications by Industry', fixed_height=500, legend=True)
-
-        # Add new scalable graph widgets to the scroll layout
-        scroll_layout.addWidget(status_pie_widget)
-        scroll_layout.addWidget(company_bar_widget)
-        scroll_layout.addWidget(timeline_line_widget)
-        scroll_layout.addWidget(job_title_bar_widget)
-        scroll_layout.addWidget(term_bar_widget)
-        scroll_layout.addWidget(application_method_bar_widget)
-        scroll_layout.addWidget(resume_cover_letter_bar_widget)
-        scroll_layout.addWidget(status_stacked_area_widget)
-        scroll_layout.addWidget(industry_pie_widget)
-
-        # Update the scroll area
-        scroll_area.setWidget(scroll_content)
-    
-    def preprocess_label(self, label):
-        parts = label.split('.')
-        if len(parts) > 1:
-            # If it's a filename with extension, get rid of the extension
-            label = parts[0]
-        # Split the file name to keep the date only
-        parts = label.split('_')
-        return '/'.join(parts[-3:])
-    
-    def group_small_values(self, data, threshold=3):
-        mask = data >= threshold
-        main_data = data[mask]
-        other_data = data[~mask]
-        
-        if other_data.sum() > 0:
-            return pd.concat([main_data, pd.Series({'Other': other_data.sum()})])
+    def toggle_date(self, col, state):
+        self.fields[col].setEnabled(state != Qt.CheckState.Checked.value)
+        self.touch(col)
+
+    def refresh_file_list(self, col, folder):
+        version = os.stat(folder).st_mtime_ns
+        if self.folder_versions.get(col) == version:
+            return
+        self.folder_versions[col] = version
+        self.fields[col].clear()
+        self.fields[col].addItems(self.tracker.populate_file_list(folder))
+
+    def bind(self, rows):
+        self.rows = list(rows)
+        bulk = len(self.rows) > 1
+        self.setWindowTitle(f"Edit {len(self.rows)} Entries" if bulk else "Edit Entry")
+        self.binding = True
+        self.refresh_file_list("Resume Version", self.tracker.resume_folder)
+        self.refresh_file_list("Cover Letter Version", self.tracker.cover_letter_folder)
+        # One row lookup; with several rows every field starts blank
+        row = {} if bulk else self.tracker.data.iloc[self.rows[0]].to_dict()
+        placeholder = "(keep current values)" if bulk else ""
+        for col, widget in self.fields.items():
+            if col.endswith("_check"):
+                continue
+            value = row.get(col, "")
+            if isinstance(widget, QDateEdit):
+                has_date = isinstance(value, (pd.Timestamp, datetime)) and pd.notna(value)
+                widget.setDate(QDate(value.year, value.month, value.day) if has_date else QDate.currentDate())
+                if f"{col}_check" in self.fields:
+                    self.fields[f"{col}_check"].setChecked(not has_date and not bulk)
+                    widget.setEnabled(has_date or bulk)
+            elif isinstance(widget, QComboBox):
+                if bulk:
+                    widget.setCurrentIndex(-1)
+                else:
+                    # setCurrentText does nothing for a value that is not in the list, which would
+                    # leave the previous row's choice showing
+                    text = "" if pd.isna(value) else str(value)
+                    index = widget.findText(text)
+                    if index < 0:
+                        widget.addItem(text)
+                        index = widget.count() - 1
+                    widget.setCurrentIndex(index)
+            elif isinstance(widget, QTextEdit):
+                widget.setPlainText("" if bulk else str(value))
+                widget.setPlaceholderText(placeholder)
+            else:
+                widget.setText("" if bulk else str(value))
+                widget.setPlaceholderText(placeholder)
+        self.touched = set()
+        self.binding = False
+
+    def value(self, col):
+        widget = self.fields[col]
+        if f"{col}_check" in self.fields and self.fields[f"{col}_check"].isChecked():
+            return ""
+        if isinstance(widget, QDateEdit):
+            return widget.date().toString("yyyy-MM-dd")
+        if isinstance(widget, QTextEdit):
+            return widget.toPlainText()
+        if isinstance(widget, QComboBox):
+            return widget.currentText()
+        return widget.text()
+
+    def save(self):
+        # Only the fields that were changed, for one row as for several
+        columns = [col for col in self.fields if not col.endswith("_check") and col in self.touched]
+        updated_data = {col: self.value(col) for col in columns}
+
+        missing_fields = [col for col in columns if col in self.tracker.required_fields and not updated_data[col]]
+        if missing_fields:
+            QMessageBox.warning(self, "Missing Fields", f"Please fill in the following required fields: {', '.join(missing_fields)}")
+            return
+        if not updated_data:
+            self.close()
+            return
+
+        self.tracker.save_edit(self.rows, updated_data)
+
+class DataFrameTableModel(QAbstractTableModel):
+    """Read-only table model over the tracker's DataFrame.
+
+    The view never holds per-cell items: rows are rendered on demand through
+    self.order, the sort permutation (cached per column by the query engine)
+    restricted to the rows matching the current filter.
+    """
+
+    def __init__(self, tracker, columns):
+        super().__init__()
+        self.tracker = tracker
+        self.columns = columns
+        self.sort_column = None
+        self.sort_order = Qt.SortOrder.AscendingOrder
+        self.mask = None
+        self.update_order()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.order)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return str(self.tracker.data.iat[self.order[index.row()], self.column_positions[index.column()]])
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.columns[section]
+        return str(section + 1)
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self.sort_column = column if column >= 0 else None
+        self.sort_order = order
+        self.update_order()
+
+    def set_filter(self, mask):
+        self.mask = mask
+        self.update_order()
+
+    def data_row(self, view_row):
+        return int(self.order[view_row])
+
+    def update_order(self):
+        self.beginResetModel()
+        data = self.tracker.data
+        self.column_positions = [data.columns.get_loc(col) for col in self.columns]
+        if self.sort_column is None:
+            order = np.arange(len(data))
         else:
-            return main_data
-        
+            order = self.tracker.store.sort_permutation(
+                self.columns[self.sort_column], self.sort_order == Qt.SortOrder.AscendingOrder)
+        if self.mask is not None and len(self.mask) == len(data):
+            order = order[self.mask[order]]
+        self.order = order
+        self.endResetModel()
+
 class ScalableGraphWidget(QWidget):
-    def __init__(self, fig, canvas, title, fixed_height=400, legend=False):
+    def __init__(self, name, builder, version, title, fixed_height=400, legend=False, render_cache=None,
+                 series_source=None):
         super().__init__()
-        self.fig = fig
-        self.canvas = canvas
+        self.name = name
+        self.builder = builder
+        self.version = version
+        # For bar and line charts: returns the plotted values, one Series per axes, enabling fast updates
+        self.series_source = series_source
+        self.series = None
+        self.background = None
         self.title = title
         self.fixed_height = fixed_height
         self.legend = legend
+        self.render_cache = render_cache
+        self.dpi = plt.rcParams['figure.dpi']
+        self.fig = None
+        self.width_px = None
+        self.rendered_key = None
         self.layout = QVBoxLayout(self)
         self.layout.addWidget(QLabel(title))
-        self.layout.addWidget(self.canvas)
-        
-        # Set fixed height for the canvas
-        self.canvas.setFixedHeight(self.fixed_height)
-        
+
+        # The chart is shown as a rendered image, so cached images can be painted without a figure
+        self.image_label = QLabel()
+        self.image_label.setFixedHeight(self.fixed_height)
+        self.layout.addWidget(self.image_label)
+
+    def set_chart(self, builder, version, series_source=None):
+        # Nothing to do when the chart's data has not changed
+        if version == self.version:
+            return False
+        self.builder = builder
+        self.version = version
+        self.series_source = series_source
+        if not self.fast_update():
+            self.fig = None
+            self.background = None
+            self.render()
+        return True
+
+    def dynamic_artists(self):
+        # The artists a fast update changes: bars and their value labels, or the plotted line
+        artists = []
+        for ax in self.fig.axes:
+            if ax.containers:
+                artists.extend(ax.containers[0])
+                artists.extend(ax.texts)
+            artists.extend(ax.lines)
+        return artists
+
+    def fast_update(self):
+        """Move the bars/line to the new values and blit them over the cached background.
+
+        Returns False when a full draw is needed instead: no figure or background yet,
+        a different category set, or values that change the axis limits.
+        """
+        if self.series_source is None or self.fig is None or self.background is None or not self.width_px:
+            return False
+        series = self.series_source()
+        if len(series) != len(self.series) or any(not new.index.equals(old.index) for new, old in zip(series, self.series)):
+            return False
+
+        rescaled = False
+        for ax, values in zip(self.fig.axes, series):
+            if ax.containers:
+                for bar, text, value in zip(ax.containers[0], ax.texts, values.values):
+                    bar.set_height(value)
+                    text.set_y(value)
+                    text.set_text(str(value))
+            for line in ax.lines:
+                line.set_ydata(values.values)
+            limits = ax.get_ylim()
+            ax.relim()
+            ax.autoscale_view()
+            rescaled = rescaled or ax.get_ylim() != limits
+        self.series = series
+
+        key = (self.name, self.version, self.width_px, self.fixed_height, self.dpi)
+        if rescaled:
+            image = self.draw_figure(key)
+        else:
+            canvas = self.fig.canvas
+            canvas.restore_region(self.background)
+            for artist in self.dynamic_artists():
+                artist.axes.draw_artist(artist)
+            width, height = canvas.get_width_height()
+            image = self.store(key, width, height, canvas.buffer_rgba())
+        self.show_image(*image)
+        self.rendered_key = key
+        return True
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
         width = event.size().width() - 20  # Subtract 20 for layout margins
-        self.canvas.setFixedWidth(width)
-        
-        # Calculate the new figure size while maintaining the aspect ratio
-        current_width, current_height = self.fig.get_size_inches()
-        aspect_ratio = current_width / current_height
-        new_width = width / self.fig.dpi
-        new_height = self.fixed_height / self.fig.dpi
-        
-        self.fig.set_size_inches(new_width, new_height)
+        self.image_label.setFixedWidth(width)
+        self.width_px = width
+        self.render()
+
+    def render(self):
+        if not self.width_px or self.width_px <= 0:
+            return
+        key = (self.name, self.version, self.width_px, self.fixed_height, self.dpi)
+        if key == self.rendered_key:
+            return
+        image = self.render_cache.get(key) if self.render_cache is not None else None
+        if image is None:
+            image = self.draw_figure(key)
+        self.show_image(*image)
+        self.rendered_key = key
+
+    def draw_figure(self, key):
+        if self.fig is None:
+            # The builder returns a bare figure; the widget draws it offscreen with Agg
+            self.fig = self.builder()
+            FigureCanvasAgg(self.fig)
+            self.series = self.series_source() if self.series_source is not None else None
+        self.fig.set_dpi(self.dpi)
+        self.fig.set_size_inches(self.width_px / self.dpi, self.fixed_height / self.dpi)
         if self.legend:
             self.fig.subplots_adjust(right=0.7)
-        self.canvas.draw()
+
+        canvas = self.fig.canvas
+        if self.series is None:
+            canvas.draw()
+        else:
+            # Draw everything but the bars/line, keep that as the background for fast updates,
+            # then draw the bars/line on top
+            artists = self.dynamic_artists()
+            for artist in artists:
+                artist.set_animated(True)
+            canvas.draw()
+            self.background = canvas.copy_from_bbox(self.fig.bbox)
+            for artist in artists:
+                artist.axes.draw_artist(artist)
+        width, height = canvas.get_width_height()
+        return self.store(key, width, height, canvas.buffer_rgba())
+
+    def store(self, key, width, height, rgba):
+        if self.render_cache is not None:
+            return self.render_cache.put(key, width, height, rgba)
+        return width, height, bytes(rgba)
+
+    def show_image(self, width, height, rgba):
+        image = QImage(rgba, width, height, width * 4, QImage.Format.Format_RGBA8888)
+        self.image_label.setPixmap(QPixmap.fromImage(image))
 
     def sizeHint(self):
         return QSize(500, self.fixed_height + 50)  # Add 30 for the title label
-    
-    def closeEvent(self, event):
-        plt.close(self.fig)
-        super().closeEvent(event)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -0,0 +1,195 @@
+import re
+import difflib
+from collections import namedtuple
+from functools import lru_cache
+
+Location = namedtuple("Location", "city region country remote multiple")
+UNKNOWN = Location("", "", "", False, False)
+
+# Bundled offline tables: regions by country, country names and aliases, and cities that are
+# often written without their region ("Seattle", "Toronto, Canada")
+REGIONS = {
+    "US": {
+        "AL": "Alabama", "AK": "Alaska", "AZ": "Arizona", "AR": "Arkansas", "CA": "California",
+        "CO": "Colorado", "CT": "Connecticut", "DE": "Delaware", "DC": "District of Columbia",
+        "FL": "Florida", "GA": "Georgia", "HI": "Hawaii", "ID": "Idaho", "IL": "Illinois",
+        "IN": "Indiana", "IA": "Iowa", "KS": "Kansas", "KY": "Kentucky", "LA": "Louisiana",
+        "ME": "Maine", "MD": "Maryland", "MA": "Massachusetts", "MI": "Michigan", "MN": "Minnesota",
+        "MS": "Mississippi", "MO": "Missouri", "MT": "Montana", "NE": "Nebraska", "NV": "Nevada",
+        "NH": "New Hampshire", "NJ": "New Jersey", "NM": "New Mexico", "NY": "New York",
+        "NC": "North Carolina", "ND": "North Dakota", "OH": "Ohio", "OK": "Oklahoma", "OR": "Oregon",
+        "PA": "Pennsylvania", "RI": "Rhode Island", "SC": "South Carolina", "SD": "South Dakota",
+        "TN": "Tennessee", "TX": "Texas", "UT": "Utah", "VT": "Vermont", "VA": "Virginia",
+        "WA": "Washington", "WV": "West Virginia", "WI": "Wisconsin", "WY": "Wyoming",
+        "PR": "Puerto Rico",
+    },
+    "CA": {
+        "AB": "Alberta", "BC": "British Columbia", "MB": "Manitoba", "NB": "New Brunswick",
+        "NL": "Newfoundland and Labrador", "NS": "Nova Scotia", "NT": "Northwest Territories",
+        "NU": "Nunavut", "ON": "Ontario", "PE": "Prince Edward Island", "QC": "Quebec",
+        "SK": "Saskatchewan", "YT": "Yukon",
+    },
+}
+
+COUNTRIES = {
+    "US": "United States", "CA": "Canada", "MX": "Mexico", "BR": "Brazil", "GB": "United Kingdom",
+    "IE": "Ireland", "DE": "Germany", "FR": "France", "NL": "Netherlands", "ES": "Spain",
+    "PT": "Portugal", "IT": "Italy", "CH": "Switzerland", "SE": "Sweden", "NO": "Norway",
+    "DK": "Denmark", "FI": "Finland", "PL": "Poland", "AT": "Austria", "BE": "Belgium",
+    "IN": "India", "CN": "China", "JP": "Japan", "KR": "South Korea", "SG": "Singapore",
+    "AU": "Australia", "NZ": "New Zealand", "IL": "Israel", "AE": "United Arab Emirates",
+}
+COUNTRY_ALIASES = {
+    "us": "US", "usa": "US", "u.s": "US", "u.s.a": "US", "united states of america": "US",
+    "uk": "GB", "england": "GB", "scotland": "GB", "great britain": "GB", "holland": "NL",
+    "deutschland": "DE", "korea": "KR", "uae": "AE",
+}
+
+CITIES = {
+    "new york": ("NY", "US"), "brooklyn": ("NY", "US"), "manhattan": ("NY", "US"),
+    "chicago": ("IL", "US"), "san francisco": ("CA", "US"), "los angeles": ("CA", "US"),
+    "san jose": ("CA", "US"), "san diego": ("CA", "US"), "palo alto": ("CA", "US"),
+    "mountain view": ("CA", "US"), "sunnyvale": ("CA", "US"), "santa clara": ("CA", "US"),
+    "san mateo": ("CA", "US"), "redwood city": ("CA", "US"), "menlo park": ("CA", "US"),
+    "cupertino": ("CA", "US"), "oakland": ("CA", "US"), "irvine": ("CA", "US"), "fremont": ("CA", "US"),
+    "pleasanton": ("CA", "US"), "sacramento": ("CA", "US"), "seattle": ("WA", "US"),
+    "redmond": ("WA", "US"), "bellevue": ("WA", "US"), "kirkland": ("WA", "US"), "portland": ("OR", "US"),
+    "hillsboro": ("OR", "US"), "boston": ("MA", "US"), "cambridge": ("MA", "US"), "austin": ("TX", "US"),
+    "dallas": ("TX", "US"), "houston": ("TX", "US"), "san antonio": ("TX", "US"), "plano": ("TX", "US"),
+    "denver": ("CO", "US"), "boulder": ("CO", "US"), "atlanta": ("GA", "US"), "miami": ("FL", "US"),
+    "orlando": ("FL", "US"), "tampa": ("FL", "US"), "washington": ("DC", "US"), "arlington": ("VA", "US"),
+    "mclean": ("VA", "US"), "reston": ("VA", "US"), "philadelphia": ("PA", "US"), "pittsburgh": ("PA", "US"),
+    "phoenix": ("AZ", "US"), "salt lake city": ("UT", "US"), "minneapolis": ("MN", "US"),
+    "detroit": ("MI", "US"), "columbus": ("OH", "US"), "cleveland": ("OH", "US"),
+    "raleigh": ("NC", "US"), "durham": ("NC", "US"), "charlotte": ("NC", "US"),
+    "nashville": ("TN", "US"), "madison": ("WI", "US"), "milwaukee": ("WI", "US"),
+    "las vegas": ("NV", "US"), "st. louis": ("MO", "US"), "kansas city": ("MO", "US"),
+    "baltimore": ("MD", "US"), "omaha": ("NE", "US"), "indianapolis": ("IN", "US"),
+    "toronto": ("ON", "CA"), "ottawa": ("ON", "CA"), "waterloo": ("ON", "CA"), "vancouver": ("BC", "CA"),
+    "montreal": ("QC", "CA"), "calgary": ("AB", "CA"), "edmonton": ("AB", "CA"),
+    "london": ("", "GB"), "dublin": ("", "IE"), "berlin": ("", "DE"), "munich": ("", "DE"),
+    "paris": ("", "FR"), "amsterdam": ("", "NL"), "zurich": ("", "CH"), "stockholm": ("", "SE"),
+    "bangalore": ("", "IN"), "hyderabad": ("", "IN"), "singapore": ("", "SG"),
+    "tokyo": ("", "JP"), "sydney": ("", "AU"), "melbourne": ("", "AU"), "tel aviv": ("", "IL"),
+}
+CITY_ALIASES = {"nyc": "new york", "sf": "san francisco", "washington dc": "washington", "bengaluru": "bangalore"}
+# Cities that str.title() would spell wrong
+CITY_SPELLINGS = {"mclean": "McLean", "mcallen": "McAllen", "st. louis": "St. Louis"}
+
+REGION_NAMES = {(country, name.lower()): code for country, regions in REGIONS.items() for code, name in regions.items()}
+COUNTRY_NAMES = {name.lower(): code for code, name in COUNTRIES.items()} | COUNTRY_ALIASES
+
+REMOTE_PATTERN = re.compile(r"\bremote\b|\banywhere\b|work from home|\bwfh\b")
+# Work arrangements that are not part of the place: "Hybrid - Austin, TX", "On-site in Denver"
+WORK_MODE_PATTERN = re.compile(r"\bhybrid\b|\bon[- ]?site\b|\bin[- ]office\b|\bin[- ]person\b")
+MULTIPLE_PATTERN = re.compile(r"^(?:multiple|various|several|\d+)?\s*locations?$")
+# A period ends a part ("Austin, TX. USA") unless it ends an abbreviation such as "St. Louis"
+SEPARATORS = re.compile(r"[,;/|()]|(?<!\bst)(?<!\bste)(?<!\bft)(?<!\bmt)\.\s+|\s+-\s+|\s+in\s+")
+
+
+def find_country(part):
+    """ISO code for a country name or alias (lowercase), tolerating small misspellings."""
+    part = part.strip(" .")
+    if part in COUNTRY_NAMES:
+        return COUNTRY_NAMES[part]
+    close = difflib.get_close_matches(part, list(COUNTRY_NAMES), n=1, cutoff=0.85)
+    return COUNTRY_NAMES[close[0]] if close else ""
+
+
+def find_region(part, country=""):
+    """(region code, country) for a region written as a code ("CA", "ON") or a name ("Washington")."""
+    part = part.strip(" .")
+    countries = [country] if country in REGIONS else list(REGIONS)
+    for candidate in countries:
+        if part.upper() in REGIONS[candidate] and len(part) == 2:
+            return part.upper(), candidate
+        code = REGION_NAMES.get((candidate, part.lower()))
+        if code:
+            return code, candidate
+    return "", country
+
+
+def known_city(city, region, country):
+    """The canonical spelling of a bundled city in the same region, correcting small typos ("hicago")."""
+    names = [name for name, (r, c) in CITIES.items() if (not region or r == region) and (not country or c == country)]
+    close = difflib.get_close_matches(city, names, n=1, cutoff=0.85)
+    return close[0] if close else ""
+
+
+@lru_cache(maxsize=None)
+def parse_location(text):
+    """Normalize free-text location such as "San Francisco, CA", "Boston MA", "Toronto, Canada"
+    or "Remote in USA" into a Location (city, region code, ISO country code, remote, multiple).
+
+    Works offline from the bundled tables. Results are memoized, so after the first time a
+    location is seen parsing it again is a dictionary lookup.
+    """
+    if not isinstance(text, str) or not text.strip():
+        return UNKNOWN
+    lines = [line.strip() for line in text.lower().splitlines() if line.strip()]
+    places = [line for line in lines if not MULTIPLE_PATTERN.match(line)]
+    if not places:
+        return Location("", "", "", False, True)
+    # "2 locations\nPlantation, FL\nMiami, FL": the first location listed is the one shown
+    line = places[0]
+    # "Hybrid remote" still ties the job to the place named
+    remote = bool(REMOTE_PATTERN.search(line)) and not WORK_MODE_PATTERN.search(line)
+    line = WORK_MODE_PATTERN.sub(" ", REMOTE_PATTERN.sub(" ", line))
+
+    parts = [part.strip(" .-") for part in SEPARATORS.split(line) if part and part.strip(" .-")]
+    city = region = country = ""
+    # Read from the end: country, then region, then the city is what is left
+    if parts and find_country(parts[-1]):
+        country = find_country(parts.pop())
+    if parts and (len(parts) > 1 or (len(parts[-1]) > 2 and parts[-1] not in CITIES)):
+        code, region_country = find_region(parts[-1], country)
+        if code:
+            region, country = code, region_country
+            parts.pop()
+    if parts and not region and " " in parts[-1]:
+        # "Boston MA": a region code written after the city without a comma
+        words = parts[-1].rsplit(" ", 1)
+        code, region_country = find_region(words[1], country)
+        if code and len(words[1]) == 2:
+            region, country = code, region_country
+            parts[-1] = words[0]
+    if parts:
+        city = CITY_ALIASES.get(parts[0], parts[0])
+
+    if city:
+        name = city if city in CITIES else known_city(city, region, country)
+        if name:
+            city_region, city_country = CITIES[name]
+            if (not region or region == city_region) and (not country or country == city_country):
+                city, region, country = name, region or city_region, country or city_country
+    return Location(CITY_SPELLINGS.get(city, city.title()), region, country, remote, False)
+
+
+def region_key(text):
+    """Region-level key for counting: "Remote", "Multiple", "US-CA", a country code or ""."""
+    location = parse_location(text)
+    if location.remote:
+        return "Remote"
+    if location.multiple:
+        return "Multiple"
+    if location.region:
+        return f"{location.country}-{location.region}"
+    return location.country
+
+
+def city_key(text):
+    """City-level key for counting, e.g. "San Francisco, CA"; "" for remote or unknown places."""
+    location = parse_location(text)
+    if location.remote or not location.city:
+        return ""
+    place = location.region or location.country
+    return f"{location.city}, {place}" if place else location.city
+
+
+def region_label(key):
+    if key == "Multiple":
+        return "Multiple locations"
+    country, _, region = key.partition("-")
+    if region:
+        return f"{REGIONS.get(country, {}).get(region, region)}, {country}"
+    return COUNTRIES.get(key, key)
@@ -0,0 +1,155 @@
+import sys
+import time
+import atexit
+import signal
+import logging
+import threading
+
+
+class PersistenceService:
+    """Writes files on a background thread, coalescing bursts of changes into one write.
+
+    Each target is registered with snapshot() -> object and write(object). mark_dirty()
+    only records that a target changed; once no change has come in for delay seconds,
+    the worker takes a snapshot of every dirty target and writes it. Snapshots are taken
+    under the owner's lock (see DataStore.snapshot), so a write never sees a half-applied
+    change, and the slow part, serializing and writing, runs off the GUI thread.
+
+    flush() writes everything still pending and waits for it. It runs at exit, on
+    SIGTERM/SIGHUP and on an uncaught exception, and front-ends call it (via close())
+    when their window closes.
+
+    A target whose write fails stays dirty and is retried after retry_delay seconds.
+    last_error holds the failure until every target has been written again, flush()
+    raises it, and take_error() hands each new failure to the GUI once so it can warn.
+    """
+
+    def __init__(self, delay=0.5, retry_delay=5.0):
+        self.delay = delay
+        self.retry_delay = retry_delay
+        self.targets = {}
+        self.dirty = set()
+        self.last_change = 0.0
+        self.retry_at = 0.0
+        self.closed = False
+        self.writes = 0
+        self.errors = {}
+        self.last_error = None
+        self.reported_error = None
+        self.condition = threading.Condition()
+        # Held for a whole write, so a flush from the GUI thread waits for a write in progress
+        self.write_lock = threading.Lock()
+        self.thread = threading.Thread(target=self.run, name="persistence", daemon=True)
+        self.thread.start()
+        atexit.register(self.flush_quietly)
+
+    def register(self, name, snapshot, write):
+        self.targets[name] = (snapshot, write)
+
+    def mark_dirty(self, name):
+        with self.condition:
+            self.dirty.add(name)
+            self.last_change = time.monotonic()
+            self.condition.notify()
+
+    def pending(self):
+        with self.condition:
+            return bool(self.dirty)
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.dirty and not self.closed:
+                    self.condition.wait()
+                if self.closed:
+                    return
+                # Wait for an idle window: every new change pushes the write back
+                while not self.closed:
+                    remaining = max(self.last_change + self.delay, self.retry_at) - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.condition.wait(remaining)
+            self.write_pending()
+
+    def write_pending(self):
+        with self.write_lock:
+            with self.condition:
+                names, self.dirty = self.dirty, set()
+            for name in names:
+                snapshot, write = self.targets[name]
+                try:
+                    write(snapshot())
+                    self.writes += 1
+                    self.errors.pop(name, None)
+                except Exception as e:
+                    logging.error(f"Error saving {name}: {str(e)}")
+                    self.errors[name] = e
+                    self.last_error = e
+                    # Keep the change pending, and back off so a failing disk is not retried in a loop
+                    with self.condition:
+                        self.dirty.add(name)
+                        self.retry_at = time.monotonic() + self.retry_delay
+            if not self.errors:
+                self.last_error = None
+
+    def flush(self):
+        """Write all pending changes now, on the calling thread, and wait until they are written.
+
+        Raises the last save error if any target could still not be written.
+        """
+        self.write_pending()
+        if self.last_error is not None:
+            raise self.last_error
+
+    def take_error(self):
+        """The last save error if it has not been returned before, else None."""
+        error = self.last_error
+        if error is None or error is self.reported_error:
+            return None
+        self.reported_error = error
+        return error
+
+    def close(self):
+        """Flush and stop the worker thread."""
+        try:
+            self.flush()
+        finally:
+            with self.condition:
+                self.closed = True
+                self.condition.notify()
+            self.thread.join(timeout=5)
+            atexit.unregister(self.flush_quietly)
+
+    def install_crash_handlers(self):
+        """Flush before the process dies from SIGTERM/SIGHUP or an uncaught exception.
+
+        Must be called from the main thread. Previous handlers are still called afterwards.
+        """
+        for name in ("SIGTERM", "SIGHUP"):
+            signum = getattr(signal, name, None)
+            if signum is None:
+                continue
+            previous = signal.getsignal(signum)
+
+            def handler(signum, frame, previous=previous):
+                self.flush_quietly()
+                if callable(previous):
+                    previous(signum, frame)
+                else:
+                    sys.exit(128 + signum)
+            signal.signal(signum, handler)
+
+        previous_hook = sys.excepthook
+
+        def excepthook(*args):
+            self.flush_quietly()
+            previous_hook(*args)
+        sys.excepthook = excepthook
+
+    def flush_quietly(self):
+        """flush() for signal handlers and hooks: returns the save error instead of raising it."""
+        try:
+            self.flush()
+        except Exception as e:
+            return e  # Already logged by write_pending
+        return None
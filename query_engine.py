@@ -0,0 +1,249 @@
+import re
+import shlex
+from collections import namedtuple
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+
+FIELD_ALIASES = {
+    "company": "Company Name",
+    "title": "Job Title",
+    "job": "Job Title",
+    "position": "Position",
+    "industry": "Industry",
+    "term": "Term",
+    "applied": "Application Date",
+    "date": "Application Date",
+    "status": "Status",
+    "url": "Job URL",
+    "website": "Company Website",
+    "location": "Location",
+    "salary": "Salary Range",
+    "contact": "Contact Person",
+    "email": "Contact Email/Phone",
+    "phone": "Contact Email/Phone",
+    "method": "Application Method",
+    "resume": "Resume Version",
+    "cover": "Cover Letter Version",
+    "interview": "Interview Date",
+    "followup": "Follow-up Date",
+    "notes": "Notes",
+    "next": "Next Steps",
+    "priority": "Priority",
+    "tag": "Tags",
+    "index": "Index",
+}
+DATE_COLUMNS = ["Application Date", "Interview Date", "Follow-up Date"]
+NUMERIC_COLUMNS = ["Index"]
+TERM_PATTERN = re.compile(r"^(-?)([A-Za-z][\w/-]*):(.*)$", re.DOTALL)
+OPERATOR_PATTERN = re.compile(r"^(>=|<=|>|<|=)?(.*)$", re.DOTALL)
+
+Predicate = namedtuple("Predicate", "field op value negate")
+
+
+class QueryError(ValueError):
+    pass
+
+
+def normalize_field_name(name):
+    return re.sub(r"[\s_/-]", "", name.lower())
+
+
+@lru_cache(maxsize=256)
+def parse_query(query):
+    """Compile a query such as `status:Rejected company:"Acme" applied:>=2024-07-01 python`
+    into a tuple of predicates. Compiled queries are cached, so re-filtering with the
+    same text (e.g. after an edit) skips parsing entirely.
+
+    `field:value` matches a substring, `field:=value` an exact value, dates and numbers
+    also accept >, >=, <, <= and `from..to` ranges, a leading `-` negates a term and
+    bare words match any column.
+    """
+    try:
+        tokens = shlex.split(query)
+    except ValueError as e:
+        raise QueryError(str(e))
+
+    predicates = []
+    for token in tokens:
+        match = TERM_PATTERN.match(token)
+        if not match:
+            negate = token.startswith("-") and len(token) > 1
+            predicates.append(Predicate(None, "", token[1:] if negate else token, negate))
+            continue
+        negate, field, value = match.groups()
+        op, value = OPERATOR_PATTERN.match(value).groups()
+        predicates.append(Predicate(field, op or "", value.strip(), bool(negate)))
+    return tuple(predicates)
+
+
+class QueryEngine:
+    """Evaluates parsed queries as vectorized boolean masks over the data.
+
+    Text columns are factorized once per data version; a text predicate is then
+    evaluated on the distinct values only and broadcast back to the rows through
+    the codes, so a keystroke costs O(distinct values) string work plus one take().
+    """
+
+    def __init__(self):
+        self.version = None
+        self.cache = {}
+        self.custom_fields = {}
+        self.numeric_fields = {}
+
+    def register_field(self, name, handler):
+        """Add a query field backed by handler(data, value) -> boolean mask."""
+        self.custom_fields[normalize_field_name(name)] = handler
+
+    def register_numeric_field(self, name, values, parse=float, sort_column=None):
+        """Add a query field compared with >, >=, <, <=, = and from..to against values(data, version),
+        a float array (NaN never matches). With sort_column, sorting that column uses the values too."""
+        self.numeric_fields[normalize_field_name(name)] = (values, parse, sort_column)
+
+    def resolve_field(self, data, field):
+        key = normalize_field_name(field)
+        if key in self.custom_fields or key in self.numeric_fields:
+            return key
+        if key in FIELD_ALIASES and FIELD_ALIASES[key] in data.columns:
+            return FIELD_ALIASES[key]
+        for column in data.columns:
+            if normalize_field_name(column) == key:
+                return column
+        return None
+
+    def cached(self, kind, column, version, compute):
+        if version is None:
+            return compute()
+        if version != self.version:
+            self.version = version
+            self.cache = {}
+        key = (kind, column)
+        if key not in self.cache:
+            self.cache[key] = compute()
+        return self.cache[key]
+
+    def text_index(self, data, column, version):
+        def compute():
+            codes, uniques = pd.factorize(data[column])
+            lowered = np.array([str(value).lower() for value in uniques], dtype=object)
+            return codes, lowered
+        return self.cached("text", column, version, compute)
+
+    def date_values(self, data, column, version):
+        return self.cached("date", column, version,
+                           lambda: pd.to_datetime(data[column], errors='coerce').dt.normalize().to_numpy())
+
+    def numeric_values(self, data, column, version):
+        return self.cached("number", column, version,
+                           lambda: pd.to_numeric(data[column], errors='coerce').to_numpy(dtype=float))
+
+    def text_mask(self, data, column, op, value, version):
+        if op not in ("", "="):
+            raise QueryError(f"'{op}' can only be used with date or number fields")
+        codes, lowered = self.text_index(data, column, version)
+        value = value.lower()
+        if op == "=":
+            hits = lowered == value
+        else:
+            hits = np.fromiter((value in text for text in lowered), dtype=bool, count=len(lowered))
+        # Missing values have code -1, which picks the trailing False
+        return np.append(hits, False)[codes]
+
+    def compare(self, values, op, value, parse):
+        if not value.strip():
+            # Still typing, e.g. `applied:` or `salary:>=`: no bound yet, so nothing is filtered out
+            return np.ones(len(values), dtype=bool)
+        if ".." in value:
+            low, high = value.split("..", 1)
+            mask = np.ones(len(values), dtype=bool)
+            if low:
+                mask &= values >= parse(low)
+            if high:
+                mask &= values <= parse(high)
+            return mask
+        bound = parse(value)
+        if op == ">":
+            return values > bound
+        if op == ">=":
+            return values >= bound
+        if op == "<":
+            return values < bound
+        if op == "<=":
+            return values <= bound
+        return values == bound
+
+    def predicate_mask(self, data, predicate, version):
+        column = self.resolve_field(data, predicate.field) if predicate.field is not None else None
+        if predicate.field is not None and column is None:
+            # Not a known field (e.g. a pasted URL), search for the whole token instead
+            predicate = Predicate(None, "", f"{predicate.field}:{predicate.op}{predicate.value}", predicate.negate)
+
+        if predicate.field is None:
+            mask = np.zeros(len(data), dtype=bool)
+            for column in data.columns:
+                mask |= self.text_mask(data, column, "", predicate.value, version)
+            return mask
+
+        if column in self.custom_fields:
+            return np.asarray(self.custom_fields[column](data, predicate.value), dtype=bool)
+        if column in self.numeric_fields:
+            values, parse, _ = self.numeric_fields[column]
+            def parse_bound(text):
+                try:
+                    return parse(text)
+                except ValueError:
+                    raise QueryError(f"Invalid number '{text}' for {predicate.field}")
+            return self.compare(values(data, version), predicate.op, predicate.value, parse_bound)
+        if column in DATE_COLUMNS:
+            def parse_date(text):
+                try:
+                    return np.datetime64(pd.Timestamp(text.strip()).normalize().to_datetime64())
+                except (ValueError, TypeError):
+                    raise QueryError(f"Invalid date '{text}' for {column}")
+            return self.compare(self.date_values(data, column, version), predicate.op, predicate.value, parse_date)
+        if column in NUMERIC_COLUMNS:
+            def parse_number(text):
+                try:
+                    return float(text)
+                except ValueError:
+                    raise QueryError(f"Invalid number '{text}' for {column}")
+            return self.compare(self.numeric_values(data, column, version), predicate.op, predicate.value, parse_number)
+        return self.text_mask(data, column, predicate.op, predicate.value, version)
+
+    def sort_keys(self, data, column, version=None):
+        """Typed sort keys for a column plus a mask of the missing values."""
+        for values, _, sort_column in self.numeric_fields.values():
+            if sort_column == column:
+                keys = values(data, version)
+                return keys, np.isnan(keys)
+        if column in DATE_COLUMNS:
+            values = pd.to_datetime(data[column], errors='coerce')
+            return values.to_numpy(dtype='int64'), values.isna().to_numpy()
+        values = pd.to_numeric(data[column], errors='coerce')
+        text = data[column].fillna("").astype(str).str.strip()
+        if column in NUMERIC_COLUMNS or (values.notna() | (text == "")).all():
+            return values.to_numpy(dtype=float), values.isna().to_numpy()
+        codes, _ = pd.factorize(text.str.lower(), sort=True)
+        return codes, (text == "").to_numpy()
+
+    def sort_permutation(self, data, column, ascending=True, version=None):
+        """Row positions of data ordered by column, cached per data version. Missing values go last."""
+        def compute():
+            keys, missing = self.sort_keys(data, column, version)
+            present = np.flatnonzero(~missing)
+            present_keys = keys[present]
+            if not ascending:
+                # Sort on negated ranks rather than reversing, so equal keys keep their row order
+                # like sort_values(ascending=False, kind='stable')
+                present_keys = -np.unique(present_keys, return_inverse=True)[1]
+            present = present[np.argsort(present_keys, kind='stable')]
+            return np.concatenate([present, np.flatnonzero(missing)])
+        return self.cached("sort", (column, ascending), version, compute)
+
+    def filter(self, data, query, version=None):
+        """Boolean mask of the rows matching query. Pass the data version to reuse column indexes."""
+        mask = np.ones(len(data), dtype=bool)
+        for predicate in parse_query(query.strip()):
+            predicate_mask = self.predicate_mask(data, predicate, version)
+            mask &= ~predicate_mask if predicate.negate else predicate_mask
+        return mask
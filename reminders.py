@@ -0,0 +1,120 @@
+from bisect import bisect_left, bisect_right, insort
+import pandas as pd
+
+REMINDER_COLUMNS = ["Interview Date", "Follow-up Date"]
+
+
+def parse_dates(values):
+    """pd.to_datetime(value, errors='coerce') of every value, vectorized: ISO dates and
+    Timestamps in one pass, per-value format inference only for whatever is left."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    parsed = pd.to_datetime(values, format='ISO8601', errors='coerce')
+    retry = parsed.isna() & values.notna() & (values != "")
+    if retry.any():
+        parsed[retry] = pd.to_datetime(values[retry], format='mixed', errors='coerce')
+    return parsed
+
+
+class DateIndex:
+    """Sorted index of the interview and follow-up dates, keyed by Application ID.
+
+    Entries are (date, app_id, column) in a bisect-maintained list, so "what is due
+    between two dates" costs O(log n + k). It is kept in step with the store row by
+    row (update), so adds, edits and deletes never rescan the table.
+    """
+
+    def __init__(self, columns=REMINDER_COLUMNS):
+        self.columns = columns
+        self.entries = []
+        self.by_app = {}
+        self.labels = {}
+
+    @staticmethod
+    def row_dates(row, columns):
+        dates = []
+        for col in columns:
+            value = row.get(col)
+            if value is None or value == "":
+                continue
+            date = pd.to_datetime(value, errors='coerce')
+            if pd.notna(date):
+                dates.append((date.normalize(), col))
+        return dates
+
+    def build(self, data):
+        self.entries, self.by_app, self.labels = [], {}, {}
+        if 'Application ID' not in data.columns:
+            return
+        columns = [col for col in self.columns if col in data.columns]
+        if not columns:
+            return
+        # One vectorized parse per column, then one (date, app_id, column) row per date present
+        dates = pd.DataFrame({col: parse_dates(data[col]).dt.normalize() for col in columns}, index=data.index)
+        app_ids = pd.to_numeric(data['Application ID'], errors='coerce')
+        dates = dates[app_ids.notna() & dates.notna().any(axis=1)]
+        app_ids = app_ids[dates.index].astype(int)
+        long = dates.assign(app_id=app_ids).melt(id_vars='app_id', var_name='column', value_name='date')
+        long = long.dropna(subset=['date']).sort_values(['date', 'app_id', 'column'], kind='stable')
+        self.entries = list(zip(long['date'], long['app_id'].tolist(), long['column']))
+        for date, app_id, col in self.entries:
+            self.by_app.setdefault(app_id, []).append((date, col))
+        # Labels only for the applications that have a reminder
+        labels = data.loc[dates.index, 'Company Name'].astype(str) + " - " + data.loc[dates.index, 'Job Title'].astype(str)
+        self.labels = dict(zip(app_ids.tolist(), labels))
+
+    def add_row(self, row):
+        app_id = row.get('Application ID')
+        if app_id is None or pd.isna(app_id):
+            return
+        app_id = int(app_id)
+        dates = self.row_dates(row, self.columns)
+        if not dates:
+            return
+        self.labels[app_id] = f"{row.get('Company Name', '')} - {row.get('Job Title', '')}"
+        self.by_app[app_id] = dates
+        for date, col in dates:
+            insort(self.entries, (date, app_id, col))
+
+    def remove_row(self, row):
+        app_id = row.get('Application ID')
+        if app_id is None or pd.isna(app_id):
+            return
+        app_id = int(app_id)
+        self.labels.pop(app_id, None)
+        for date, col in self.by_app.pop(app_id, []):
+            position = bisect_left(self.entries, (date, app_id, col))
+            if position < len(self.entries) and self.entries[position] == (date, app_id, col):
+                del self.entries[position]
+
+    def update(self, old_row, new_row, changed):
+        """Store listener: re-index only rows whose dates (or label) changed."""
+        if old_row is not None and new_row is not None \
+                and not changed & set(self.columns + ['Company Name', 'Job Title']):
+            return
+        if old_row is not None:
+            self.remove_row(old_row)
+        if new_row is not None:
+            self.add_row(new_row)
+
+    def between(self, start, end):
+        """[(date, app_id, column)] with start <= date <= end, in date order."""
+        low = bisect_left(self.entries, (pd.Timestamp(start).normalize(),))
+        high = bisect_right(self.entries, (pd.Timestamp(end).normalize(), float('inf')))
+        return self.entries[low:high]
+
+    def due_within(self, days, today=None):
+        """Reminders from today through the next days days."""
+        today = pd.Timestamp(today if today is not None else pd.Timestamp.now()).normalize()
+        return self.between(today, today + pd.Timedelta(days=days))
+
+    def due_by(self, today=None):
+        """Reminders dated today or earlier, overdue ones included, in date order."""
+        today = pd.Timestamp(today if today is not None else pd.Timestamp.now()).normalize()
+        return self.entries[:bisect_right(self.entries, (today, float('inf')))]
+
+    def describe(self, entry):
+        date, app_id, col = entry
+        what = "Interview" if col == "Interview Date" else "Follow up"
+        return f"{date.strftime('%Y-%m-%d')}: {what} - {self.labels.get(app_id, app_id)}"
+
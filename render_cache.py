@@ -0,0 +1,102 @@
+import os
+import pickle
+import zlib
+import hashlib
+import logging
+from collections import OrderedDict
+
+
+class RenderCache:
+    """Rendered chart images keyed by (chart id, aggregate version, width, height, dpi).
+
+    Images are kept as raw RGBA buffers in an in-memory LRU capped at max_bytes.
+    With a cache_dir they are also written to disk (zlib-compressed), so a restart
+    can paint the dashboard from the last session's images without re-rendering.
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024, cache_dir=None, max_disk_bytes=512 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def disk_path(self, key):
+        return os.path.join(self.cache_dir, hashlib.sha1(repr(key).encode()).hexdigest() + ".bin")
+
+    def get(self, key):
+        """Return (width, height, rgba bytes) or None."""
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        image = self.load_from_disk(key)
+        if image is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.remember(key, image)
+        return image
+
+    def put(self, key, width, height, rgba):
+        image = (width, height, bytes(rgba))
+        self.remember(key, image)
+        self.save_to_disk(key, image)
+        return image
+
+    def remember(self, key, image):
+        if key in self.entries:
+            self.size -= len(self.entries.pop(key)[2])
+        self.entries[key] = image
+        self.size += len(image[2])
+        # Evict least recently used images, always keeping the newest one
+        while self.size > self.max_bytes and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= len(evicted[2])
+
+    def load_from_disk(self, key):
+        if not self.cache_dir:
+            return None
+        path = self.disk_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                stored_key, width, height, compressed = pickle.load(f)
+            if stored_key != key:
+                return None
+            os.utime(path)
+            return width, height, zlib.decompress(compressed)
+        except Exception as e:
+            logging.error(f"Error reading cached chart image {path}: {str(e)}")
+            return None
+
+    def save_to_disk(self, key, image):
+        if not self.cache_dir:
+            return
+        width, height, rgba = image
+        try:
+            with open(self.disk_path(key), 'wb') as f:
+                pickle.dump((key, width, height, zlib.compress(rgba, 1)), f)
+            self.prune_disk()
+        except Exception as e:
+            logging.error(f"Error writing cached chart image: {str(e)}")
+
+    def prune_disk(self):
+        """Delete the least recently used files once the disk cache exceeds max_disk_bytes."""
+        files = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir) if name.endswith(".bin")]
+        stats = [(os.path.getmtime(path), os.path.getsize(path), path) for path in files]
+        total = sum(size for _, size, _ in stats)
+        for _, size, path in sorted(stats):
+            if total <= self.max_disk_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    def clear(self):
+        self.entries = OrderedDict()
+        self.size = 0
@@ -0,0 +1,180 @@
+import os
+import io
+import sys
+import html
+import base64
+import pickle
+import logging
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+# Headless: pyplot never opens a window. Set before pyplot is imported.
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from dashboard import DashboardCharts
+from data_store import DataStore, PYQT_COLUMNS
+from status_history import StatusHistory
+from reminders import DateIndex
+from dedup import DuplicateIndex
+from analytics import ConversionAnalytics
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+FORMATS = {".html": "html", ".htm": "html", ".pdf": "pdf", ".png": "png"}
+
+logging.basicConfig(filename='app.log', level=logging.DEBUG,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+
+
+class ReportContext(DashboardCharts):
+    """The dashboard's data and charts without its window, so the report draws exactly what
+    the Dashboard tab shows. Loading never writes to the data or history files.
+    """
+
+    def __init__(self, data_file):
+        self.store = DataStore(data_file, PYQT_COLUMNS)
+        self.store.load(write_upgrade=False)
+        self.status_history = StatusHistory(os.path.join(os.path.dirname(data_file), "status_history.pkl"))
+        self.date_index = DateIndex()
+        self.duplicate_index = DuplicateIndex()
+        self.analytics = ConversionAnalytics()
+        self.column_fingerprints = {}
+        self.rebuild_aggregates()
+
+# Set in each worker process: inherited from the parent when processes are forked, loaded otherwise
+context = None
+
+
+def init_worker(data_file):
+    global context
+    if context is None:
+        context = ReportContext(data_file)
+
+
+def render_chart(name, output_format, width, dpi):
+    """Build one dashboard chart and return it as PNG bytes, or as a pickled figure for the PDF."""
+    charts = {chart[0]: chart[1:] for chart in context.dashboard_charts()}
+    if name not in charts:
+        raise ValueError(f"Unknown chart: {name}")
+    builder, title, fixed_height, legend = charts[name]
+    try:
+        fig = builder()
+        FigureCanvasAgg(fig)
+        fig.set_dpi(dpi)
+        fig.set_size_inches(width / dpi, fixed_height / dpi)
+        if legend:
+            fig.subplots_adjust(right=0.7)  # Same room for the legend as on the dashboard
+        if output_format == "pdf":
+            return name, title, pickle.dumps(fig)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png", dpi=dpi)
+        return name, title, buffer.getvalue()
+    except Exception as e:
+        logging.error(f"Error rendering {name} for the report: {str(e)}")
+        return name, title, None
+
+
+def summary(data, days=7):
+    """Headline numbers for the top of the report."""
+    applied = pd.to_datetime(data['Application Date'], errors='coerce')
+    recent = applied >= pd.Timestamp.now().normalize() - pd.Timedelta(days=days)
+    rows = [("Applications", len(data)), (f"Applied in the last {days} days", int(recent.sum()))]
+    rows += [(f"Status: {status}", count) for status, count in data['Status'].value_counts().items()]
+    return rows
+
+
+def write_html(output, charts, rows):
+    parts = [f"<h1>Job Application Report</h1><p>Generated {datetime.now():%Y-%m-%d %H:%M}</p>", "<table>"]
+    parts += [f"<tr><td>{html.escape(label)}</td><td>{value}</td></tr>" for label, value in rows]
+    parts.append("</table>")
+    for name, title, png in charts:
+        parts.append(f"<h2>{html.escape(title)}</h2>")
+        if png is None:
+            parts.append("<p>This chart could not be rendered; see app.log.</p>")
+        else:
+            parts.append(f'<img alt="{html.escape(title)}" src="data:image/png;base64,{base64.b64encode(png).decode()}">')
+    with open(output, "w", encoding="utf-8") as f:
+        f.write('<!DOCTYPE html><html><head><meta charset="utf-8"><title>Job Application Report</title>'
+                '<style>body{font-family:sans-serif;max-width:1240px;margin:auto} img{max-width:100%}'
+                ' td{padding:2px 12px}</style></head><body>' + "\n".join(parts) + "</body></html>")
+
+
+def write_pdf(output, charts, rows):
+    with PdfPages(output) as pdf:
+        fig = plt.figure(figsize=(8.5, 11))
+        fig.text(0.1, 0.92, "Job Application Report", fontsize=20)
+        fig.text(0.1, 0.88, f"Generated {datetime.now():%Y-%m-%d %H:%M}")
+        for i, (label, value) in enumerate(rows):
+            fig.text(0.1, 0.82 - i * 0.03, f"{label}: {value}")
+        pdf.savefig(fig)
+        plt.close(fig)
+        for name, title, pickled in charts:
+            if pickled is not None:
+                fig = pickle.loads(pickled)
+                pdf.savefig(fig)
+                plt.close(fig)
+
+
+def write_png(output, charts):
+    # All charts stacked into one image, padded to the widest
+    images = [plt.imread(io.BytesIO(png), format="png") for _, _, png in charts if png is not None]
+    if not images:
+        raise RuntimeError("No chart could be rendered; see app.log")
+    width = max(image.shape[1] for image in images)
+    padded = [np.pad(image, ((0, 0), (0, width - image.shape[1]), (0, 0)), constant_values=1.0) for image in images]
+    plt.imsave(output, np.vstack(padded))
+
+
+def generate_report(output, data_file=None, workers=None, width=1200, dpi=100):
+    """Render every dashboard chart in worker processes and write them to one HTML, PDF or PNG file."""
+    output_format = FORMATS.get(os.path.splitext(output)[1].lower())
+    if output_format is None:
+        raise ValueError(f"Unsupported report format: {output} (use .html, .pdf or .png)")
+    data_file = data_file or os.path.join(APP_DIR, "job_applications.pkl")
+
+    global context
+    context = ReportContext(data_file)
+    names = [name for name, *_ in context.dashboard_charts()]
+    # Forked workers inherit the loaded data and aggregates; spawned ones load their own copy
+    method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+    workers = workers or min(len(names), os.cpu_count() or 1)
+    if workers == 1:
+        init_worker(data_file)
+        charts = [render_chart(name, output_format, width, dpi) for name in names]
+    else:
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context(method),
+                                 initializer=init_worker, initargs=(data_file,)) as pool:
+            charts = list(pool.map(render_chart, names, [output_format] * len(names),
+                                   [width] * len(names), [dpi] * len(names)))
+
+    if output_format == "html":
+        write_html(output, charts, summary(context.data))
+    elif output_format == "pdf":
+        write_pdf(output, charts, summary(context.data))
+    else:
+        write_png(output, charts)
+    logging.info(f"Report with {len(charts)} charts written to {output}")
+    return output
+
+
+if __name__ == "__main__":
+    # e.g. from cron: python report.py ~/reports/weekly.html
+    parser = argparse.ArgumentParser(description="Write the dashboard charts to an HTML, PDF or PNG report without opening a window.")
+    parser.add_argument("output", help="report file; .html, .pdf or .png")
+    parser.add_argument("--data", help="data file (default: job_applications.pkl next to this script)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per chart, up to the number of cores)")
+    parser.add_argument("--width", type=int, default=1200, help="chart width in pixels")
+    parser.add_argument("--dpi", type=int, default=100)
+    args = parser.parse_args()
+    try:
+        print(generate_report(args.output, args.data, args.workers, args.width, args.dpi))
+    except Exception as e:
+        logging.error(f"Error generating report: {str(e)}")
+        print(f"Failed to generate report: {str(e)}", file=sys.stderr)
+        sys.exit(1)
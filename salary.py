@@ -0,0 +1,95 @@
+import re
+import numpy as np
+import pandas as pd
+
+# A whole number, never a retirement plan: "401k", "401(k)", "403b" and any amount directly
+# followed by "(k)" are skipped, so "401k match" is not read as a 401,000 salary
+RETIREMENT_PLAN = r"(?:401|403|457)\s*\(?[kb]\b\)?"
+AMOUNT = rf"(?<![\d.,])(?!{RETIREMENT_PLAN})\d[\d,]*(?:\.\d+)?(?!\d|\s*\(k\))"
+# Low end, optional k, anything up to a range separator, then the optional high end:
+# "$120k - $160k per year", "$25/hr - $30/hr", "$80,000 to $95,000", "4000-5000/month"
+RANGE_PATTERN = re.compile(
+    rf"(?P<low>{AMOUNT})\s*(?P<low_k>k\b)?"
+    rf"(?:[^\d\-–—]*?\s*(?:-|–|—|\bto\b)\s*[^\d]{{0,4}}(?P<high>{AMOUNT})\s*(?P<high_k>k\b)?)?")
+
+PERIOD_PATTERNS = [
+    ("hour", r"/\s*h(?:ou)?r|\bhour|hourly|/\s*h\b"),
+    ("week", r"/\s*w(?:ee)?k|\bweek"),
+    ("month", r"/\s*mo|\bmonth"),
+    ("year", r"/\s*y(?:ea)?r|\byear|annual|\bp\.?a\b"),
+]
+PERIODS_PER_YEAR = {"hour": 2080, "week": 52, "month": 12, "year": 1}
+
+CURRENCY_PATTERN = r"(usd|cad|eur|gbp|aud|inr|c\$|a\$|\$|€|£)"
+CURRENCIES = {"usd": "USD", "$": "USD", "cad": "CAD", "c$": "CAD", "aud": "AUD", "a$": "AUD",
+              "eur": "EUR", "€": "EUR", "gbp": "GBP", "£": "GBP", "inr": "INR"}
+
+SALARY_COLUMNS = ["min", "max", "period", "currency", "annual_min", "annual_max", "annual_mid"]
+
+
+def parse_salaries(values):
+    """Parse free-text salary ranges into numbers, vectorized over a Series of strings.
+
+    Returns a frame with the stated min/max, the period ("hour", "week", "month", "year"),
+    the currency code and the annualized min/max/midpoint. Without a stated period it is
+    guessed from the amount: under 1,000 is hourly, under 20,000 monthly, otherwise yearly.
+    Amounts stay in their own currency. Unparseable text gives NaN.
+    """
+    text = values.fillna("").astype(str).str.lower()
+    parts = text.str.extract(RANGE_PATTERN)
+    low = pd.to_numeric(parts['low'].str.replace(",", "", regex=False), errors='coerce')
+    high = pd.to_numeric(parts['high'].str.replace(",", "", regex=False), errors='coerce')
+    # "120-150k": a k on the high end applies to both
+    low = low * np.where(parts['low_k'].notna() | (parts['high_k'].notna() & (low < high)), 1000, 1)
+    high = (high * np.where(parts['high_k'].notna(), 1000, 1)).fillna(low)
+
+    period = pd.Series(np.select([text.str.contains(pattern, regex=True) for _, pattern in PERIOD_PATTERNS],
+                                 [name for name, _ in PERIOD_PATTERNS], default=""), index=values.index)
+    guessed = np.select([high < 1000, high < 20000], ["hour", "month"], default="year")
+    period = period.where((period != "") | low.isna(), guessed)
+    currency = text.str.extract(CURRENCY_PATTERN)[0].map(CURRENCIES)
+
+    factor = period.map(PERIODS_PER_YEAR).astype(float)
+    result = pd.DataFrame({"min": low, "max": high, "period": period, "currency": currency,
+                           "annual_min": low * factor, "annual_max": high * factor}, index=values.index)
+    result["annual_mid"] = (result["annual_min"] + result["annual_max"]) / 2
+    return result
+
+
+def parse_amount(text):
+    """A query bound such as 100000, 100k or 120,000."""
+    text = text.strip().lower().replace(",", "").lstrip("$")
+    multiplier = 1000 if text.endswith("k") else 1
+    return float(text.rstrip("k")) * multiplier
+
+
+class SalaryIndex:
+    """Parsed salaries for a Salary Range column.
+
+    Each distinct text is parsed once (new texts in one vectorized batch), and the
+    per-row frame is kept until the data version changes, so filters and charts work
+    on NumPy arrays instead of re-parsing strings.
+    """
+
+    def __init__(self, column="Salary Range"):
+        self.column = column
+        self.parsed = pd.DataFrame(columns=SALARY_COLUMNS)
+        self.version = None
+        self.cached_frame = None
+
+    def frame(self, data, version=None):
+        if version is not None and version == self.version and self.cached_frame is not None:
+            return self.cached_frame
+        texts = data[self.column].fillna("").astype(str) if self.column in data.columns else pd.Series("", index=data.index)
+        new_texts = pd.Index(texts.unique()).difference(self.parsed.index)
+        if len(new_texts):
+            new = parse_salaries(pd.Series(new_texts, index=new_texts))
+            self.parsed = new if self.parsed.empty else pd.concat([self.parsed, new])
+        frame = self.parsed.reindex(texts.to_numpy())
+        frame.index = data.index
+        self.version, self.cached_frame = version, frame
+        return frame
+
+    def annual(self, data, version=None):
+        """Annualized midpoint per row as a float array (NaN where there is no salary)."""
+        return self.frame(data, version)["annual_mid"].to_numpy(dtype=float)
@@ -0,0 +1,97 @@
+import logging
+import pandas as pd
+
+# Version of the stored table format, kept in DataFrame.attrs so the pickle stays a plain DataFrame.
+# Bump it together with a new @migration.
+SCHEMA_VERSION = 2
+
+# Default values for columns a stored table may lack (e.g. a Tk-format file opened by the PyQt app).
+# Adding a column to a schema only needs an entry here, not a migration: missing columns are filled
+# with one scalar broadcast when the table is loaded and reach the file with the next save.
+# They are not lazy: both front-ends index self.data directly and pandas has no deferred columns,
+# so a default is a real column, but one whose rows all point at the same shared value.
+COLUMN_DEFAULTS = {
+    "Position": "",
+    "Industry": "",
+    "Term": "",
+    "Tags": "",
+    "Application ID": lambda data: range(1, len(data) + 1),
+}
+
+MIGRATIONS = {}
+
+
+def migration(version, description):
+    """Register a function data -> data that upgrades a table from version - 1 to version."""
+    def register(function):
+        MIGRATIONS[version] = (description, function)
+        return function
+    return register
+
+
+@migration(1, "Add the Index column and number rows in Index order")
+def number_index(data):
+    if 'Index' not in data.columns:
+        data.insert(0, 'Index', range(1, len(data) + 1))
+    else:
+        data = data.sort_values('Index', kind='stable').reset_index(drop=True)
+        data['Index'] = range(1, len(data) + 1)
+    return data
+
+
+@migration(2, "Store empty cells as '' instead of NaN/None")
+def blank_missing_values(data):
+    for col in data.columns:
+        if data[col].dtype == object and data[col].isna().any():
+            data[col] = data[col].where(data[col].notna(), '')
+    return data
+
+
+def schema_version(data):
+    return data.attrs.get('schema_version', 0)
+
+
+def migrate(data):
+    """Run the migrations the table has not had yet. Returns (data, descriptions of the applied migrations)."""
+    applied = []
+    for version in range(schema_version(data) + 1, SCHEMA_VERSION + 1):
+        description, function = MIGRATIONS[version]
+        data = function(data)
+        data.attrs['schema_version'] = version
+        applied.append(description)
+        logging.info(f"Applied schema migration {version}: {description}")
+    return data, applied
+
+
+def add_missing_columns(data, columns):
+    """Materialize the schema columns the table lacks from COLUMN_DEFAULTS, in schema order."""
+    for position, col in enumerate(columns):
+        if col in data.columns:
+            continue
+        default = COLUMN_DEFAULTS.get(col, "")
+        previous = [c for c in columns[:position] if c in data.columns]
+        location = data.columns.get_loc(previous[-1]) + 1 if previous else 0
+        data.insert(location, col, default(data) if callable(default) else default)
+    return data
+
+
+def parse_date_column(values):
+    """Dates as Timestamps, '' where empty, vectorized (no-op for parsed columns).
+
+    ISO dates are parsed in one pass. Anything else is retried with per-value format
+    inference, and text that is still not a date is kept as it is, so saving the table
+    never loses it.
+    """
+    present = values.where(values != '', None)
+    parsed = pd.to_datetime(present, format='%Y-%m-%d', errors='coerce')
+    retry = parsed.isna() & present.notna()
+    if retry.any():
+        parsed[retry] = pd.to_datetime(present[retry], format='mixed', errors='coerce')
+    if parsed.isna().any():
+        result = parsed.astype(object).where(parsed.notna(), '')
+        unparsed = parsed.isna() & present.notna()
+        if unparsed.any():
+            logging.warning(f"Kept {int(unparsed.sum())} values of {values.name} that are not dates as text")
+            result[unparsed] = values[unparsed]
+        return result
+    return parsed
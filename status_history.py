@@ -0,0 +1,195 @@
+import os
+import pickle
+import hashlib
+import logging
+from bisect import bisect_left, bisect_right, insort
+import pandas as pd
+from aggregates import bucket_dates
+from reminders import parse_dates
+
+FUNNEL_STAGES = ["Applied", "Interview Scheduled", "Offer Received"]
+FUNNEL_STAGE_RANKS = {stage: rank for rank, stage in enumerate(FUNNEL_STAGES)}
+EVENT_COLUMNS = ["app_id", "timestamp", "old_status", "new_status", "estimated"]
+
+
+class StatusHistory:
+    """Log of status changes per application, keyed by Application ID.
+
+    Events are (app_id, timestamp, old_status, new_status, estimated). They are
+    indexed by application (event positions in the order they happened) and by
+    timestamp (a sorted list), so per-application histories and time-range scans
+    do not have to go through the whole log. Transitions that happened before the
+    log existed are seeded with estimated=True and left out of timing statistics.
+    """
+
+    def __init__(self, history_file):
+        self.history_file = history_file
+        self.events = []
+        self.by_app = {}
+        self.by_time = []
+        self.frame_cache = None
+        # Bumped on every change to the log; with origin (the file as loaded) it identifies the log's
+        # contents, so caches keyed by fingerprint() never mistake one history for another
+        self.origin = ""
+        self.revision = 0
+        self.load()
+
+    def load(self):
+        try:
+            if os.path.exists(self.history_file):
+                with open(self.history_file, 'rb') as f:
+                    events = pickle.load(f)
+                self.add_events(events)
+                self.origin = hashlib.sha1(repr((len(events), events[-1:])).encode()).hexdigest()[:12]
+                self.revision = 0
+                logging.info(f"Status history loaded from {self.history_file} ({len(self.events)} events)")
+        except Exception as e:
+            logging.error(f"Error loading status history: {str(e)}")
+            self.events, self.by_app, self.by_time = [], {}, []
+            self.revision += 1
+
+    def fingerprint(self):
+        # The newest event is part of it too, so two sessions that start from the same file (or from
+        # none) and make the same number of changes still get different fingerprints
+        tail = repr((len(self.events), self.events[-1:])).encode()
+        return f"{self.origin}:{self.revision}:{hashlib.sha1(tail).hexdigest()[:12]}"
+
+    def save(self):
+        try:
+            self.write(self.snapshot())
+        except Exception as e:
+            logging.error(f"Error saving status history: {str(e)}")
+
+    def snapshot(self):
+        # Events are immutable tuples, so a copy of the list is a consistent snapshot
+        return list(self.events)
+
+    def write(self, events):
+        temp_file = self.history_file + ".tmp"
+        with open(temp_file, 'wb') as f:
+            pickle.dump(events, f)
+        os.replace(temp_file, self.history_file)
+
+    def add_event(self, event):
+        position = len(self.events)
+        self.events.append(event)
+        self.by_app.setdefault(event[0], []).append(position)
+        if pd.notna(event[1]):
+            if not self.by_time or self.by_time[-1][0] <= event[1]:
+                self.by_time.append((event[1], position))
+            else:
+                insort(self.by_time, (event[1], position))
+        self.frame_cache = None
+        self.revision += 1
+
+    def add_events(self, events):
+        """add_event for many events: the time index is sorted once rather than per event."""
+        start = len(self.events)
+        self.events.extend(events)
+        timed = []
+        for position, event in enumerate(events, start):
+            self.by_app.setdefault(event[0], []).append(position)
+            if event[1] is not pd.NaT:  # record() stores a missing time as the NaT singleton
+                timed.append((event[1], position))
+        # Already sorted runs (the existing index, events loaded in time order) make this close to a merge
+        self.by_time.extend(timed)
+        self.by_time.sort()
+        self.frame_cache = None
+        self.revision += 1
+
+    def record(self, app_id, timestamp, old_status, new_status, estimated=False):
+        self.add_event((int(app_id), pd.Timestamp(timestamp), old_status or None, new_status, estimated))
+
+    def record_new(self, app_id, applied_date, status, timestamp, estimated=False):
+        """Record a new application: Applied on applied_date, then its current status if different."""
+        applied_date = pd.to_datetime(applied_date, errors='coerce') if applied_date != "" else pd.NaT
+        self.record(app_id, applied_date, None, "Applied", estimated=pd.isna(applied_date))
+        if status and status != "Applied":
+            self.record(app_id, timestamp, "Applied", status, estimated=estimated)
+
+    def seed(self, data):
+        """Give every application without a history one, estimated from its current row."""
+        if 'Application ID' not in data.columns:
+            return
+        app_ids = pd.to_numeric(data['Application ID'], errors='coerce')
+        new = app_ids.notna() & ~app_ids.isin(list(self.by_app)) & ~app_ids.duplicated()
+        if not new.any():
+            return
+        rows = data.loc[new, ['Application Date', 'Status', 'Interview Date']]
+        app_ids = app_ids[new].astype(int).tolist()
+        # The same events as record_new per row, built column-wise
+        applied = parse_dates(rows['Application Date'])
+        interview = parse_dates(rows['Interview Date'])
+        status = rows['Status']
+        changed = status.notna() & (status != "") & (status != "Applied")
+        # Only the interview date gives a real time for a past transition; fall back to the application date
+        known = (status == "Interview Scheduled") & interview.notna()
+        transitions = zip(interview.where(known, applied)[changed].tolist(), status[changed].tolist(),
+                          known[changed].tolist())
+        events = []
+        for app_id, applied_at, row_changed in zip(app_ids, applied.tolist(), changed.tolist()):
+            events.append((app_id, applied_at, None, "Applied", applied_at is pd.NaT))
+            if row_changed:
+                at, new_status, row_known = next(transitions)
+                events.append((app_id, at, "Applied", new_status, not row_known))
+        self.add_events(events)
+
+    def history_of(self, app_id):
+        return [self.events[position] for position in self.by_app.get(int(app_id), [])]
+
+    def between(self, start, end):
+        """Events with start <= timestamp <= end, in time order."""
+        low = bisect_left(self.by_time, (pd.Timestamp(start), -1))
+        high = bisect_right(self.by_time, (pd.Timestamp(end), len(self.events)))
+        return [self.events[position] for _, position in self.by_time[low:high]]
+
+    def frame(self, app_ids=None):
+        if self.frame_cache is None:
+            self.frame_cache = pd.DataFrame(self.events, columns=EVENT_COLUMNS)
+            self.frame_cache['timestamp'] = pd.to_datetime(self.frame_cache['timestamp'])
+        if app_ids is None:
+            return self.frame_cache
+        return self.frame_cache[self.frame_cache['app_id'].isin(app_ids)]
+
+    def status_counts_over_time(self, granularity, app_ids=None):
+        """Number of applications in each status at the end of every bucket."""
+        events = self.frame(app_ids)
+        events = events[events['timestamp'].notna()]
+        if events.empty:
+            return pd.DataFrame()
+        buckets = bucket_dates(events['timestamp'].dt.normalize(), granularity)
+        entered = pd.DataFrame({'bucket': buckets, 'status': events['new_status'], 'delta': 1})
+        left = events['old_status'].notna()
+        exited = pd.DataFrame({'bucket': buckets[left], 'status': events['old_status'][left], 'delta': -1})
+        deltas = pd.concat([entered, exited]).groupby(['bucket', 'status'])['delta'].sum().unstack(fill_value=0)
+        return deltas.sort_index().cumsum().sort_index(axis=1)
+
+    def status_at(self, timestamp, app_ids=None):
+        """Status counts at a point in time."""
+        counts = self.status_counts_over_time("D", app_ids)
+        counts = counts.loc[:pd.Timestamp(timestamp)]
+        return counts.iloc[-1] if len(counts) else pd.Series(dtype='int64')
+
+    def stages_reached(self, app_ids=None):
+        """Index in FUNNEL_STAGES of the furthest stage each application ever reached, by app_id."""
+        events = self.frame(app_ids)
+        stage_rank = events['new_status'].map(FUNNEL_STAGE_RANKS).fillna(0)
+        return stage_rank.groupby(events['app_id']).max().astype(int)
+
+    def stage_reached(self, app_id):
+        """stages_reached for one application, from its own events only."""
+        ranks = [FUNNEL_STAGE_RANKS.get(self.events[position][3], 0) for position in self.by_app.get(int(app_id), [])]
+        return max(ranks, default=0)
+
+    def funnel(self, app_ids=None):
+        """Applications that ever reached each stage of FUNNEL_STAGES."""
+        reached = self.stages_reached(app_ids)
+        return pd.Series([int((reached >= rank).sum()) for rank in range(len(FUNNEL_STAGES))], index=FUNNEL_STAGES)
+
+    def time_to_response(self, app_ids=None):
+        """Days from applying to the first recorded status change, per application."""
+        events = self.frame(app_ids)
+        applied = events[events['old_status'].isna() & ~events['estimated']].groupby('app_id')['timestamp'].first()
+        responses = events[(events['old_status'] == "Applied") & ~events['estimated']].groupby('app_id')['timestamp'].first()
+        days = (responses - applied.reindex(responses.index)).dt.days
+        return days[days.notna() & (days >= 0)].astype(int)
@@ -0,0 +1,118 @@
+import sys
+import time
+import lzma
+import pickle
+import zlib
+import pandas as pd
+
+# zstandard and lz4 are optional; zlib and lzma from the standard library are always available
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None
+
+# Compressed files start with MAGIC and the codec name, so loading detects the format by itself.
+# Plain pickles (the original format) start with b'\x80' and are read as before.
+MAGIC = b"JATS1"
+
+CODECS = {
+    "dictionary": (lambda blob: blob, lambda blob: blob),  # Dictionary-encoded strings, not compressed
+    "zlib": (lambda blob: zlib.compress(blob, 6), zlib.decompress),
+    "lzma": (lambda blob: lzma.compress(blob, preset=6), lzma.decompress),
+}
+if zstandard is not None:
+    CODECS["zstd"] = (lambda blob: zstandard.ZstdCompressor(level=3).compress(blob),
+                      lambda blob: zstandard.ZstdDecompressor().decompress(blob))
+if lz4 is not None:
+    CODECS["lz4"] = (lz4.frame.compress, lz4.frame.decompress)
+
+FORMATS = ["pickle"] + list(CODECS)
+
+
+def encode_strings(data):
+    """Store repeated string columns (company, status, URLs, ...) as categoricals: each distinct
+    string is pickled once and the rows hold small integer codes."""
+    data = data.copy()
+    for col in data.columns:
+        values = data[col]
+        if values.dtype == object and pd.api.types.infer_dtype(values, skipna=True) == "string" \
+                and values.nunique() <= len(values) // 2:
+            data[col] = values.astype("category")
+    return data
+
+
+def decode_strings(data):
+    for col in data.columns:
+        if isinstance(data[col].dtype, pd.CategoricalDtype):
+            data[col] = data[col].astype(object)
+    return data
+
+
+def dumps(data, storage_format="pickle"):
+    if storage_format == "pickle":
+        return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    if storage_format not in CODECS:
+        raise ValueError(f"Unknown or unavailable storage format: {storage_format}")
+    attrs = dict(data.attrs)
+    encoded = encode_strings(data)
+    encoded.attrs = attrs
+    compress, _ = CODECS[storage_format]
+    name = storage_format.encode()
+    return MAGIC + bytes([len(name)]) + name + compress(pickle.dumps(encoded, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def loads(blob):
+    if not blob.startswith(MAGIC):
+        return pickle.loads(blob)
+    length = blob[len(MAGIC)]
+    name = blob[len(MAGIC) + 1:len(MAGIC) + 1 + length].decode()
+    if name not in CODECS:
+        raise ValueError(f"The data file uses the {name} format, which needs a package that is not installed")
+    _, decompress = CODECS[name]
+    data = pickle.loads(decompress(blob[len(MAGIC) + 1 + length:]))
+    attrs = dict(data.attrs)
+    data = decode_strings(data)
+    data.attrs = attrs
+    return data
+
+
+def read_file(path):
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def write_file(path, data, storage_format="pickle"):
+    blob = dumps(data, storage_format)
+    with open(path, 'wb') as f:
+        f.write(blob)
+
+
+def benchmark(data, repeat=3):
+    """Size and save/load time of data in every available format."""
+    results = []
+    for storage_format in FORMATS:
+        save_times, load_times = [], []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            blob = dumps(data, storage_format)
+            save_times.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            loads(blob)
+            load_times.append(time.perf_counter() - start)
+        results.append({"format": storage_format, "size (KB)": round(len(blob) / 1024, 1),
+                        "save (ms)": round(min(save_times) * 1000, 1), "load (ms)": round(min(load_times) * 1000, 1)})
+    return pd.DataFrame(results).set_index("format")
+
+
+if __name__ == "__main__":
+    # python storage_format.py [data file] [times to repeat its rows]
+    path = sys.argv[1] if len(sys.argv) > 1 else "job_applications.pkl"
+    copies = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    table = read_file(path)
+    table = pd.concat([table] * copies, ignore_index=True)
+    print(f"{len(table)} rows")
+    print(benchmark(table).to_string())
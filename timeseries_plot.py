@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+from PyQt6.QtCore import QSize
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
+
+# pyqtgraph is optional; without it the dashboard keeps the matplotlib time-series charts
+try:
+    import pyqtgraph as pg
+except ImportError:
+    pg = None
+
+
+def lttb(x, y, threshold):
+    """Largest-Triangle-Three-Buckets downsampling. Returns the indices of the points to keep.
+
+    The first and last points are always kept; from each of the threshold - 2 buckets
+    in between, the point forming the largest triangle with the previously kept point
+    and the average of the next bucket is kept, which preserves peaks and the overall shape.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    kept = np.empty(threshold, dtype=int)
+    kept[0], kept[-1] = 0, n - 1
+    previous = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = end, edges[i + 2] if i + 2 < len(edges) else n
+        next_x, next_y = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+        areas = np.abs((x[previous] - next_x) * (y[start:end] - y[previous])
+                       - (x[previous] - x[start:end]) * (next_y - y[previous]))
+        previous = start + int(np.argmax(areas))
+        kept[i + 1] = previous
+    return kept
+
+
+def min_max_decimate(y, bins):
+    """Indices of the minimum and maximum of y in each of bins equal slices, plus both ends."""
+    n = len(y)
+    if 2 * bins >= n:
+        return np.arange(n)
+    bin_of = (np.arange(n) * bins) // n
+    order = np.lexsort((y, bin_of))
+    starts = np.searchsorted(bin_of[order], np.arange(bins))
+    ends = np.append(starts[1:], n) - 1
+    return np.unique(np.concatenate([order[starts], order[ends], [0, n - 1]]))
+
+
+class TimeSeriesPlotWidget(QWidget):
+    """Interactive pyqtgraph chart for the dashboard's time series, with the same
+    set_chart() interface as ScalableGraphWidget.
+
+    The full-resolution data is kept, and only the points in the visible x range are
+    plotted, decimated to about one point per pixel (LTTB or min/max), so zooming and
+    panning stay smooth over years of daily data. Updates replace curve data only.
+    """
+
+    def __init__(self, title, source, fixed_height=400, stacked=False, decimation="lttb"):
+        super().__init__()
+        self.title = title
+        self.source = source
+        self.fixed_height = fixed_height
+        self.stacked = stacked
+        self.decimation = decimation
+        self.version = None
+        self.x = np.array([])
+        self.layers = []
+        self.curves = []
+        self.fills = []
+        self.baseline = None
+
+        self.layout = QVBoxLayout(self)
+        self.layout.addWidget(QLabel(title))
+        self.plot = pg.PlotWidget(axisItems={'bottom': pg.DateAxisItem()})
+        self.plot.setBackground('w')
+        self.plot.setFixedHeight(self.fixed_height)
+        self.plot.showGrid(x=True, y=True, alpha=0.2)
+        self.plot.setLabel('left', 'Number of Applications')
+        self.plot.addLegend()
+        self.plot.getViewBox().sigXRangeChanged.connect(self.update_visible)
+        self.layout.addWidget(self.plot)
+
+    def set_chart(self, builder, version, series_source=None):
+        # Nothing to do when the chart's data has not changed
+        if version == self.version:
+            return False
+        self.version = version
+        self.set_frame(self.source())
+        return True
+
+    def set_frame(self, frame):
+        """frame: DataFrame indexed by date with one column per series."""
+        if isinstance(frame, pd.Series):
+            frame = frame.to_frame()
+        self.x = pd.DatetimeIndex(frame.index).asi8 / 1e9 if len(frame) else np.array([])
+        values = frame.to_numpy(dtype=float) if len(frame) else np.empty((0, len(frame.columns)))
+        # Stacked series are drawn as cumulative tops with the area below each filled
+        self.layers = list(np.cumsum(values, axis=1).T if self.stacked else values.T)
+
+        if [curve.name() for curve in self.curves] != [str(col) for col in frame.columns]:
+            self.rebuild_items(frame.columns)
+        self.update_visible()
+
+    def rebuild_items(self, columns):
+        for item in self.curves + self.fills + ([self.baseline] if self.baseline is not None else []):
+            self.plot.removeItem(item)
+        self.plot.getPlotItem().legend.clear()
+        self.curves, self.fills = [], []
+        self.baseline = self.plot.plot(pen=pg.mkPen((0, 0, 0, 0))) if self.stacked else None
+        for i, col in enumerate(columns):
+            color = pg.intColor(i, hues=max(len(columns), 1)) if self.stacked else pg.mkColor('#1f77b4')
+            curve = self.plot.plot(pen=pg.mkPen(color, width=1.5), name=str(col))
+            self.curves.append(curve)
+            if self.stacked:
+                below = self.curves[i - 1] if i else self.baseline
+                fill_color = pg.mkColor(color)
+                fill_color.setAlpha(140)
+                fill = pg.FillBetweenItem(below, curve, brush=fill_color)
+                self.plot.addItem(fill, ignoreBounds=True)  # The curves already define the range
+                self.fills.append(fill)
+
+    def visible_indices(self):
+        if not len(self.x):
+            return np.array([], dtype=int)
+        view_box = self.plot.getViewBox()
+        if view_box.state['autoRange'][0]:
+            # Not zoomed in: the view fits all the data
+            indices = np.arange(len(self.x))
+        else:
+            low, high = view_box.viewRange()[0]
+            start = max(np.searchsorted(self.x, low) - 1, 0)
+            end = min(np.searchsorted(self.x, high) + 1, len(self.x))
+            indices = np.arange(start, end)
+        width = max(int(self.plot.width()), 100)
+        if len(indices) <= 2 * width:
+            return indices
+        # All layers share the same x, so pick the points from the total and reuse them
+        total = self.layers[-1][indices] if self.stacked else np.sum(self.layers, axis=0)[indices]
+        if self.decimation == "minmax":
+            return indices[min_max_decimate(total, width)]
+        return indices[lttb(self.x[indices], total, width)]
+
+    def update_visible(self, *args):
+        indices = self.visible_indices()
+        x = self.x[indices]
+        for curve, layer in zip(self.curves, self.layers):
+            curve.setData(x, layer[indices])
+        if self.baseline is not None:
+            # The bottom fill is bounded by a zero line
+            self.baseline.setData(x, np.zeros(len(x)))
+
+    def sizeHint(self):
+        return QSize(500, self.fixed_height + 50)
@@ -0,0 +1,166 @@
+from collections import deque, namedtuple
+import numpy as np
+import pandas as pd
+
+# A recorded change, stored as row-level diffs rather than DataFrame copies:
+#   deleted  - [(position before the change, full row dict)] for rows the change removed
+#   inserted - [(position after the change, full row dict)] for rows the change added
+#   updated  - [(position after the change, {col: old value}, {col: new value})] for edited cells only
+# Index is derived from row position and is renumbered after every apply, so it is never stored.
+Change = namedtuple("Change", "label deleted inserted updated")
+
+
+def change_size(change):
+    """Number of cells a change keeps in memory, used for the eviction budget."""
+    return (sum(len(row) for _, row in change.deleted) + sum(len(row) for _, row in change.inserted)
+            + sum(len(before) for _, before, _ in change.updated))
+
+
+def strip_index(row):
+    return {col: value for col, value in row.items() if col != "Index"}
+
+
+def row_insert(label, position, row):
+    return Change(label, [], [(position, strip_index(row))], [])
+
+
+def row_delete(label, rows):
+    """rows is [(position, row dict)] with positions in the frame before deletion."""
+    return Change(label, [(position, strip_index(row)) for position, row in rows], [], [])
+
+
+def row_update(label, position, old_row, new_row):
+    changed = [col for col in new_row if col != "Index" and not same_value(old_row.get(col), new_row[col])]
+    return Change(label, [], [], [(position, {col: old_row.get(col) for col in changed},
+                                   {col: new_row[col] for col in changed})] if changed else [])
+
+
+def rows_update(label, rows):
+    """rows is [(position, old row dict, new row dict)]; one change covering all of them."""
+    updated = []
+    for position, old_row, new_row in rows:
+        updated.extend(row_update(label, position, old_row, new_row).updated)
+    return Change(label, [], [], updated)
+
+
+def same_value(a, b):
+    if a is b:
+        return True
+    try:
+        if pd.isna(a) and pd.isna(b):
+            return True
+    except (TypeError, ValueError):
+        pass
+    return str(a) == str(b)
+
+
+def diff_frames(label, before, after):
+    """Diff two frames with the same columns by position, keeping only rows whose cells changed.
+
+    Undoing a bulk import therefore costs O(changed rows) instead of restoring a full copy.
+    """
+    columns = [col for col in after.columns if col != "Index"]
+    common = min(len(before), len(after))
+    old_values = before[columns].iloc[:common].astype(str).to_numpy()
+    new_values = after[columns].iloc[:common].astype(str).to_numpy()
+    changed_cells = old_values != new_values
+    updated = []
+    for position in np.flatnonzero(changed_cells.any(axis=1)):
+        changed = [columns[i] for i in np.flatnonzero(changed_cells[position])]
+        updated.append((int(position),
+                        {col: before[col].iat[position] for col in changed},
+                        {col: after[col].iat[position] for col in changed}))
+    deleted = [(position, strip_index(before.iloc[position].to_dict())) for position in range(common, len(before))]
+    inserted = [(position, strip_index(after.iloc[position].to_dict())) for position in range(common, len(after))]
+    return Change(label, deleted, inserted, updated)
+
+
+def remove_positions(data, positions):
+    if not positions:
+        return data
+    return data.drop(data.index[sorted(positions)]).reset_index(drop=True)
+
+
+def insert_positions(data, rows):
+    """Insert [(final position, row dict)] so each row ends up at its position."""
+    if not rows:
+        return data
+    rows = sorted(rows, key=lambda item: item[0])
+    total = len(data) + len(rows)
+    inserted_positions = np.array([position for position, _ in rows])
+    existing_positions = np.setdiff1d(np.arange(total), inserted_positions)
+    new_rows = pd.DataFrame([row for _, row in rows], columns=data.columns)
+    combined = pd.concat([data, new_rows], ignore_index=True) if len(data) else new_rows
+    order = np.empty(total, dtype=int)
+    order[existing_positions] = np.arange(len(data))
+    order[inserted_positions] = len(data) + np.arange(len(rows))
+    return combined.iloc[order].reset_index(drop=True)
+
+
+def set_cells(data, updates):
+    for position, values in updates:
+        for col, value in values.items():
+            if col in data.columns:
+                data.iat[position, data.columns.get_loc(col)] = value
+
+
+def apply_change(data, change, reverse=False):
+    """Return data with change re-applied (redo) or reverted (undo). Edited cells are set in place."""
+    if reverse:
+        set_cells(data, [(position, before) for position, before, _ in change.updated])
+        data = remove_positions(data, [position for position, _ in change.inserted])
+        data = insert_positions(data, change.deleted)
+    else:
+        data = remove_positions(data, [position for position, _ in change.deleted])
+        data = insert_positions(data, change.inserted)
+        set_cells(data, [(position, after) for position, _, after in change.updated])
+    if "Index" in data.columns:
+        data["Index"] = range(1, len(data) + 1)
+    return data
+
+
+class UndoStack:
+    """Bounded undo/redo history of Changes.
+
+    Memory is capped both by number of changes and by the total number of stored
+    cells; the oldest changes are evicted first. The newest change is always kept,
+    even if on its own it exceeds the cell budget.
+    """
+
+    def __init__(self, max_changes=100, max_cells=500000):
+        self.max_changes = max_changes
+        self.max_cells = max_cells
+        self.undo_changes = deque()
+        self.redo_changes = []
+        self.cells = 0
+
+    def record(self, change):
+        if not (change.deleted or change.inserted or change.updated):
+            return
+        self.undo_changes.append(change)
+        self.cells += change_size(change)
+        self.redo_changes = []
+        while len(self.undo_changes) > 1 and (len(self.undo_changes) > self.max_changes or self.cells > self.max_cells):
+            self.cells -= change_size(self.undo_changes.popleft())
+
+    def can_undo(self):
+        return bool(self.undo_changes)
+
+    def can_redo(self):
+        return bool(self.redo_changes)
+
+    def undo(self):
+        if not self.undo_changes:
+            return None
+        change = self.undo_changes.pop()
+        self.cells -= change_size(change)
+        self.redo_changes.append(change)
+        return change
+
+    def redo(self):
+        if not self.redo_changes:
+            return None
+        change = self.redo_changes.pop()
+        self.undo_changes.append(change)
+        self.cells += change_size(change)
+        return change